@@ -1,65 +1,149 @@
-from typing import Tuple
+from typing import Dict, Optional, Tuple, Union
+
+from alphabet import Alphabet, AlphabetTable
+from backends import get_backend
+from instrumentation import instrumented, timed
+from keycache import prepared_key
+from translation import Buffer, TranslationTable, affine_table, translate_into
+
+class AffineKeyError(ValueError):
+    """
+    Raised when 'a' has no inverse modulo the alphabet size, so the key
+    cannot decrypt.
+    """
 
 def egcd(a: int, b: int) -> Tuple[int, int, int]:
     """
-    Extended Euclidean Algorithm to find modular inverse.
+    Extended Euclidean Algorithm to find modular inverse, iteratively.
     Returns gcd, x, y such that ax + by = gcd(a, b).
     """
-    if a == 0:
-        return (b, 0, 1)
-    else:
-        g, y, x = egcd(b % a, a)
-        return (g, x - (b // a) * y, y)
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    while b:
+        q = a // b
+        a, b = b, a - q * b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
 
-def modinv(a: int, m: int) -> int:
+# a -> a^-1 mod 26 for the twelve invertible values of a
+MOD26_INVERSES: Dict[int, int] = {
+    a: x % 26 for a in range(26) for g, x, _ in [egcd(a, 26)] if g == 1
+}
+
+def modinv(a: int, m: int = 26) -> int:
     """
-    Modular multiplicative inverse of a modulo m.
+    Modular multiplicative inverse of a modulo m. Modulus 26 is a table
+    lookup; other moduli (larger alphabets) use the iterative egcd.
+    Raises AffineKeyError if a and m are not coprime.
     """
-    g, x, y = egcd(a, m)
-    if g != 1:
-        raise Exception('Modular inverse does not exist')
-    return x % m
+    if m == 26:
+        inverse = MOD26_INVERSES.get(a % 26)
+        if inverse is not None:
+            return inverse
+    elif m > 1:
+        g, x, _ = egcd(a % m, m)
+        if g == 1:
+            return x % m
+    raise AffineKeyError(f"'a' ({a}) has no inverse modulo {m}; it must be coprime with {m}.")
+
+Table = Union[TranslationTable, AlphabetTable]
 
-def affine_encrypt(text: str, key_a: int, key_b: int) -> str:
+class AffineKey:
     """
-    Encrypts plaintext using the Affine cipher.
-    Ciphertext = (a * P + b) mod 26
-    """
-    result = ""
-    for char in text.upper():
-        if char.isalpha():
-            # Convert char to a number (A=0, B=1, ...)
-            p = ord(char) - ord('A')
-            # Apply encryption formula
-            c = (key_a * p + key_b) % 26
-            # Convert number back to char
-            result += chr(c + ord('A'))
+    A validated Affine key: 'a' is checked for an inverse once, and the
+    encryption and decryption tables are built once. Use affine_key() to
+    share instances through the key cache.
+
+    With an alphabet the key works modulo its size instead of 26.
+    """
+
+    __slots__ = ("a", "b", "inverse", "alphabet", "encrypt_table", "decrypt_table")
+
+    def __init__(self, key_a: int, key_b: int, alphabet: Optional[Alphabet] = None) -> None:
+        modulus = 26 if alphabet is None else alphabet.size
+        self.inverse = modinv(key_a, modulus)
+        self.a = key_a % modulus
+        self.b = key_b % modulus
+        self.alphabet = alphabet
+        # a^-1 * (C - b) is itself an affine map: a^-1 * C + (-a^-1 * b)
+        self.encrypt_table: Table
+        self.decrypt_table: Table
+        if alphabet is None:
+            self.encrypt_table = affine_table(self.a, self.b)
+            self.decrypt_table = affine_table(self.inverse, -self.inverse * self.b)
         else:
-            result += char
-    return result
+            self.encrypt_table = alphabet.table(self.a, self.b, fold_case=True)
+            self.decrypt_table = alphabet.table(self.inverse, -self.inverse * self.b,
+                                                fold_case=True)
+
+    def __repr__(self) -> str:
+        return f"AffineKey(a={self.a}, b={self.b}, alphabet={self.alphabet})"
+
+    def _translate(self, table: Table, text: str) -> str:
+        if isinstance(table, TranslationTable):
+            return get_backend().translate(table, text.upper())
+        return table.translate(text)
+
+    @instrumented("affine", text_arg=1)
+    def encrypt(self, text: str) -> str:
+        return self._translate(self.encrypt_table, text)
+
+    @instrumented("affine", text_arg=1)
+    def decrypt(self, ciphertext: str) -> str:
+        return self._translate(self.decrypt_table, ciphertext)
 
-def affine_decrypt(ciphertext: str, key_a: int, key_b: int) -> str:
+@timed("key_setup", "affine")
+def affine_key(key_a: int, key_b: int, alphabet: Optional[Alphabet] = None) -> AffineKey:
+    """
+    Returns the cached, validated key for (a, b). Raises AffineKeyError if
+    'a' is not coprime with 26, or with the alphabet's size.
+    """
+    modulus = 26 if alphabet is None else alphabet.size
+    return prepared_key("affine-key", (key_a % modulus, key_b % modulus, alphabet),
+                        lambda: AffineKey(key_a, key_b, alphabet))
+
+@instrumented("affine")
+def affine_encrypt(
+    text: str, key_a: int, key_b: int, alphabet: Optional[Alphabet] = None
+) -> str:
+    """
+    Encrypts plaintext using the Affine cipher.
+    Ciphertext = (a * P + b) mod 26, or mod the alphabet's size
+    """
+    # The whole message goes through one cached per-key translation table
+    if alphabet is not None:
+        modulus = alphabet.size
+        return alphabet.table(key_a % modulus, key_b % modulus, fold_case=True).translate(text)
+    return get_backend().translate(affine_table(key_a, key_b), text.upper())
+
+@instrumented("affine")
+def affine_decrypt(
+    ciphertext: str, key_a: int, key_b: int, alphabet: Optional[Alphabet] = None
+) -> str:
     """
     Decrypts ciphertext using the Affine cipher.
-    Plaintext = a^-1 * (C - b) mod 26
-    """
-    result = ""
-    try:
-        mod_inv_a = modinv(key_a, 26)
-    except Exception as e:
-        return f"Error: {e}. 'a' ({key_a}) must be coprime with 26."
-
-    for char in ciphertext.upper():
-        if char.isalpha():
-            # Convert char to a number (A=0, B=1, ...)
-            c = ord(char) - ord('A')
-            # Apply decryption formula
-            p = (mod_inv_a * (c - key_b)) % 26
-            # Convert number back to char
-            result += chr(p + ord('A'))
-        else:
-            result += char
-    return result
+    Plaintext = a^-1 * (C - b) mod 26, or mod the alphabet's size
+    Raises AffineKeyError if 'a' is not coprime with the modulus.
+    """
+    return affine_key(key_a, key_b, alphabet).decrypt(ciphertext)
+
+@instrumented("affine")
+def affine_encrypt_into(src: Buffer, dst: Buffer, key_a: int, key_b: int) -> int:
+    """
+    Encrypts ASCII bytes from src into dst, which may be src itself, and
+    returns the number of bytes written. Letters come out upper-case, as
+    with affine_encrypt.
+    """
+    return translate_into(affine_table(key_a, key_b).byte_table, src, dst)
+
+@instrumented("affine")
+def affine_decrypt_into(src: Buffer, dst: Buffer, key_a: int, key_b: int) -> int:
+    """
+    Decrypts ASCII bytes from src into dst, which may be src itself.
+    Raises AffineKeyError if 'a' has no inverse mod 26.
+    """
+    key = affine_key(key_a, key_b)
+    return translate_into(affine_table(key.inverse, -key.inverse * key.b).byte_table, src, dst)
 
 def main() -> None:
     while True:
@@ -79,6 +163,8 @@ def main() -> None:
                     decrypted_message = affine_decrypt(message, a, b)
                     print(f"\nDecrypted Message: {decrypted_message}")
 
+            except AffineKeyError as e:
+                print(f"Error: {e}")
             except ValueError:
                 print("Invalid key. Please enter integers for 'a' and 'b'.")
             except Exception as e:
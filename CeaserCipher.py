@@ -1,40 +1,59 @@
-def caesar_encrypt(text: str, shift: int) -> str:
+from typing import Optional
+
+from alphabet import Alphabet
+from backends import get_backend
+from instrumentation import instrumented
+from translation import Buffer, caesar_table, translate_into
+
+
+@instrumented("caesar")
+def caesar_encrypt(text: str, shift: int, alphabet: Optional[Alphabet] = None) -> str:
     """
     Encrypts a given plaintext using the Caesar cipher.
 
     Args:
         text (str): The plaintext message to encrypt.
         shift (int): The number of positions to shift letters.
+        alphabet (Alphabet, optional): Symbols to shift instead of A-Z.
 
     Returns:
         str: The encrypted ciphertext.
     """
-    result = ""
-    for char in text:
-        if char.isalpha():
-            # Determine the case of the character
-            start = ord('a') if char.islower() else ord('A')
-            # Calculate the shifted position
-            shifted_char = chr((ord(char) - start + shift) % 26 + start)
-            result += shifted_char
-        else:
-            # Non-alphabetic characters are not changed
-            result += char
-    return result
+    # The whole message goes through one cached per-shift translation table
+    if alphabet is not None:
+        return alphabet.table(1, shift).translate(text)
+    return get_backend().translate(caesar_table(shift), text)
 
-def caesar_decrypt(text: str, shift: int) -> str:
+@instrumented("caesar")
+def caesar_decrypt(text: str, shift: int, alphabet: Optional[Alphabet] = None) -> str:
     """
     Decrypts a given ciphertext using the Caesar cipher.
 
     Args:
         text (str): The ciphertext message to decrypt.
         shift (int): The number of positions the letters were shifted by.
+        alphabet (Alphabet, optional): Symbols to shift instead of A-Z.
 
     Returns:
         str: The decrypted plaintext.
     """
     # Decryption is just encryption with a negative shift
-    return caesar_encrypt(text, -shift)
+    return caesar_encrypt(text, -shift, alphabet)
+
+@instrumented("caesar")
+def caesar_encrypt_into(src: Buffer, dst: Buffer, shift: int) -> int:
+    """
+    Encrypts ASCII bytes from src into dst, which may be src itself, and
+    returns the number of bytes written. Non-letter bytes are copied as is.
+    """
+    return translate_into(caesar_table(shift).byte_table, src, dst)
+
+@instrumented("caesar")
+def caesar_decrypt_into(src: Buffer, dst: Buffer, shift: int) -> int:
+    """
+    Decrypts ASCII bytes from src into dst, which may be src itself.
+    """
+    return caesar_encrypt_into(src, dst, -shift)
 
 def main() -> None:
     while True:
@@ -1,9 +1,21 @@
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
-def generate_key_matrix(key: str) -> List[List[str]]:
+from alphabet import Alphabet
+from instrumentation import instrumented, timed
+from keycache import prepared_key
+
+@timed("key_setup", "playfair")
+def generate_key_matrix(key: str, alphabet: Optional[Alphabet] = None) -> List[List[str]]:
     """
-    Generates the 5x5 key matrix for the Playfair cipher.
+    Generates the 5x5 key matrix for the Playfair cipher, or a square filled
+    from the alphabet's symbols (6x6 for A-Z plus digits).
     """
+    if alphabet is not None:
+        side = alphabet.square_side
+        symbols = list(dict.fromkeys(
+            char for char in normalize_text(key, alphabet) + alphabet.symbols if char in alphabet
+        ))
+        return [symbols[i:i + side] for i in range(0, side * side, side)]
     key = key.upper().replace(" ", "").replace("J", "I")
     matrix = []
     # Add unique characters from the key to the matrix
@@ -12,8 +24,7 @@ def generate_key_matrix(key: str) -> List[List[str]]:
             matrix.append(char)
 
     # Add the remaining alphabet characters
-    alphabet = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
-    for char in alphabet:
+    for char in "ABCDEFGHIKLMNOPQRSTUVWXYZ":
         if char not in matrix:
             matrix.append(char)
 
@@ -31,54 +42,152 @@ def find_position(key_matrix: List[List[str]], char: str) -> Tuple[int, int]:
                 return r, c
     return -1, -1 # Should not happen with valid input
 
-def prepare_plaintext(plaintext: str) -> List[str]:
+@timed("prepare", "playfair")
+def normalize_text(text: str, alphabet: Optional[Alphabet] = None) -> str:
     """
-    Prepares the plaintext for Playfair encryption.
-    - Converts to uppercase
-    - Replaces 'J' with 'I'
-    - Splits into digraphs, handling double letters with 'X'
-    - Pads with 'X' if the length is odd
+    Upper-cases the text, drops spaces and folds 'J' into 'I'. With an
+    alphabet, other-case forms are mapped to its symbols instead and
+    nothing is folded.
     """
-    plaintext = plaintext.upper().replace(" ", "").replace("J", "I")
-    prepared_text = ""
+    if alphabet is not None:
+        return alphabet.normalize(text).replace(" ", "")
+    return text.upper().replace(" ", "").replace("J", "I")
+
+@timed("prepare", "playfair")
+def split_digraphs(text: str, final: bool = True) -> Tuple[List[str], str]:
+    """
+    Splits normalized text into digraphs, handling double letters with 'X'.
+    With final=False a trailing unpaired letter is returned as the leftover
+    instead of being padded, so it can be prepended to the next chunk.
+    """
+    pairs: List[str] = []
     i = 0
-    while i < len(plaintext):
-        char1 = plaintext[i]
-        prepared_text += char1
-        if i + 1 < len(plaintext):
-            char2 = plaintext[i+1]
+    while i < len(text):
+        char1 = text[i]
+        if i + 1 < len(text):
+            char2 = text[i+1]
             if char1 == char2:
-                prepared_text += 'X'
+                pairs.append(char1 + 'X')
                 i += 1
             else:
-                prepared_text += char2
+                pairs.append(char1 + char2)
                 i += 2
-        else:
-            prepared_text += 'X'
+        elif final:
+            pairs.append(char1 + 'X')
             i += 1
-    return [prepared_text[i:i + 2] for i in range(0, len(prepared_text), 2)]
+        else:
+            return pairs, char1
+    return pairs, ""
 
-def playfair_crypt(text_pairs: List[str], key_matrix: List[List[str]], mode: int) -> str:
+@timed("prepare", "playfair")
+def prepare_plaintext(plaintext: str, alphabet: Optional[Alphabet] = None) -> List[str]:
+    """
+    Prepares the plaintext for Playfair encryption.
+    - Converts to uppercase
+    - Replaces 'J' with 'I'
+    - Splits into digraphs, handling double letters with 'X'
+    - Pads with 'X' if the length is odd
+    """
+    pairs, _ = split_digraphs(normalize_text(plaintext, alphabet))
+    return pairs
+
+@timed("prepare", "playfair")
+def prepare_ciphertext(ciphertext: str, alphabet: Optional[Alphabet] = None) -> List[str]:
+    """
+    Normalizes ciphertext and splits it into digraphs, padding an odd
+    length with 'X'.
+    """
+    norm = normalize_text(ciphertext, alphabet)
+    if len(norm) % 2 == 1:
+        norm += 'X'
+    return [norm[i:i + 2] for i in range(0, len(norm), 2)]
+
+def crypt_pair(key_matrix: List[List[str]], pair: str, mode: int) -> str:
+    """
+    Encrypts (mode = 1) or decrypts (mode = -1) a single digraph by locating
+    both letters in the key matrix, which may be any size.
+    """
+    char1, char2 = pair[0], pair[1]
+    r1, c1 = find_position(key_matrix, char1)
+    r2, c2 = find_position(key_matrix, char2)
+    side = len(key_matrix)
+
+    if r1 == r2:  # Same row
+        return key_matrix[r1][(c1 + mode) % side] + key_matrix[r2][(c2 + mode) % side]
+    elif c1 == c2:  # Same column
+        return key_matrix[(r1 + mode) % side][c1] + key_matrix[(r2 + mode) % side][c2]
+    else:  # Rectangle
+        return key_matrix[r1][c2] + key_matrix[r2][c1]
+
+class PlayfairKey:
+    """
+    A prepared Playfair key.
+
+    Holds the key matrix, a letter -> (row, col) index and a precomputed
+    substitution table for every digraph in each direction, so encrypting or
+    decrypting a pair is a single dictionary lookup.
+    """
+
+    def __init__(self, key_matrix: List[List[str]]) -> None:
+        self.matrix = key_matrix
+        self.positions: Dict[str, Tuple[int, int]] = {}
+        for r, row in enumerate(key_matrix):
+            for c, value in enumerate(row):
+                self.positions.setdefault(value, (r, c))
+        letters = list(self.positions)
+        self.tables: Dict[int, Dict[str, str]] = {
+            mode: {a + b: crypt_pair(key_matrix, a + b, mode) for a in letters for b in letters}
+            for mode in (1, -1)
+        }
+
+    @instrumented("playfair", text_arg=1)
+    def crypt(self, text_pairs: List[str], mode: int) -> str:
+        """
+        Encrypts (mode = 1) or decrypts (mode = -1) a list of digraphs.
+        Pairs outside the table (characters missing from the square) fall
+        back to crypt_pair so they come out exactly as before.
+        """
+        table = self.tables.get(mode, {})
+        matrix = self.matrix
+        return "".join([table.get(pair) or crypt_pair(matrix, pair, mode) for pair in text_pairs])
+
+@timed("key_setup", "playfair")
+def playfair_key(key: str, alphabet: Optional[Alphabet] = None) -> PlayfairKey:
+    """
+    Returns the prepared key for a keyword, memoized by its normalized form.
+    """
+    normalized = normalize_text(key, alphabet)
+    return prepared_key("playfair", (normalized, alphabet),
+                        lambda: PlayfairKey(generate_key_matrix(normalized, alphabet)))
+
+def playfair_crypt(
+    text_pairs: List[str], key_matrix: Union[List[List[str]], PlayfairKey], mode: int
+) -> str:
     """
     Performs Playfair encryption or decryption.
     mode = 1 for encrypt, -1 for decrypt.
+    key_matrix may be a matrix from generate_key_matrix or a PlayfairKey.
+    """
+    if not isinstance(key_matrix, PlayfairKey):
+        matrix = tuple(tuple(row) for row in key_matrix)
+        key_matrix = prepared_key("playfair-matrix", matrix,
+                                  lambda: PlayfairKey([list(row) for row in matrix]))
+    return key_matrix.crypt(text_pairs, mode)
+
+@instrumented("playfair")
+def playfair_encrypt(message: str, key: str, alphabet: Optional[Alphabet] = None) -> str:
+    """
+    Encrypts a message with a keyword, preparing digraphs with prepare_plaintext.
+    alphabet selects a different square, e.g. alphabet.ALPHANUMERIC for 6x6.
+    """
+    return playfair_key(key, alphabet).crypt(prepare_plaintext(message, alphabet), 1)
+
+@instrumented("playfair")
+def playfair_decrypt(ciphertext: str, key: str, alphabet: Optional[Alphabet] = None) -> str:
+    """
+    Decrypts a ciphertext with a keyword, normalizing it with prepare_ciphertext.
     """
-    result = ""
-    for pair in text_pairs:
-        char1, char2 = pair[0], pair[1]
-        r1, c1 = find_position(key_matrix, char1)
-        r2, c2 = find_position(key_matrix, char2)
-
-        if r1 == r2:  # Same row
-            result += key_matrix[r1][(c1 + mode) % 5]
-            result += key_matrix[r2][(c2 + mode) % 5]
-        elif c1 == c2:  # Same column
-            result += key_matrix[(r1 + mode) % 5][c1]
-            result += key_matrix[(r2 + mode) % 5][c2]
-        else:  # Rectangle
-            result += key_matrix[r1][c2]
-            result += key_matrix[r2][c1]
-    return result
+    return playfair_key(key, alphabet).crypt(prepare_ciphertext(ciphertext, alphabet), -1)
 
 def main() -> None:
     while True:
@@ -100,12 +209,7 @@ def main() -> None:
                 print(f"\nPrepared Plaintext (Digraphs): {' '.join(p for p in plaintext_pairs)}")
                 print(f"Encrypted Message: {encrypted}")
             else: # choice == '2'
-                # Normalize ciphertext: uppercase, remove spaces, replace J with I
-                norm = message.upper().replace(" ", "").replace("J", "I")
-                # If odd length, pad with X to form complete digraphs
-                if len(norm) % 2 == 1:
-                    norm += 'X'
-                ciphertext_pairs = [norm[i:i + 2] for i in range(0, len(norm), 2)]
+                ciphertext_pairs = prepare_ciphertext(message)
                 decrypted = playfair_crypt(ciphertext_pairs, key_matrix, -1)
                 print(f"\nDecrypted Message: {decrypted}")
 
@@ -1,5 +1,89 @@
-from typing import List
+from array import array
+from functools import lru_cache
+from typing import Tuple
 
+from instrumentation import instrumented, timed
+from permutation import gather, gather_into, zeros
+from translation import Buffer
+
+# Number of (length, rails) permutations kept; each costs 16 bytes per character
+PERMUTATION_CACHE_SIZE = 16
+
+# Only messages up to this long have their permutations cached, so the
+# cache holds at most PERMUTATION_CACHE_SIZE * 16 MB; longer ones are
+# rebuilt per call and freed with the result
+CACHE_MAX_LENGTH = 1 << 20
+
+@timed("key_setup", "railfence")
+def zigzag_permutation(length: int, rails: int) -> Tuple["array[int]", "array[int]"]:
+    """
+    Computes the Rail Fence index permutation for a message of this length.
+
+    Returns (perm, inverse): ciphertext[k] = plaintext[perm[k]] and
+    plaintext[i] = ciphertext[inverse[i]]. Instead of walking a grid, each
+    rail is written as the strided index ranges it owns: rail r holds
+    positions r, cycle - r, cycle + r, 2 * cycle - r, ... where
+    cycle = 2 * (rails - 1). Both arrays may be shared and must not be
+    modified.
+    """
+    if length <= CACHE_MAX_LENGTH:
+        return _cached_zigzag_permutation(length, rails)
+    return _zigzag_permutation(length, rails)
+
+def _zigzag_permutation(length: int, rails: int) -> Tuple["array[int]", "array[int]"]:
+    if rails <= 1:
+        identity = array('q', range(length))
+        return identity, identity
+    perm = zeros(length)
+    inverse = zeros(length)
+    cycle = 2 * (rails - 1)
+    pos = 0
+    for r in range(rails):
+        down = range(r, length, cycle)
+        up = range(cycle - r, length, cycle) if 0 < r < rails - 1 else range(0)
+        count = len(down) + len(up)
+        # On middle rails the down and up strokes alternate, starting with down
+        step = 2 if len(up) else 1
+        perm[pos:pos + count:step] = array('q', down)
+        inverse[r::cycle] = array('q', range(pos, pos + step * len(down), step))
+        if len(up):
+            perm[pos + 1:pos + count:2] = array('q', up)
+            inverse[cycle - r::cycle] = array('q', range(pos + 1, pos + count, 2))
+        pos += count
+    return perm, inverse
+
+_cached_zigzag_permutation = lru_cache(maxsize=PERMUTATION_CACHE_SIZE)(_zigzag_permutation)
+
+def zigzag_inverse_prefix(length: int, rails: int, count: int) -> "array[int]":
+    """
+    Returns inverse[:count] of zigzag_permutation(length, rails) without
+    building the whole permutation, in O(rails + count): plaintext position
+    i sits on rail r at rank i // cycle along it (doubled on middle rails,
+    plus one on the up stroke), after all the characters of rails above r.
+    """
+    count = min(count, length)
+    if rails <= 1:
+        return array('q', range(count))
+    cycle = 2 * (rails - 1)
+    starts = []
+    pos = 0
+    for r in range(rails):
+        starts.append(pos)
+        pos += len(range(r, length, cycle))
+        if 0 < r < rails - 1:
+            pos += len(range(cycle - r, length, cycle))
+    prefix = zeros(count)
+    for i in range(count):
+        rank, t = divmod(i, cycle)
+        if t == 0 or t == rails - 1:
+            prefix[i] = starts[t] + rank
+        elif t < rails:
+            prefix[i] = starts[t] + 2 * rank
+        else:
+            prefix[i] = starts[cycle - t] + 2 * rank + 1
+    return prefix
+
+@instrumented("railfence")
 def rail_fence_encrypt(plain_text: str, rails: int) -> str:
     """
     Encrypts a message using the Rail Fence cipher.
@@ -7,59 +91,35 @@ def rail_fence_encrypt(plain_text: str, rails: int) -> str:
     # Handle trivial cases gracefully
     if rails <= 1 or len(plain_text) <= 1:
         return plain_text
-    # Create a fence (a list of lists)
-    fence: List[List[str]] = [[] for _ in range(rails)]
-    rail = 0
-    direction = 1 # 1 for down, -1 for up
-
-    # Fill the fence in a zig-zag pattern
-    for char in plain_text:
-        fence[rail].append(char)
-        rail += direction
-        # Change direction at the top and bottom rails
-        if rail == rails - 1 or rail == 0:
-            direction *= -1
-
-    # Read the fence row by row to get the ciphertext
-    cipher_text = "".join(["".join(row) for row in fence])
-    return cipher_text
+    perm, _ = zigzag_permutation(len(plain_text), rails)
+    return gather(plain_text, perm)
 
+@instrumented("railfence")
 def rail_fence_decrypt(cipher_text: str, rails: int) -> str:
     """
     Decrypts a message encrypted with the Rail Fence cipher.
     """
     if rails <= 1:
         return cipher_text
+    _, inverse = zigzag_permutation(len(cipher_text), rails)
+    return gather(cipher_text, inverse)
 
-    # 1. Create a fence with placeholder markers to map the zig-zag pattern
-    fence: List[List[str]] = [['\n' for _ in range(len(cipher_text))] for _ in range(rails)]
-    rail = 0
-    direction = 1
-    for i in range(len(cipher_text)):
-        fence[rail][i] = '*'
-        rail += direction
-        if rail == rails - 1 or rail == 0:
-            direction *= -1
-
-    # 2. Fill the fence with the ciphertext characters row by row
-    cipher_index = 0
-    for r in range(rails):
-        for c in range(len(cipher_text)):
-            if fence[r][c] == '*':
-                fence[r][c] = cipher_text[cipher_index]
-                cipher_index += 1
-
-    # 3. Read the fence in the zig-zag pattern to get the plaintext
-    plain_text = ""
-    rail = 0
-    direction = 1
-    for i in range(len(cipher_text)):
-        plain_text += fence[rail][i]
-        rail += direction
-        if rail == rails - 1 or rail == 0:
-            direction *= -1
-
-    return plain_text
+@instrumented("railfence")
+def rail_fence_encrypt_into(src: Buffer, dst: Buffer, rails: int) -> int:
+    """
+    Encrypts bytes from src into dst, which may be src itself, and returns
+    the number of bytes written.
+    """
+    perm, _ = zigzag_permutation(memoryview(src).nbytes, rails)
+    return gather_into(src, perm, dst)
+
+@instrumented("railfence")
+def rail_fence_decrypt_into(src: Buffer, dst: Buffer, rails: int) -> int:
+    """
+    Decrypts bytes from src into dst, which may be src itself.
+    """
+    _, inverse = zigzag_permutation(memoryview(src).nbytes, rails)
+    return gather_into(src, inverse, dst)
 
 def main() -> None:
     while True:
@@ -1,58 +1,121 @@
-import math
-from typing import List
+from array import array
+from functools import lru_cache
+from typing import Tuple
 
+from instrumentation import instrumented, timed
+from permutation import gather_into, index_array, read_columns, write_columns, zeros
+from keycache import prepared_key
+from translation import Buffer
+
+# Number of (length, key) index arrays kept for the bytes API; each costs
+# 8 bytes per character. Longer payloads are not cached, as for Rail Fence.
+PERMUTATION_CACHE_SIZE = 16
+CACHE_MAX_LENGTH = 1 << 20
+
+@timed("key_setup", "rowtrans")
+def column_order(key: str) -> Tuple[int, ...]:
+    """
+    Returns the column indices in the order the key reads them.
+    """
+    def build() -> Tuple[int, ...]:
+        key_map = sorted([(int(k), i) for i, k in enumerate(key)])
+        return tuple(col_index for _, col_index in key_map)
+    return prepared_key("rowtrans", key, build)
+
+@timed("prepare", "rowtrans")
+def prepare_plaintext(plain_text: str) -> str:
+    """
+    Removes spaces and converts to uppercase for simplicity.
+    """
+    return plain_text.replace(" ", "").upper()
+
+@instrumented("rowtrans")
 def row_transposition_encrypt(plain_text: str, key: str) -> str:
     """
     Encrypts a message using the Row Transposition cipher.
     """
-    # Remove spaces and convert to uppercase for simplicity
-    plain_text = plain_text.replace(" ", "").upper()
-    key_map = sorted([(int(k), i) for i, k in enumerate(key)])
+    plain_text = prepare_plaintext(plain_text)
+    order = column_order(key)
     num_cols = len(key)
-    num_rows = math.ceil(len(plain_text) / num_cols)
+    num_rows = -(-len(plain_text) // num_cols)
 
     # Pad the message if its length is not a multiple of the key length
     padded_text = plain_text.ljust(num_rows * num_cols, 'X')
 
-    # Create the matrix
-    matrix = [list(padded_text[i:i + num_cols]) for i in range(0, len(padded_text), num_cols)]
-
-    # Read the ciphertext column by column based on the key order
-    cipher_text = ""
-    for _, col_index in key_map:
-        for row in range(num_rows):
-            cipher_text += matrix[row][col_index]
-
-    return cipher_text
+    # Read the ciphertext column by column based on the key order; column c of
+    # the row-major grid is simply the strided slice padded_text[c::num_cols]
+    return read_columns(padded_text, num_cols, order)
 
+@instrumented("rowtrans")
 def row_transposition_decrypt(cipher_text: str, key: str) -> str:
     """
     Decrypts a message encrypted with the Row Transposition cipher.
     """
-    key_map = sorted([(int(k), i) for i, k in enumerate(key)])
+    # If the message wasn't a multiple of the key length, only the first
+    # len % num_cols columns have a cell in the last row
+    return write_columns(cipher_text, len(key), column_order(key))
+
+@timed("key_setup", "rowtrans")
+def read_permutation(length: int, key: str) -> "array[int]":
+    """
+    Index array reading a full row-major grid of `length` characters column
+    by column in key order (the encryption gather).
+    """
+    if length <= CACHE_MAX_LENGTH:
+        return _cached_read_permutation(length, key)
+    return _read_permutation(length, key)
+
+@timed("key_setup", "rowtrans")
+def write_permutation(length: int, key: str) -> "array[int]":
+    """
+    Index array undoing the column reads for a possibly ragged grid (the
+    decryption gather), matching row_transposition_decrypt.
+    """
+    if length <= CACHE_MAX_LENGTH:
+        return _cached_write_permutation(length, key)
+    return _write_permutation(length, key)
+
+def _read_permutation(length: int, key: str) -> "array[int]":
     num_cols = len(key)
-    num_rows = math.ceil(len(cipher_text) / num_cols)
-    
-    # Create an empty matrix to fill with the ciphertext
-    matrix = [['' for _ in range(num_cols)] for _ in range(num_rows)]
-    
-    # Calculate how many full columns and how many shorter columns there are
-    # This is needed if the original message wasn't perfectly divisible
-    str_idx = 0
-    full_cols = len(cipher_text) % num_cols
-    
-    # Fill the matrix column by column using the key order
-    cipher_idx = 0
-    for _, col_index in key_map:
-        # Determine the length of the current column
-        col_len = num_rows if col_index < full_cols or full_cols == 0 else num_rows - 1
-        for row in range(col_len):
-            matrix[row][col_index] = cipher_text[cipher_idx]
-            cipher_idx += 1
-            
-    # Read the plaintext row by row
-    plain_text = "".join(["".join(row) for row in matrix])
-    return plain_text
+    perm = index_array()
+    for col in column_order(key):
+        perm.extend(range(col, length, num_cols))
+    return perm
+
+def _write_permutation(length: int, key: str) -> "array[int]":
+    num_cols = len(key)
+    full_cols = length % num_cols
+    num_rows = -(-length // num_cols)
+    perm = zeros(length)
+    pos = 0
+    for col in column_order(key):
+        col_len = num_rows if col < full_cols or full_cols == 0 else num_rows - 1
+        perm[col::num_cols] = array('q', range(pos, pos + col_len))
+        pos += col_len
+    return perm
+
+_cached_read_permutation = lru_cache(maxsize=PERMUTATION_CACHE_SIZE)(_read_permutation)
+_cached_write_permutation = lru_cache(maxsize=PERMUTATION_CACHE_SIZE)(_write_permutation)
+
+@instrumented("rowtrans")
+def row_transposition_encrypt_into(src: Buffer, dst: Buffer, key: str) -> int:
+    """
+    Encrypts ASCII bytes from src into dst and returns the number of bytes
+    written. As in row_transposition_encrypt, spaces are removed, letters
+    upper-cased and the grid padded with 'X', so dst must hold the padded
+    length; this normalization makes one temporary copy of the input.
+    """
+    text = memoryview(src).tobytes().replace(b" ", b"").upper()
+    num_cols = len(key)
+    padded = -(-len(text) // num_cols) * num_cols
+    return gather_into(text.ljust(padded, b"X"), read_permutation(padded, key), dst)
+
+@instrumented("rowtrans")
+def row_transposition_decrypt_into(src: Buffer, dst: Buffer, key: str) -> int:
+    """
+    Decrypts bytes from src into dst, which may be src itself.
+    """
+    return gather_into(src, write_permutation(memoryview(src).nbytes, key), dst)
 
 def main() -> None:
     while True:
@@ -1,60 +1,152 @@
-from typing import List
+from typing import Optional, Tuple
 
-def generate_key(message: str, key: str) -> str:
+from alphabet import Alphabet
+from backends import get_backend
+from instrumentation import instrumented, timed
+from keycache import prepared_key
+from translation import Buffer, caesar_table, output_length, translate_into
+
+@timed("key_setup", "vigenere")
+def generate_key(message: str, key: str, offset: int = 0) -> str:
     """
     Generates a key of the same length as the message by repeating the keyword.
     Keeps the result as a string to preserve typing consistency.
+    A non-zero offset starts the key that many positions in, so a message
+    processed in pieces lines up with the key as if it were one string.
     """
+    if offset:
+        offset %= len(key)
+        key = key[offset:] + key[:offset]
     if len(key) >= len(message):
         return key[:len(message)]
     repeats, remainder = divmod(len(message), len(key))
     return (key * repeats) + key[:remainder]
 
-def vigenere_encrypt(message: str, key: str) -> str:
+def key_shift(key_char: str) -> int:
     """
-    Encrypts a message using the Vigenère cipher.
+    Returns the shift a key letter applies, measured from 'a' or 'A' by case.
+    """
+    key_start = ord('a') if key_char.islower() else ord('A')
+    return ord(key_char) - key_start
+
+@timed("key_setup", "vigenere")
+def key_shifts(
+    key: str, decrypt: bool = False, alphabet: Optional[Alphabet] = None
+) -> Tuple[int, ...]:
+    """
+    Returns the cached shift of every key letter, negated for decryption.
+    """
+    sign = -1 if decrypt else 1
+
+    def build() -> Tuple[int, ...]:
+        if alphabet is None:
+            return tuple(sign * key_shift(k) % 26 for k in key)
+        return tuple(sign * index % alphabet.size for index in alphabet.encode(key))
+    return prepared_key("vigenere", (key, decrypt, alphabet), build)
+
+class VigenereStream:
+    """
+    Incremental Vigenère encoder/decoder.
+
+    Only the key position is kept between update() calls, so arbitrarily long
+    input can be fed in pieces. The per-key-letter shifts are computed once and
+    each chunk is shifted by the selected backend (see backends.py).
+
+    With an alphabet, key symbols are looked up in it, shifts are taken
+    modulo its size and chunks go through its cached tables.
     """
-    encrypted_text = ""
-    full_key = generate_key(message, key)
-    for i in range(len(message)):
-        char = message[i]
-        if char.isalpha():
-            # Determine the case for correct shift calculation
-            start = ord('a') if char.islower() else ord('A')
-            key_start = ord('a') if full_key[i].islower() else ord('A')
-
-            # Calculate the shift
-            shift = ord(full_key[i]) - key_start
-            # Encrypt the character
-            encrypted_char_ord = (ord(char) - start + shift) % 26
-            encrypted_text += chr(encrypted_char_ord + start)
+
+    def __init__(
+        self,
+        key: str,
+        decrypt: bool = False,
+        position: int = 0,
+        alphabet: Optional[Alphabet] = None,
+    ) -> None:
+        if not key:
+            raise ValueError("Keyword must not be empty.")
+        self.key = key
+        self.decrypt = decrypt
+        self.alphabet = alphabet
+        self._shifts = key_shifts(key, decrypt, alphabet)
+        self.position = position
+
+    @instrumented("vigenere", text_arg=1)
+    def update(self, chunk: str) -> str:
+        """
+        Transforms the next chunk of the stream and advances the key position.
+        """
+        if self.alphabet is not None:
+            result = self.alphabet.shift(chunk, self._shifts, self.position)
         else:
-            # Keep non-alphabetic characters as they are
-            encrypted_text += char
-    return encrypted_text
+            result = get_backend().shift(chunk, self._shifts, self.position)
+        self.position += len(chunk)
+        return result
+
+    @instrumented("vigenere", text_arg=1)
+    def update_into(self, src: Buffer, dst: Buffer) -> int:
+        """
+        Bytes version of update(): transforms ASCII bytes from src into dst,
+        which may be src itself, and returns the number of bytes written.
+        Only the default A-Z alphabet is supported.
+        """
+        if self.alphabet is not None:
+            raise ValueError("The bytes API only supports the default A-Z alphabet.")
+        length = output_length(src, dst)
+        period = len(self._shifts)
+        offset = self.position % period
+        for i in range(min(period, length)):
+            table = caesar_table(self._shifts[(offset + i) % period]).byte_table
+            translate_into(table, src, dst, i, period)
+        self.position += length
+        return length
 
-def vigenere_decrypt(ciphertext: str, key: str) -> str:
+    def checkpoint(self) -> int:
+        """
+        Returns the number of characters processed so far.
+        """
+        return self.position
+
+    def restore(self, position: int) -> None:
+        """
+        Resumes the stream at a position previously returned by checkpoint().
+        """
+        self.position = position
+
+@instrumented("vigenere")
+def vigenere_encrypt(
+    message: str, key: str, offset: int = 0, alphabet: Optional[Alphabet] = None
+) -> str:
+    """
+    Encrypts a message using the Vigenère cipher.
+    offset is the key position of the first character (for chunked input).
+    """
+    return VigenereStream(key, position=offset, alphabet=alphabet).update(message)
+
+@instrumented("vigenere")
+def vigenere_decrypt(
+    ciphertext: str, key: str, offset: int = 0, alphabet: Optional[Alphabet] = None
+) -> str:
     """
     Decrypts a ciphertext using the Vigenère cipher.
+    offset is the key position of the first character (for chunked input).
     """
-    decrypted_text = ""
-    full_key = generate_key(ciphertext, key)
-    for i in range(len(ciphertext)):
-        char = ciphertext[i]
-        if char.isalpha():
-            # Determine the case for correct shift calculation
-            start = ord('a') if char.islower() else ord('A')
-            key_start = ord('a') if full_key[i].islower() else ord('A')
-
-            # Calculate the shift
-            shift = ord(full_key[i]) - key_start
-            # Decrypt the character
-            decrypted_char_ord = (ord(char) - start - shift + 26) % 26
-            decrypted_text += chr(decrypted_char_ord + start)
-        else:
-            # Keep non-alphabetic characters as they are
-            decrypted_text += char
-    return decrypted_text
+    return VigenereStream(key, decrypt=True, position=offset, alphabet=alphabet).update(ciphertext)
+
+@instrumented("vigenere")
+def vigenere_encrypt_into(src: Buffer, dst: Buffer, key: str, offset: int = 0) -> int:
+    """
+    Encrypts ASCII bytes from src into dst, which may be src itself, and
+    returns the number of bytes written.
+    """
+    return VigenereStream(key, position=offset).update_into(src, dst)
+
+@instrumented("vigenere")
+def vigenere_decrypt_into(src: Buffer, dst: Buffer, key: str, offset: int = 0) -> int:
+    """
+    Decrypts ASCII bytes from src into dst, which may be src itself.
+    """
+    return VigenereStream(key, decrypt=True, position=offset).update_into(src, dst)
 
 def main() -> None:
     while True:
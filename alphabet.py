@@ -0,0 +1,168 @@
+"""
+Pluggable alphabets for the substitution ciphers and Playfair.
+
+The ciphers work on A-Z unless given an Alphabet: an ordered string of
+distinct symbols with both codecs precomputed, ``indices`` (code point ->
+position) and ``symbols`` (position -> character). Caesar, Affine and
+Vigenère then work modulo the alphabet's size, and Playfair uses it as its
+key square when the size is a perfect square (6x6 for A-Z plus 0-9).
+
+Every key becomes an AlphabetTable, a ``str.translate`` dict over the
+alphabet's code points, cached in the shared key cache. When every symbol
+and its image fit in one byte (ASCII or Latin-1 alphabets) the table also
+carries a 256-byte ``bytes.translate`` table, so such alphabets run at the
+same one-pass lookup speed as the built-in A-Z path. Characters outside the
+alphabet are copied unchanged.
+
+With ignore_case=True the other-case form of each symbol is accepted too.
+Caesar and Vigenère keep the case of such characters when every symbol has
+a case (otherwise a lower-case letter could become a digit and the case be
+lost), and Affine always maps them to the alphabet's own symbols, as the
+A-Z versions do.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence
+
+from keycache import prepared_key
+
+
+class Alphabet:
+    """
+    An ordered set of distinct symbols with precomputed char <-> index codecs.
+    """
+
+    __slots__ = ("symbols", "ignore_case", "size", "indices", "preserves_case", "_variants")
+
+    def __init__(self, symbols: str, ignore_case: bool = False) -> None:
+        if len(symbols) < 2:
+            raise ValueError("An alphabet needs at least two symbols.")
+        folded = symbols.casefold() if ignore_case else symbols
+        if len(set(folded)) != len(symbols):
+            raise ValueError("Alphabet symbols must be distinct.")
+        self.symbols = symbols
+        self.ignore_case = ignore_case
+        self.size = len(symbols)
+        self.indices: Dict[int, int] = {ord(char): i for i, char in enumerate(symbols)}
+        # Other-case forms of the symbols, which map to the same index
+        self._variants: Dict[int, int] = {}
+        if ignore_case:
+            for i, char in enumerate(symbols):
+                for variant in {char.lower(), char.upper()}:
+                    if len(variant) == 1 and ord(variant) not in self.indices:
+                        self._variants[ord(variant)] = i
+        self.indices.update(self._variants)
+        self.preserves_case = ignore_case and all(
+            len(char.lower()) == len(char.upper()) == 1 and char.lower() != char.upper()
+            for char in symbols
+        )
+
+    def __repr__(self) -> str:
+        return f"Alphabet({self.symbols!r}, ignore_case={self.ignore_case})"
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, Alphabet) and self.symbols == other.symbols
+                and self.ignore_case == other.ignore_case)
+
+    def __hash__(self) -> int:
+        return hash((self.symbols, self.ignore_case))
+
+    def __contains__(self, char: object) -> bool:
+        return isinstance(char, str) and len(char) == 1 and ord(char) in self.indices
+
+    def encode(self, text: str) -> List[int]:
+        """
+        Returns the index of every character; raises ValueError for
+        characters outside the alphabet.
+        """
+        try:
+            return [self.indices[ord(char)] for char in text]
+        except KeyError as e:
+            raise ValueError(f"{chr(e.args[0])!r} is not in the alphabet") from None
+
+    def decode(self, indices: Sequence[int]) -> str:
+        """
+        Returns the symbols at these indices (taken modulo the size).
+        """
+        symbols, size = self.symbols, self.size
+        return "".join([symbols[i % size] for i in indices])
+
+    def normalize(self, text: str) -> str:
+        """
+        Maps every other-case form to the alphabet's own symbol, leaving
+        other characters alone.
+        """
+        if not self._variants:
+            return text
+        return text.translate({code: self.symbols[i] for code, i in self._variants.items()})
+
+    @property
+    def square_side(self) -> int:
+        """
+        Side of the Playfair square this alphabet fills; ValueError if its
+        size is not a perfect square.
+        """
+        side = math.isqrt(self.size)
+        if side * side != self.size:
+            raise ValueError(f"A Playfair alphabet needs a square number of symbols, "
+                             f"not {self.size}.")
+        return side
+
+    def table(self, multiplier: int, offset: int, fold_case: bool = False) -> "AlphabetTable":
+        """
+        Returns the cached table for x -> (multiplier * x + offset) mod size.
+        """
+        key = (self, multiplier % self.size, offset % self.size, fold_case)
+        return prepared_key("alphabet", key, lambda: AlphabetTable(self, *key[1:]))
+
+    def shift(self, text: str, shifts: Sequence[int], position: int) -> str:
+        """
+        Shifts each symbol by shifts[(position + i) % len(shifts)], one
+        strided slice per key symbol, like backends.python_shift.
+        """
+        period = len(shifts)
+        offset = position % period
+        result = list(text)
+        for i in range(min(period, len(text))):
+            table = self.table(1, shifts[(offset + i) % period])
+            result[i::period] = table.translate(text[i::period])
+        return "".join(result)
+
+
+class AlphabetTable(Dict[int, int]):
+    """
+    ``str.translate`` table for one affine map over an alphabet, with a
+    byte_table for ``bytes.translate`` when everything fits in Latin-1.
+    """
+
+    def __init__(self, alphabet: Alphabet, multiplier: int, offset: int, fold_case: bool) -> None:
+        super().__init__()
+        symbols, size = alphabet.symbols, alphabet.size
+        for code, index in alphabet.indices.items():
+            target = symbols[(multiplier * index + offset) % size]
+            if not fold_case and alphabet.preserves_case and code in alphabet._variants:
+                target = target.lower() if chr(code).islower() else target.upper()
+            self[code] = ord(target)
+        self.byte_table: Optional[bytes] = None
+        if all(code < 256 and value < 256 for code, value in self.items()):
+            self.byte_table = bytes(self.get(code, code) for code in range(256))
+
+    def translate(self, text: str) -> str:
+        """
+        Applies the table to a whole string in one pass.
+        """
+        if self.byte_table is not None:
+            try:
+                data = text.encode('latin-1')
+            except UnicodeEncodeError:
+                pass
+            else:
+                return data.translate(self.byte_table).decode('latin-1')
+        return text.translate(self)
+
+
+# The built-in alphabets: A-Z as the ciphers use it by default, A-Z plus
+# digits (a 6x6 Playfair square), and the 25-letter Playfair square
+UPPERCASE = Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZ", ignore_case=True)
+ALPHANUMERIC = Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789", ignore_case=True)
+PLAYFAIR_5X5 = Alphabet("ABCDEFGHIKLMNOPQRSTUVWXYZ", ignore_case=True)
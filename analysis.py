@@ -0,0 +1,126 @@
+"""
+Brute-force cryptanalysis of Caesar and Affine ciphertext.
+
+Every Caesar shift (26) and every valid Affine key (12 values of 'a' coprime
+with 26, times 26 values of 'b' = 312) is tried against a sample of the
+ciphertext's letters and ranked by English quadgram fitness. Key groups are
+scored in parallel worker processes, and the search stops early once a
+candidate reaches the confidence threshold.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from AffineCipher import affine_decrypt, egcd, modinv
+from CeaserCipher import caesar_decrypt
+from fitness import letter_indices, score_indices
+
+# Letters of ciphertext scored per candidate; the full text is only
+# decrypted for the candidates that are returned
+SAMPLE_LETTERS = 2000
+
+# Average quadgram log probability treated as a confident English match.
+# English text scores around -5, random letters around -7.5.
+DEFAULT_THRESHOLD = -5.6
+
+# Only these values of 'a' have an inverse mod 26
+VALID_AFFINE_A = tuple(a for a in range(26) if egcd(a, 26)[0] == 1)
+
+Key = Tuple[str, Tuple[int, ...]]
+
+
+class Candidate(NamedTuple):
+    score: float
+    cipher: str
+    key: Tuple[int, ...]
+    plaintext: str
+
+
+def key_groups(ciphers: Sequence[str]) -> List[List[Key]]:
+    """
+    Lists the candidate keys in groups of 26: all Caesar shifts, then one
+    group per valid Affine 'a'.
+    """
+    groups: List[List[Key]] = []
+    if "caesar" in ciphers:
+        groups.append([("caesar", (shift,)) for shift in range(26)])
+    if "affine" in ciphers:
+        for a in VALID_AFFINE_A:
+            groups.append([("affine", (a, b)) for b in range(26)])
+    return groups
+
+
+def _decryption_table(cipher: str, key: Tuple[int, ...]) -> bytes:
+    if cipher == "caesar":
+        return bytes((c - key[0]) % 26 for c in range(26))
+    inverse = modinv(key[0], 26)
+    return bytes(inverse * (c - key[1]) % 26 for c in range(26))
+
+
+def score_group(sample: bytes, group: List[Key]) -> List[Tuple[float, Key]]:
+    """
+    Scores each key by the average quadgram fitness of the decrypted sample.
+    """
+    quads = max(len(sample) - 3, 1)
+    scored: List[Tuple[float, Key]] = []
+    for cipher, key in group:
+        decrypted = sample.translate(_decryption_table(cipher, key) + bytes(230))
+        scored.append((score_indices(decrypted) / quads, (cipher, key)))
+    return scored
+
+
+def _decrypt(ciphertext: str, cipher: str, key: Tuple[int, ...]) -> str:
+    if cipher == "caesar":
+        return caesar_decrypt(ciphertext, key[0])
+    return affine_decrypt(ciphertext, key[0], key[1])
+
+
+def analyze(
+    ciphertext: str,
+    ciphers: Sequence[str] = ("caesar", "affine"),
+    top: int = 5,
+    workers: Optional[int] = None,
+    threshold: Optional[float] = DEFAULT_THRESHOLD,
+    sample_size: int = SAMPLE_LETTERS,
+) -> List[Candidate]:
+    """
+    Ranks Caesar/Affine keys for a ciphertext and returns the best `top`
+    candidates with their decryptions, best first.
+
+    workers=None uses one process per CPU and workers=1 scores inline. With
+    threshold=None every key is scored; otherwise scoring stops as soon as
+    a candidate's fitness reaches it.
+    """
+    sample = letter_indices(ciphertext)[:sample_size]
+    groups = key_groups(ciphers)
+    scored: List[Tuple[float, Key]] = []
+
+    def confident() -> bool:
+        return threshold is not None and any(score >= threshold for score, _ in scored)
+
+    if workers == 1:
+        for group in groups:
+            scored.extend(score_group(sample, group))
+            if confident():
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: Set[Future[List[Tuple[float, Key]]]] = {
+                executor.submit(score_group, sample, group) for group in groups
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    scored.extend(future.result())
+                if confident():
+                    for future in pending:
+                        future.cancel()
+                    break
+
+    # Caesar shift s and Affine (1, s) decrypt identically; report the Caesar
+    # key on ties, and order the rest deterministically
+    scored.sort(key=lambda item: (-item[0], item[1][0] != "caesar", item[1][1]))
+    return [
+        Candidate(score, cipher, key, _decrypt(ciphertext, cipher, key))
+        for score, (cipher, key) in scored[:top]
+    ]
@@ -0,0 +1,125 @@
+"""
+Interchangeable kernels for the mod-26 substitution ciphers.
+
+Caesar and Affine apply one TranslationTable to the whole text; Vigenère
+shifts each character by the key letter at its position. A backend provides
+both operations:
+
+- "python" uses ``bytes.translate`` / ``str.translate``, and translates
+  Vigenère text one strided slice per key letter.
+- "numpy" encodes ASCII text as a ``uint8`` array, builds the letter and case
+  masks with vectorized comparisons and applies the table lookup or the tiled
+  key shift in a handful of array operations.
+- "auto" (the default) picks the faster kernel for each operation. A single
+  ``bytes.translate`` already beats a NumPy gather for Caesar and Affine, so
+  only Vigenère goes through NumPy, and only when it is installed.
+
+The backend is chosen with set_backend() or the CLASSIC_CIPHERS_BACKEND
+environment variable, which worker processes inherit. Both backends give
+identical output; non-ASCII and short texts always take the Python path.
+"""
+
+import os
+from typing import Callable, Dict, NamedTuple, Optional, Sequence
+
+from optional_deps import HAVE_NUMPY
+from optional_deps import numpy as np
+from translation import TranslationTable, caesar_table
+
+BACKEND_ENV = "CLASSIC_CIPHERS_BACKEND"
+DEFAULT_BACKEND = "auto"
+
+# Below this many characters the NumPy round trip costs more than it saves
+NUMPY_THRESHOLD = 4096
+
+
+class Backend(NamedTuple):
+    translate: Callable[[TranslationTable, str], str]
+    shift: Callable[[str, Sequence[int], int], str]
+
+
+def python_translate(table: TranslationTable, text: str) -> str:
+    """
+    Applies a Caesar/Affine table to the whole text.
+    """
+    return table.translate(text)
+
+
+def python_shift(text: str, shifts: Sequence[int], position: int) -> str:
+    """
+    Shifts each letter by shifts[(position + i) % len(shifts)], preserving
+    case. Characters sharing a key letter are translated together as one
+    strided slice through that shift's cached table.
+    """
+    period = len(shifts)
+    offset = position % period
+    result = list(text)
+    for i in range(min(period, len(text))):
+        table = caesar_table(shifts[(offset + i) % period])
+        result[i::period] = table.translate(text[i::period])
+    return "".join(result)
+
+
+PYTHON_BACKEND = Backend(python_translate, python_shift)
+BACKENDS: Dict[str, Backend] = {"python": PYTHON_BACKEND}
+
+if HAVE_NUMPY:
+    def numpy_translate(table: TranslationTable, text: str) -> str:
+        """
+        Applies a Caesar/Affine table to ASCII text as one uint8 gather.
+        """
+        if len(text) < NUMPY_THRESHOLD or not text.isascii():
+            return table.translate(text)
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        lookup = np.frombuffer(table.ascii_table, dtype=np.uint8)
+        return lookup[codes].tobytes().decode('ascii')
+
+    def numpy_shift(text: str, shifts: Sequence[int], position: int) -> str:
+        """
+        Vectorized python_shift for ASCII text.
+        """
+        if len(text) < NUMPY_THRESHOLD or not text.isascii():
+            return python_shift(text, shifts, position)
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        # Bit 5 is the case bit: letters sit at base + 1 ... base + 26, with
+        # base 64 for upper case and 96 for lower case
+        base = (codes & 32) | 64
+        letters = codes - base
+        is_letter = (letters >= 1) & (letters <= 26)
+        period = len(shifts)
+        offset = position % period
+        key = np.array([shifts[(offset + i) % period] % 26 for i in range(period)],
+                       dtype=np.uint8)
+        # (letter - 1 + shift) mod 26, kept non-negative in uint8
+        letters += np.tile(key + 25, -(-len(codes) // period))[:len(codes)]
+        letters %= 26
+        letters += base + 1
+        return np.where(is_letter, letters, codes).tobytes().decode('ascii')
+
+    BACKENDS["numpy"] = Backend(numpy_translate, numpy_shift)
+
+BACKENDS["auto"] = Backend(python_translate, BACKENDS.get("numpy", PYTHON_BACKEND).shift)
+
+_selected: Optional[str] = None
+
+
+def set_backend(name: str) -> None:
+    """
+    Selects the backend used by every substitution cipher in this process.
+    """
+    global _selected
+    if name not in BACKENDS:
+        if name == "numpy":
+            raise ValueError("The numpy backend needs NumPy: pip install classic-ciphers[numpy]")
+        raise ValueError(f"Unknown backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    _selected = name
+
+
+def get_backend() -> Backend:
+    """
+    Returns the selected backend, falling back to CLASSIC_CIPHERS_BACKEND and
+    then to "auto".
+    """
+    if _selected is None:
+        set_backend(os.environ.get(BACKEND_ENV, DEFAULT_BACKEND))
+    return BACKENDS[str(_selected)]
@@ -0,0 +1,168 @@
+"""
+Multi-core batch processing of many short records under one cipher and key.
+
+Records are read one per line, either as raw text or as JSON lines (a JSON
+string, or an object whose "text" field is transformed and whose other fields
+are passed through). They are grouped into chunks and spread across a
+``ProcessPoolExecutor``; results come back in input order, with only a bounded
+number of chunks in flight at once.
+
+Each worker prepares the key once in its own key cache (see keycache); the
+workers report their cache counters with every chunk, and run_batch() sums
+the latest report from each process into BatchStats.key_cache.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from keycache import CacheStats, combine_stats, key_cache_stats
+
+FORMATS = ("lines", "jsonl")
+DEFAULT_BATCH_CHUNK_SIZE = 1000
+
+
+class BatchStats(NamedTuple):
+    records: int
+    seconds: float
+    key_cache: CacheStats = CacheStats(0, 0, 0, 0, 0)
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+
+ChunkResult = Tuple[List[str], int, CacheStats]
+
+
+def _process_chunk(transform: Callable[[str], str], texts: List[str]) -> ChunkResult:
+    return [transform(text) for text in texts], os.getpid(), key_cache_stats()
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk: List[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def batch_transform(
+    texts: Iterable[str],
+    transform: Callable[[str], str],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    cache_stats: Optional[Dict[int, CacheStats]] = None,
+) -> Iterator[str]:
+    """
+    Applies transform to every text, in order, using a pool of worker
+    processes (workers=None uses one per CPU, workers=1 runs inline).
+    transform must be picklable, e.g. a registry.Transform.
+
+    When cache_stats is given it is filled with the latest key cache
+    counters of every process that ran a chunk, by process id.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if cache_stats is None:
+        cache_stats = {}
+
+    def collect(result: ChunkResult) -> List[str]:
+        texts, pid, stats = result
+        cache_stats[pid] = stats
+        return texts
+
+    if workers == 1:
+        for chunk in _chunked(texts, chunk_size):
+            yield from collect(_process_chunk(transform, chunk))
+        return
+    workers = workers or os.cpu_count() or 1
+    # Keep a few chunks per worker queued so workers never idle, but never
+    # read the whole input ahead of the output
+    max_in_flight = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future[ChunkResult]] = deque()
+        for chunk in _chunked(texts, chunk_size):
+            pending.append(executor.submit(_process_chunk, transform, chunk))
+            if len(pending) >= max_in_flight:
+                yield from collect(pending.popleft().result())
+        while pending:
+            yield from collect(pending.popleft().result())
+
+
+def parse_record(line: str, fmt: str) -> Tuple[str, Any]:
+    """
+    Splits an input line into (text to transform, original record).
+    """
+    line = line.rstrip("\r\n")
+    if fmt == "lines":
+        return line, line
+    record = json.loads(line)
+    if isinstance(record, str):
+        return record, record
+    if isinstance(record, dict) and isinstance(record.get("text"), str):
+        return record["text"], record
+    raise ValueError(f"JSONL record must be a string or an object with a 'text' field: {line}")
+
+
+def format_record(result: str, record: Any, fmt: str) -> str:
+    """
+    Renders a transformed text as an output line in the input's format.
+    """
+    if fmt == "lines":
+        return result
+    if isinstance(record, dict):
+        return json.dumps({**record, "text": result})
+    return json.dumps(result)
+
+
+def run_batch(
+    source: TextIO,
+    sink: TextIO,
+    transform: Callable[[str], str],
+    fmt: str = "lines",
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+) -> BatchStats:
+    """
+    Transforms every record read from source and writes them to sink in order.
+    Blank lines are skipped in JSONL input.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Choose from: {', '.join(FORMATS)}")
+    records: Deque[Any] = deque()
+
+    def texts() -> Iterator[str]:
+        for line in source:
+            if fmt == "jsonl" and not line.strip():
+                continue
+            text, record = parse_record(line, fmt)
+            records.append(record)
+            yield text
+
+    start = time.perf_counter()
+    count = 0
+    cache_stats: Dict[int, CacheStats] = {}
+    for result in batch_transform(texts(), transform, workers, chunk_size, cache_stats):
+        sink.write(format_record(result, records.popleft(), fmt) + "\n")
+        count += 1
+    sink.flush()
+    return BatchStats(count, time.perf_counter() - start, combine_stats(cache_stats.values()))
@@ -0,0 +1,81 @@
+"""
+Throughput benchmarks for every cipher function.
+
+Each benchmark records the number of input bytes in extra_info so
+compare.py can turn timings into throughput and flag regressions.
+"""
+
+from typing import Any, Callable
+
+import pytest
+
+from AffineCipher import affine_decrypt, affine_encrypt
+from CeaserCipher import caesar_decrypt, caesar_encrypt
+from PlayfairCipher import generate_key_matrix, playfair_crypt, prepare_plaintext
+from RailFenceCipher import rail_fence_decrypt, rail_fence_encrypt
+from RowTranspositionCipher import row_transposition_decrypt, row_transposition_encrypt
+from VigenereCipher import generate_key, vigenere_decrypt, vigenere_encrypt
+
+RAILS = [3, 10, 50]
+ROW_KEYS = ["3142", "5270613", "9081726354"]
+VIGENERE_KEYS = ["KEY", "CRYPTOGRAPHICKEY", "LONGKEY" * 18]
+
+
+def run(benchmark: Any, size: int, func: Callable[..., Any], *args: Any) -> None:
+    benchmark.extra_info["bytes"] = size
+    # Large inputs take seconds per call, so keep the number of rounds small
+    benchmark.pedantic(func, args=args, rounds=3 if size >= 10_000_000 else 10, iterations=1)
+
+
+@pytest.mark.parametrize("func", [caesar_encrypt, caesar_decrypt])
+def test_caesar(benchmark: Any, func: Callable[..., str], text: str, size: int) -> None:
+    run(benchmark, size, func, text, 3)
+
+
+@pytest.mark.parametrize("func", [affine_encrypt, affine_decrypt])
+def test_affine(benchmark: Any, func: Callable[..., str], text: str, size: int) -> None:
+    run(benchmark, size, func, text, 5, 8)
+
+
+@pytest.mark.parametrize("key", VIGENERE_KEYS, ids=lambda k: f"key{len(k)}")
+@pytest.mark.parametrize("func", [vigenere_encrypt, vigenere_decrypt])
+def test_vigenere(
+    benchmark: Any, func: Callable[..., str], key: str, text: str, size: int
+) -> None:
+    run(benchmark, size, func, text, key)
+
+
+@pytest.mark.parametrize("key", VIGENERE_KEYS, ids=lambda k: f"key{len(k)}")
+def test_generate_key(benchmark: Any, key: str, text: str, size: int) -> None:
+    run(benchmark, size, generate_key, text, key)
+
+
+@pytest.mark.parametrize("rails", RAILS, ids=lambda r: f"rails{r}")
+@pytest.mark.parametrize("func", [rail_fence_encrypt, rail_fence_decrypt])
+def test_rail_fence(
+    benchmark: Any, func: Callable[..., str], rails: int, text: str, size: int
+) -> None:
+    run(benchmark, size, func, text, rails)
+
+
+@pytest.mark.parametrize("key", ROW_KEYS, ids=lambda k: f"key{len(k)}")
+@pytest.mark.parametrize("func", [row_transposition_encrypt, row_transposition_decrypt])
+def test_row_transposition(
+    benchmark: Any, func: Callable[..., str], key: str, text: str, size: int
+) -> None:
+    run(benchmark, size, func, text, key)
+
+
+@pytest.mark.parametrize("keyword", ["KEY", "PLAYFAIREXAMPLE", "THEQUICKBROWNFOXJUMPSOVER"])
+def test_generate_key_matrix(benchmark: Any, keyword: str) -> None:
+    run(benchmark, len(keyword), generate_key_matrix, keyword)
+
+
+def test_prepare_plaintext(benchmark: Any, text: str, size: int) -> None:
+    run(benchmark, size, prepare_plaintext, text)
+
+
+@pytest.mark.parametrize("mode", [1, -1], ids=["encrypt", "decrypt"])
+def test_playfair_crypt(benchmark: Any, mode: int, text: str, size: int) -> None:
+    pairs = prepare_plaintext(text)
+    run(benchmark, size, playfair_crypt, pairs, generate_key_matrix("KEYWORD"), mode)
@@ -0,0 +1,71 @@
+"""
+Startup-latency benchmarks for the classic-ciphers entry point.
+
+Each benchmark runs the CLI in a fresh interpreter, the way cron jobs and
+shell pipelines do, so the time includes interpreter startup, imports and
+argument parsing as well as one short encryption. test_import_time also
+runs the command under ``python -X importtime`` and records the total import
+cost and the slowest top-level imports in extra_info.
+
+Run with:
+  python -m pytest benchmarks/bench_startup.py --benchmark-json benchmarks/results/startup.json
+"""
+
+import os
+import re
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, "cli.py")
+MESSAGE = "Meet me near the old bridge at midnight"
+
+COMMANDS: Dict[str, List[str]] = {
+    "caesar": ["caesar", "encrypt", "--shift", "3"],
+    "affine": ["affine", "encrypt", "--a", "5", "--b", "8"],
+    "vigenere": ["vigenere", "encrypt", "--key", "LEMON"],
+    "playfair": ["playfair", "encrypt", "--key", "KEYWORD"],
+    "railfence": ["railfence", "encrypt", "--rails", "3"],
+    "rowtrans": ["rowtrans", "encrypt", "--key", "3142"],
+}
+
+# "import time: <self us> | <cumulative us> | <indented module name>"
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_times(stderr: str) -> Dict[str, int]:
+    """
+    Maps each top-level import in -X importtime output to its cumulative
+    microseconds.
+    """
+    result: Dict[str, int] = {}
+    for match in IMPORT_LINE.finditer(stderr):
+        if not match.group(3):
+            result[match.group(4)] = int(match.group(2))
+    return result
+
+
+@pytest.mark.parametrize("cipher", list(COMMANDS))
+def test_one_shot(benchmark: Any, cipher: str) -> None:
+    args = [CLI, *COMMANDS[cipher], "--message", MESSAGE]
+    benchmark.extra_info["bytes"] = len(MESSAGE)
+    benchmark.pedantic(subprocess.run, args=([sys.executable, *args],),
+                       kwargs={"capture_output": True, "check": True, "cwd": ROOT},
+                       rounds=10, iterations=1)
+
+
+@pytest.mark.parametrize("cipher", list(COMMANDS))
+def test_import_time(benchmark: Any, cipher: str) -> None:
+    args = [sys.executable, "-X", "importtime", CLI, *COMMANDS[cipher], "--message", MESSAGE]
+    result = subprocess.run(args, capture_output=True, text=True, check=True, cwd=ROOT)
+    times = import_times(result.stderr)
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:5]
+    benchmark.extra_info["bytes"] = len(MESSAGE)
+    benchmark.extra_info["import_us"] = sum(times.values())
+    benchmark.extra_info["slowest_imports"] = dict(slowest)
+    benchmark.pedantic(subprocess.run, args=(args,),
+                       kwargs={"capture_output": True, "check": True, "cwd": ROOT},
+                       rounds=5, iterations=1)
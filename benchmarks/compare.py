@@ -0,0 +1,69 @@
+"""
+Compares two pytest-benchmark JSON files and fails on throughput regressions.
+
+Usage:
+  python benchmarks/compare.py BASELINE.json CURRENT.json [--threshold 0.10]
+
+Throughput is extra_info["bytes"] divided by the mean time. The script exits
+with status 1 if any benchmark present in both files is slower than the
+baseline by more than the threshold (a fraction, 0.10 = 10%).
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List
+
+
+def load_throughput(path: str) -> Dict[str, float]:
+    """
+    Maps each benchmark's full name to its throughput in bytes per second.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    result: Dict[str, float] = {}
+    for bench in data["benchmarks"]:
+        size = bench.get("extra_info", {}).get("bytes", 1)
+        result[bench["fullname"]] = size / bench["stats"]["mean"]
+    return result
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float], threshold: float) -> List[str]:
+    """
+    Returns a report line for every benchmark that regressed past threshold.
+    """
+    failures = []
+    for name in sorted(baseline.keys() & current.keys()):
+        change = current[name] / baseline[name] - 1
+        if change < -threshold:
+            failures.append(
+                f"{name}: {baseline[name] / 1e6:.2f} -> {current[name] / 1e6:.2f} MB/s "
+                f"({change:+.1%})"
+            )
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fail on benchmark throughput regressions")
+    parser.add_argument("baseline", help="baseline pytest-benchmark JSON file")
+    parser.add_argument("current", help="new pytest-benchmark JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed throughput drop as a fraction (default: 0.10)")
+    args = parser.parse_args()
+
+    baseline = load_throughput(args.baseline)
+    current = load_throughput(args.current)
+    failures = compare(baseline, current, args.threshold)
+    missing = sorted(baseline.keys() - current.keys())
+    for name in missing:
+        print(f"missing from current run: {name}")
+    if failures:
+        print(f"{len(failures)} benchmark(s) regressed by more than {args.threshold:.0%}:")
+        for line in failures:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%} across {len(current)} benchmarks.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Shared fixtures and options for the pytest-benchmark suite.
+
+Run with:
+  python -m pytest benchmarks/bench_ciphers.py --bench-max-size 1MB \
+      --benchmark-json benchmarks/results/current.json
+"""
+
+import os
+import sys
+from typing import Dict, List
+
+import pytest
+
+# The cipher modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SIZES: Dict[str, int] = {
+    "10B": 10,
+    "1KB": 1_000,
+    "100KB": 100_000,
+    "1MB": 1_000_000,
+    "10MB": 10_000_000,
+    "100MB": 100_000_000,
+}
+
+SAMPLE = (
+    "The quick brown fox jumps over the lazy dog. Pack my box with five dozen "
+    "liquor jugs! How vexingly quick daft zebras jump; 0123456789\n"
+)
+
+_texts: Dict[int, str] = {}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--bench-max-size",
+        default="1MB",
+        choices=list(SIZES),
+        help="largest input size to benchmark (default: 1MB)",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        limit = SIZES[metafunc.config.getoption("--bench-max-size")]
+        sizes: List[int] = [n for n in SIZES.values() if n <= limit]
+        ids = [name for name, n in SIZES.items() if n <= limit]
+        metafunc.parametrize("size", sizes, ids=ids)
+
+
+def make_text(size: int) -> str:
+    """
+    Returns deterministic mixed-case English text of exactly `size` characters.
+    """
+    if size not in _texts:
+        _texts[size] = (SAMPLE * (size // len(SAMPLE) + 1))[:size]
+    return _texts[size]
+
+
+@pytest.fixture
+def text(size: int) -> str:
+    return make_text(size)
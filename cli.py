@@ -9,144 +9,603 @@ Usage examples:
   python cli.py playfair encrypt --key KEYWORD --message "HELLO WORLD"
   python cli.py railfence encrypt --rails 3 --message "HELLO WORLD"
   python cli.py rowtrans encrypt --key 3142 --message "HELLO WORLD"
+  python cli.py vigenere encrypt --key KEY --input app.log --output app.log.enc
+  python cli.py caesar encrypt --shift 3 --input archive.txt --output archive.enc --mmap
+  cat dump.txt | python cli.py caesar encrypt --shift 3 > dump.enc
+  python cli.py pipeline vigenere:encrypt:key=LEMON rowtrans:encrypt:key=3142 \
+      railfence:encrypt:rails=3 --input plain.txt --output cipher.txt
+  python cli.py analyze --message "Wkh txlfn eurzq ira" --top 3
+  python cli.py analyze --cipher playfair --input intercepted.txt --restarts 16
+  python cli.py analyze --cipher rowtrans --input intercepted.txt --max-columns 8
+  python cli.py stats --input archive.txt --save archive.counts
+  python cli.py batch vigenere encrypt --key KEY --input records.txt --workers 4
+  python cli.py serve --socket /tmp/ciphers.sock
+  python cli.py --profile --metrics json playfair encrypt --key KEY --input big.txt
 """
 
 import argparse
-from typing import Callable, Optional
+import functools
+import os
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
-from CeaserCipher import caesar_encrypt, caesar_decrypt
-from AffineCipher import affine_encrypt, affine_decrypt
-from PlayfairCipher import generate_key_matrix, prepare_plaintext, playfair_crypt
-from RailFenceCipher import rail_fence_encrypt, rail_fence_decrypt
-from RowTranspositionCipher import row_transposition_encrypt, row_transposition_decrypt
-from VigenereCipher import vigenere_encrypt, vigenere_decrypt
+from backends import BACKEND_ENV, BACKENDS, set_backend
+from instrumentation import INSTRUMENT_ENV, metrics_json, metrics_prometheus
+from instrumentation import enable as enable_instrumentation
+from keycache import KEY_CACHE_ENV, resize_key_cache
+from registry import ACTIONS, CIPHERS, Transform
+from streaming import DEFAULT_CHUNK_SIZE, buffered_stream, read_chunks, write_chunks
+
+# The cipher modules and the analysis, batch and service machinery are
+# imported by the command that needs them, so a one-shot command loads only
+# its own cipher (see build_parser for the argument tree)
+
+Pipeline = Callable[[Iterable[str]], Iterator[str]]
+
+METRICS_FORMATS = ("json", "prometheus")
+
+# Functions listed by --profile
+PROFILE_LINES = 30
+
+
+def run_pipeline(args: argparse.Namespace, pipeline: Pipeline) -> None:
+    """
+    Runs a chunk pipeline over --message, or streams --input to --output
+    (stdin/stdout when omitted or given as '-').
+    """
+    if args.message is not None:
+        print("".join(pipeline([args.message])))
+        return
+    source = sys.stdin
+    sink = sys.stdout
+    try:
+        if args.input not in (None, "-"):
+            source = open(args.input, encoding="utf-8", newline="")
+        if args.output not in (None, "-"):
+            sink = open(args.output, "w", encoding="utf-8", newline="")
+        write_chunks(pipeline(read_chunks(source, args.chunk_size)), sink)
+    except OSError as e:
+        raise SystemExit(f"I/O error: {e}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+
+def validate_key(cipher: str, args: argparse.Namespace) -> None:
+    """
+    Rejects keys the cipher cannot use, exiting with a message.
+    """
+    if cipher == "affine" and args.action == "decrypt":
+        from AffineCipher import AffineKeyError, affine_key
+
+        try:
+            affine_key(args.a, args.b)
+        except AffineKeyError as e:
+            raise SystemExit(f"Error: {e}")
+    elif cipher == "vigenere" and not args.key.isalpha():
+        raise SystemExit("Keyword must only contain alphabetic characters.")
+    elif cipher == "railfence" and args.rails < 1:
+        raise SystemExit("Rails must be >= 1")
+    elif cipher == "rowtrans" and (not args.key.isdigit() or len(set(args.key)) != len(args.key)):
+        raise SystemExit("Key must be a sequence of unique digits, e.g., 3142")
 
 
 def cmd_caesar(args: argparse.Namespace) -> None:
-    if args.action == "encrypt":
-        print(caesar_encrypt(args.message, args.shift))
-    else:
-        print(caesar_decrypt(args.message, args.shift))
+    from streaming import caesar_stream
+
+    decrypt = args.action == "decrypt"
+    run_pipeline(args, lambda chunks: caesar_stream(chunks, args.shift, decrypt))
 
 
 def cmd_affine(args: argparse.Namespace) -> None:
-    if args.action == "encrypt":
-        print(affine_encrypt(args.message, args.a, args.b))
-    else:
-        print(affine_decrypt(args.message, args.a, args.b))
+    from streaming import affine_stream
+
+    validate_key("affine", args)
+    decrypt = args.action == "decrypt"
+    run_pipeline(args, lambda chunks: affine_stream(chunks, args.a, args.b, decrypt))
 
 
 def cmd_vigenere(args: argparse.Namespace) -> None:
-    if not args.key.isalpha():
-        raise SystemExit("Keyword must only contain alphabetic characters.")
-    if args.action == "encrypt":
-        print(vigenere_encrypt(args.message, args.key))
-    else:
-        print(vigenere_decrypt(args.message, args.key))
+    from streaming import vigenere_stream
+
+    validate_key("vigenere", args)
+    decrypt = args.action == "decrypt"
+    run_pipeline(args, lambda chunks: vigenere_stream(chunks, args.key, decrypt))
 
 
 def cmd_playfair(args: argparse.Namespace) -> None:
-    key_matrix = generate_key_matrix(args.key)
-    if args.action == "encrypt":
-        pairs = prepare_plaintext(args.message)
-        print(playfair_crypt(pairs, key_matrix, 1))
-    else:
-        # Normalize ciphertext like the interactive CLI
-        norm = args.message.upper().replace(" ", "").replace("J", "I")
-        if len(norm) % 2 == 1:
-            norm += "X"
-        pairs = [norm[i:i + 2] for i in range(0, len(norm), 2)]
-        print(playfair_crypt(pairs, key_matrix, -1))
+    from streaming import playfair_stream
+
+    mode = 1 if args.action == "encrypt" else -1
+    run_pipeline(args, lambda chunks: playfair_stream(chunks, args.key, mode))
 
 
 def cmd_railfence(args: argparse.Namespace) -> None:
-    if args.rails < 1:
-        raise SystemExit("Rails must be >= 1")
-    if args.action == "encrypt":
-        print(rail_fence_encrypt(args.message, args.rails))
-    else:
-        print(rail_fence_decrypt(args.message, args.rails))
+    from RailFenceCipher import rail_fence_decrypt, rail_fence_encrypt
+
+    validate_key("railfence", args)
+    transform = rail_fence_encrypt if args.action == "encrypt" else rail_fence_decrypt
+    run_pipeline(args, lambda chunks: buffered_stream(chunks, lambda t: transform(t, args.rails)))
 
 
 def cmd_rowtrans(args: argparse.Namespace) -> None:
-    if not args.key.isdigit() or len(set(args.key)) != len(args.key):
-        raise SystemExit("Key must be a sequence of unique digits, e.g., 3142")
-    if args.action == "encrypt":
-        print(row_transposition_encrypt(args.message, args.key))
+    from RowTranspositionCipher import row_transposition_decrypt, row_transposition_encrypt
+
+    validate_key("rowtrans", args)
+    transform = (
+        row_transposition_encrypt if args.action == "encrypt" else row_transposition_decrypt
+    )
+    run_pipeline(args, lambda chunks: buffered_stream(chunks, lambda t: transform(t, args.key)))
+
+
+def cmd_pipeline(args: argparse.Namespace) -> None:
+    from pipeline import Pipeline, parse_stage
+
+    try:
+        stages = [parse_stage(spec) for spec in args.stages]
+        for stage in stages:
+            params = dict(zip(CIPHERS[stage.cipher].params, stage.args))
+            validate_key(stage.cipher, argparse.Namespace(action=stage.action, **params))
+        pipeline = Pipeline(stages)
+    except ValueError as e:
+        raise SystemExit(f"Error: {e}")
+    run_pipeline(args, pipeline.stream)
+
+
+def cmd_mmap(args: argparse.Namespace) -> None:
+    from mapped import DEFAULT_WINDOW_SIZE, mmap_transform
+
+    if args.input in (None, "-") or args.output in (None, "-"):
+        raise SystemExit("--mmap needs --input and --output files")
+    validate_key(args.cipher, args)
+    try:
+        # Ciphers that cannot run mapped have no tuning options; mmap_transform
+        # rejects them with the list of those that can
+        window_size = getattr(args, "window_size", None)
+        if window_size is None:
+            window_size = DEFAULT_WINDOW_SIZE
+        mmap_transform(args.input, args.output, args.cipher, args.action, vars(args),
+                       getattr(args, "workers", None), window_size)
+    except OSError as e:
+        raise SystemExit(f"I/O error: {e}")
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    from batch import run_batch
+
+    try:
+        transform = Transform(args.batch_cipher, args.action, vars(args))
+    except ValueError as e:
+        raise SystemExit(str(e))
+    validate_key(args.batch_cipher, args)
+    source = sys.stdin
+    sink = sys.stdout
+    try:
+        if args.input not in (None, "-"):
+            source = open(args.input, encoding="utf-8", newline="")
+        if args.output not in (None, "-"):
+            sink = open(args.output, "w", encoding="utf-8", newline="")
+        stats = run_batch(source, sink, transform, args.format, args.workers, args.chunk_size)
+    except OSError as e:
+        raise SystemExit(f"I/O error: {e}")
+    except ValueError as e:
+        raise SystemExit(f"Invalid record: {e}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    print(
+        f"Processed {stats.records} records in {stats.seconds:.3f}s "
+        f"({stats.records_per_second:.0f} records/sec)",
+        file=sys.stderr,
+    )
+    cache = stats.key_cache
+    print(
+        f"Key cache: {cache.hits} hits, {cache.misses} misses, {cache.evictions} evictions "
+        f"across workers ({cache.hit_rate:.1%} hit rate)",
+        file=sys.stderr,
+    )
+
+
+def read_input(args: argparse.Namespace) -> str:
+    """
+    Returns --message, or the whole of --input (stdin when omitted or '-').
+    """
+    if args.message is not None:
+        return str(args.message)
+    if args.input in (None, "-"):
+        return sys.stdin.read()
+    try:
+        with open(args.input, encoding="utf-8", newline="") as f:
+            return f.read()
+    except OSError as e:
+        raise SystemExit(f"I/O error: {e}")
+
+
+def cmd_analyze(args: argparse.Namespace) -> None:
+    if args.wordlist:
+        from dictionary_attack import DICTIONARY_CIPHERS, dictionary_attack
+
+        if args.cipher_type not in DICTIONARY_CIPHERS:
+            raise SystemExit("--wordlist needs --cipher vigenere or --cipher playfair")
+        threshold = None if args.exhaustive else args.threshold
+        try:
+            matches = dictionary_attack(read_input(args), args.cipher_type, args.wordlist,
+                                        args.top, args.workers, threshold)
+        except (OSError, ValueError) as e:
+            raise SystemExit(str(e))
+        for rank, match in enumerate(matches, 1):
+            preview = match.plaintext[:60].replace("\n", " ")
+            print(f"{rank}. {match.cipher} key={match.key} score={match.score:.3f}  {preview}")
+        return
+    if args.cipher_type == "vigenere":
+        from vigenere_analysis import recover_key
+        from VigenereCipher import vigenere_decrypt
+
+        ciphertext = read_input(args)
+        try:
+            solution = recover_key(ciphertext, args.max_key_length)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        preview = vigenere_decrypt(ciphertext[:60], solution.key).replace("\n", " ")
+        print(f"1. vigenere key={solution.key} ioc={solution.ioc:.4f}  {preview}")
+        return
+    if args.cipher_type == "playfair":
+        from playfair_solver import solve_playfair
+
+        try:
+            for improved in solve_playfair(read_input(args), args.restarts,
+                                           args.iterations, args.workers):
+                preview = improved.plaintext[:60]
+                print(f"restart {improved.restart}: playfair key={improved.key} "
+                      f"score={improved.score:.1f}  {preview}", flush=True)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        return
+    from analysis import analyze
+    from transposition_analysis import analyze_rail_fence, analyze_row_transposition
+
+    if args.cipher_type == "railfence":
+        candidates = analyze_rail_fence(read_input(args), args.top, args.max_rails)
+    elif args.cipher_type == "rowtrans":
+        try:
+            candidates = analyze_row_transposition(read_input(args), args.top,
+                                                   args.max_columns, args.workers)
+        except ValueError as e:
+            raise SystemExit(str(e))
     else:
-        print(row_transposition_decrypt(args.message, args.key))
+        ciphers = ("caesar", "affine") if args.cipher_type == "all" else (args.cipher_type,)
+        threshold = None if args.exhaustive else args.threshold
+        candidates = analyze(read_input(args), ciphers, args.top, args.workers, threshold)
+    for rank, candidate in enumerate(candidates, 1):
+        if candidate.cipher == "caesar":
+            key = f"shift={candidate.key[0]}"
+        elif candidate.cipher == "railfence":
+            key = f"rails={candidate.key[0]}"
+        elif candidate.cipher == "rowtrans":
+            key = "key=" + "".join(map(str, candidate.key))
+        else:
+            key = f"a={candidate.key[0]} b={candidate.key[1]}"
+        preview = candidate.plaintext[:60].replace("\n", " ")
+        print(f"{rank}. {candidate.cipher} {key} score={candidate.score:.3f}  {preview}")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Unified CLI for classic ciphers")
-    subparsers = parser.add_subparsers(dest="cipher", required=True)
+def cmd_stats(args: argparse.Namespace) -> None:
+    from fitness import ENGLISH_IOC, RANDOM_IOC
+    from ngram_stats import NgramCounts, count_chunks, count_file
 
-    # Caesar
-    p = subparsers.add_parser("caesar", help="Caesar cipher")
-    p_sub = p.add_subparsers(dest="action", required=True)
-    for action in ("encrypt", "decrypt"):
-        sp = p_sub.add_parser(action)
-        sp.add_argument("--shift", type=int, required=True)
-        sp.add_argument("--message", type=str, required=True)
-        sp.set_defaults(func=cmd_caesar)
+    try:
+        if args.message is not None:
+            counts = NgramCounts.from_text(args.message)
+        elif args.input in (None, "-"):
+            counts = count_chunks(read_chunks(sys.stdin, args.chunk_size))
+        else:
+            counts = count_file(args.input, args.workers, chunk_size=args.chunk_size)
+        for path in args.add or ():
+            counts.merge(NgramCounts.load(path), contiguous=False)
+        if args.save:
+            counts.save(args.save)
+    except OSError as e:
+        raise SystemExit(f"I/O error: {e}")
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"letters: {counts.total}")
+    print(f"index of coincidence: {counts.index_of_coincidence():.4f} "
+          f"(English {ENGLISH_IOC:.4f}, random {RANDOM_IOC:.4f})")
+    print(f"chi-squared vs English: {counts.chi_squared():.1f}")
+    print(f"quadgram fitness: {counts.fitness():.3f}")
+    for size, name in ((1, "letters"), (2, "bigrams"), (4, "quadgrams")):
+        common = " ".join(f"{ngram}={n}" for ngram, n in counts.most_common(size, args.top))
+        print(f"top {name}: {common}")
 
-    # Affine
-    p = subparsers.add_parser("affine", help="Affine cipher")
-    p_sub = p.add_subparsers(dest="action", required=True)
-    for action in ("encrypt", "decrypt"):
-        sp = p_sub.add_parser(action)
-        sp.add_argument("--a", type=int, required=True)
-        sp.add_argument("--b", type=int, required=True)
-        sp.add_argument("--message", type=str, required=True)
-        sp.set_defaults(func=cmd_affine)
 
-    # Vigenere
-    p = subparsers.add_parser("vigenere", help="Vigenere cipher")
-    p_sub = p.add_subparsers(dest="action", required=True)
-    for action in ("encrypt", "decrypt"):
-        sp = p_sub.add_parser(action)
-        sp.add_argument("--key", type=str, required=True)
-        sp.add_argument("--message", type=str, required=True)
-        sp.set_defaults(func=cmd_vigenere)
+def cmd_serve(args: argparse.Namespace) -> None:
+    import asyncio
 
-    # Playfair
-    p = subparsers.add_parser("playfair", help="Playfair cipher")
-    p_sub = p.add_subparsers(dest="action", required=True)
-    for action in ("encrypt", "decrypt"):
-        sp = p_sub.add_parser(action)
-        sp.add_argument("--key", type=str, required=True)
-        sp.add_argument("--message", type=str, required=True)
-        sp.set_defaults(func=cmd_playfair)
+    from service import serve
+
+    where = args.socket or f"{args.host}:{args.port}"
+    print(f"Serving JSON-lines cipher requests on {where}", file=sys.stderr)
+    try:
+        asyncio.run(serve(args.socket, args.host, args.port, args.workers))
+    except OSError as e:
+        raise SystemExit(f"I/O error: {e}")
+    except KeyboardInterrupt:
+        pass
+
+
+def run_profiled(func: Callable[[argparse.Namespace], None], args: argparse.Namespace) -> None:
+    """
+    Runs a command under cProfile, then prints the functions with the most
+    cumulative time to stderr and saves the raw stats if asked.
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(func, args)
+    finally:
+        if args.profile_output:
+            profiler.dump_stats(args.profile_output)
+        if args.profile:
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats("cumulative").print_stats(PROFILE_LINES)
+
+
+def add_io_arguments(parser: argparse.ArgumentParser, mapped: bool = False) -> None:
+    """
+    Adds the shared message/stream arguments to an action subparser, and the
+    --mmap tuning options for ciphers that can run memory-mapped.
+    """
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--message", type=str)
+    source.add_argument("--input", type=str, help="input file ('-' or omitted for stdin)")
+    parser.add_argument("--output", type=str, help="output file ('-' or omitted for stdout)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="characters read per chunk when streaming")
+    parser.add_argument("--mmap", action="store_true",
+                        help="memory-map --input/--output and process them as ASCII bytes")
+    if mapped:
+        parser.add_argument("--window-size", type=int, default=None,
+                            help="bytes per mapped window (--mmap, default: 64 MiB)")
+        parser.add_argument("--workers", type=int, default=None,
+                            help="worker processes for --mmap "
+                                 "(default: one per CPU, 1 runs inline)")
+
+
+KeyArguments = Tuple[Tuple[str, Type[object]], ...]
+
+# The ciphers in mapped.MAPPED_CIPHERS, named here so building the parser
+# does not import their modules
+MAPPED_CIPHER_NAMES = ("caesar", "affine", "vigenere")
+
+# Options that only mean something with --mmap
+MMAP_OPTIONS = (("window_size", "--window-size"), ("workers", "--workers"))
+
+# cipher -> (help, key options, command)
+CIPHER_COMMANDS: Dict[str, Tuple[str, KeyArguments, Callable[[argparse.Namespace], None]]] = {
+    "caesar": ("Caesar cipher", (("--shift", int),), cmd_caesar),
+    "affine": ("Affine cipher", (("--a", int), ("--b", int)), cmd_affine),
+    "vigenere": ("Vigenere cipher", (("--key", str),), cmd_vigenere),
+    "playfair": ("Playfair cipher", (("--key", str),), cmd_playfair),
+    "railfence": ("Rail Fence cipher", (("--rails", int),), cmd_railfence),
+    "rowtrans": ("Row Transposition cipher", (("--key", str),), cmd_rowtrans),
+}
 
-    # Rail Fence
-    p = subparsers.add_parser("railfence", help="Rail Fence cipher")
-    p_sub = p.add_subparsers(dest="action", required=True)
-    for action in ("encrypt", "decrypt"):
-        sp = p_sub.add_parser(action)
-        sp.add_argument("--rails", type=int, required=True)
-        sp.add_argument("--message", type=str, required=True)
-        sp.set_defaults(func=cmd_railfence)
 
-    # Row Transposition
-    p = subparsers.add_parser("rowtrans", help="Row Transposition cipher")
+def add_cipher_arguments(p: argparse.ArgumentParser, cipher: str) -> None:
+    _, key_arguments, func = CIPHER_COMMANDS[cipher]
     p_sub = p.add_subparsers(dest="action", required=True)
-    for action in ("encrypt", "decrypt"):
+    for action in ACTIONS:
         sp = p_sub.add_parser(action)
-        sp.add_argument("--key", type=str, required=True)
-        sp.add_argument("--message", type=str, required=True)
-        sp.set_defaults(func=cmd_rowtrans)
+        for option, kind in key_arguments:
+            sp.add_argument(option, type=kind, required=True)
+        add_io_arguments(sp, mapped=cipher in MAPPED_CIPHER_NAMES)
+        sp.set_defaults(func=func)
 
+
+def add_pipeline_arguments(p: argparse.ArgumentParser) -> None:
+    p.add_argument("stages", nargs="+", metavar="cipher:action:name=value,...",
+                   help="stages in order, "
+                        "e.g. vigenere:encrypt:key=LEMON railfence:encrypt:rails=3")
+    source = p.add_mutually_exclusive_group()
+    source.add_argument("--message", type=str)
+    source.add_argument("--input", type=str, help="input file ('-' or omitted for stdin)")
+    p.add_argument("--output", type=str, help="output file ('-' or omitted for stdout)")
+    p.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                   help="characters read per chunk when streaming")
+    p.set_defaults(func=cmd_pipeline)
+
+
+def add_analyze_arguments(p: argparse.ArgumentParser) -> None:
+    from analysis import DEFAULT_THRESHOLD
+    from playfair_solver import DEFAULT_ITERATIONS, DEFAULT_RESTARTS
+    from transposition_analysis import MAX_COLUMNS, MAX_RAILS
+    from vigenere_analysis import MAX_KEY_LENGTH
+
+    source = p.add_mutually_exclusive_group()
+    source.add_argument("--message", type=str)
+    source.add_argument("--input", type=str, help="input file ('-' or omitted for stdin)")
+    p.add_argument("--cipher", dest="cipher_type",
+                   choices=("caesar", "affine", "all", "vigenere", "playfair", "railfence",
+                            "rowtrans"),
+                   default="all", help="cipher to attack (default: all = Caesar and Affine)")
+    p.add_argument("--top", type=int, default=5, help="number of candidates to show")
+    p.add_argument("--workers", type=int, default=None,
+                   help="worker processes (default: one per CPU, 1 runs inline)")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                   help="stop once a candidate's average quadgram score reaches this")
+    p.add_argument("--exhaustive", action="store_true", help="score every key, no early stop")
+    p.add_argument("--wordlist", type=str,
+                   help="try each word of this file as a Vigenere or Playfair key")
+    p.add_argument("--max-key-length", type=int, default=MAX_KEY_LENGTH,
+                   help="longest Vigenere key considered")
+    p.add_argument("--restarts", type=int, default=DEFAULT_RESTARTS,
+                   help="independent Playfair annealing runs")
+    p.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                   help="annealing steps per Playfair restart")
+    p.add_argument("--max-rails", type=int, default=MAX_RAILS,
+                   help="most Rail Fence rails considered")
+    p.add_argument("--max-columns", type=int, default=MAX_COLUMNS,
+                   help="most Row Transposition columns considered")
+    p.set_defaults(func=cmd_analyze)
+
+
+def add_batch_arguments(p: argparse.ArgumentParser) -> None:
+    from batch import DEFAULT_BATCH_CHUNK_SIZE, FORMATS
+
+    p.add_argument("batch_cipher", choices=sorted(CIPHERS), metavar="cipher")
+    p.add_argument("action", choices=ACTIONS)
+    p.add_argument("--shift", type=int)
+    p.add_argument("--a", type=int)
+    p.add_argument("--b", type=int)
+    p.add_argument("--key", type=str)
+    p.add_argument("--rails", type=int)
+    p.add_argument("--input", type=str, help="input file ('-' or omitted for stdin)")
+    p.add_argument("--output", type=str, help="output file ('-' or omitted for stdout)")
+    p.add_argument("--format", choices=FORMATS, default="lines",
+                   help="plain lines, or JSON lines (strings or objects with a 'text' field)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="worker processes (default: one per CPU, 1 runs inline)")
+    p.add_argument("--chunk-size", type=int, default=DEFAULT_BATCH_CHUNK_SIZE,
+                   help="records sent to a worker at a time")
+    p.set_defaults(func=cmd_batch)
+
+
+def add_stats_arguments(p: argparse.ArgumentParser) -> None:
+    source = p.add_mutually_exclusive_group()
+    source.add_argument("--message", type=str)
+    source.add_argument("--input", type=str, help="input file ('-' or omitted for stdin)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="worker processes for --input files (default: one per CPU)")
+    p.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                   help="bytes read at a time")
+    p.add_argument("--save", type=str, help="write the counts to this file")
+    p.add_argument("--add", type=str, action="append",
+                   help="merge in counts saved by an earlier --save (repeatable)")
+    p.add_argument("--top", type=int, default=10, help="n-grams listed per size")
+    p.set_defaults(func=cmd_stats)
+
+
+def add_serve_arguments(p: argparse.ArgumentParser) -> None:
+    from service import DEFAULT_HOST, DEFAULT_PORT
+
+    p.add_argument("--socket", type=str, help="Unix domain socket path (default: TCP)")
+    p.add_argument("--host", type=str, default=DEFAULT_HOST)
+    p.add_argument("--port", type=int, default=DEFAULT_PORT)
+    p.add_argument("--workers", type=int, default=None,
+                   help="worker processes for long texts (default: one per CPU)")
+    p.set_defaults(func=cmd_serve)
+
+
+# command -> (help, adds its arguments)
+COMMANDS: Dict[str, Tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    **{
+        cipher: (help_text, functools.partial(add_cipher_arguments, cipher=cipher))
+        for cipher, (help_text, _, _) in CIPHER_COMMANDS.items()
+    },
+    "pipeline": ("Chain several cipher stages, fusing them where possible",
+                 add_pipeline_arguments),
+    "analyze": ("Recover keys: Caesar/Affine by brute force, Vigenere, Playfair, Rail Fence "
+                "or Row Transposition with --cipher", add_analyze_arguments),
+    "batch": ("Encrypt/decrypt one record per line in parallel", add_batch_arguments),
+    "stats": ("Count letters, bigrams and quadgrams of a text", add_stats_arguments),
+    "serve": ("Serve cipher requests over a local socket", add_serve_arguments),
+}
+
+# Top-level options that take a value, skipped when looking for the command
+VALUE_OPTIONS = ("--backend", "--key-cache-size", "--profile-output", "--metrics")
+
+
+def selected_command(argv: List[str]) -> Optional[str]:
+    """
+    Returns the command named on the command line, or None if there is none
+    (e.g. plain --help).
+    """
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in VALUE_OPTIONS:
+            skip = True
+        elif not arg.startswith("-"):
+            return arg if arg in COMMANDS else None
+    return None
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Builds the argument parser. With a command, only that command's
+    arguments are added (and only its defaults imported); the others are
+    still listed by name and help.
+    """
+    parser = argparse.ArgumentParser(description="Unified CLI for classic ciphers")
+    parser.add_argument("--backend", choices=sorted(set(BACKENDS) | {"numpy"}), default=None,
+                        help="substitution cipher backend (default: auto)")
+    parser.add_argument("--key-cache-size", type=int, default=None,
+                        help="prepared keys kept per process (default: 512, 0 disables)")
+    parser.add_argument("--profile", action="store_true",
+                        help="print a cProfile report of the run to stderr")
+    parser.add_argument("--profile-output", type=str, default=None,
+                        help="also save the raw profile to this file (for pstats)")
+    parser.add_argument("--metrics", choices=METRICS_FORMATS, default=None,
+                        help="record per-cipher calls, sizes and phase timings and print "
+                             "them to stderr")
+    subparsers = parser.add_subparsers(dest="cipher", required=True)
+    for name, (help_text, add_arguments) in COMMANDS.items():
+        p = subparsers.add_parser(name, help=help_text)
+        if command is None or name == command:
+            add_arguments(p)
     return parser
 
 
-def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+def main(argv: Optional[List[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(selected_command(argv))
+    args = parser.parse_args(argv)
+    if args.backend is not None:
+        try:
+            set_backend(args.backend)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        # Worker processes pick the backend up from the environment
+        os.environ[BACKEND_ENV] = args.backend
+    if args.key_cache_size is not None:
+        try:
+            resize_key_cache(args.key_cache_size)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        os.environ[KEY_CACHE_ENV] = str(args.key_cache_size)
     func: Optional[Callable[[argparse.Namespace], None]] = getattr(args, "func", None)
+    if getattr(args, "mmap", False):
+        func = cmd_mmap
+    elif hasattr(args, "mmap"):
+        given = [option for name, option in MMAP_OPTIONS if getattr(args, name, None) is not None]
+        if given:
+            parser.error(f"{' and '.join(given)} can only be used with --mmap")
     if func is None:
         parser.print_help()
         raise SystemExit(2)
-    func(args)
+    if args.metrics is not None:
+        enable_instrumentation()
+        os.environ[INSTRUMENT_ENV] = "1"
+    try:
+        if args.profile or args.profile_output:
+            run_profiled(func, args)
+        else:
+            func(args)
+    finally:
+        if args.metrics == "json":
+            print(metrics_json(), file=sys.stderr)
+        elif args.metrics == "prometheus":
+            print(metrics_prometheus(), end="", file=sys.stderr)
 
 
 if __name__ == "__main__":
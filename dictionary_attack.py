@@ -0,0 +1,282 @@
+"""
+Wordlist attack on Vigenère and Playfair keywords.
+
+Real keywords usually come from a dictionary, so trying every word of a
+wordlist beats the statistical solvers whenever the key is in it. The
+wordlist is streamed from disk one line at a time, and each word is first
+normalized to the key it actually produces:
+
+- Vigenère: its letters, upper-cased, cut to their shortest repeating unit
+  ("abab" encrypts exactly like "AB").
+- Playfair: its letters, upper-cased with J folded into I, first
+  occurrences only, which is all the key square depends on.
+
+Words that normalize to a key already tried are skipped, so plurals,
+capitalized duplicates and J/I spellings cost nothing.
+
+Each key is scored by the quadgram fitness of a decrypted ciphertext prefix
+of about PREFIX_LETTERS letters. Only the best `top` keys are then
+decrypted in full and ranked by the fitness of the whole text. Batches of
+keys are scored in a process pool. A shared event stops every worker as
+soon as one finds a prefix scoring above the threshold.
+"""
+
+import heapq
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from analysis import DEFAULT_THRESHOLD
+from batch import _chunked
+from fitness import fitness, score_indices
+from playfair_solver import ALPHABET, Square, decrypt_score
+from PlayfairCipher import normalize_text, playfair_decrypt
+from vigenere_analysis import position_codes
+from VigenereCipher import vigenere_decrypt
+
+DICTIONARY_CIPHERS = ("vigenere", "playfair")
+
+# Ciphertext letters decrypted and scored per key
+PREFIX_LETTERS = 120
+
+# Keys sent to a worker at a time, and how often a worker checks for a stop
+BATCH_SIZE = 2000
+STOP_CHECK_INTERVAL = 256
+
+# Letter index -> index shifted back by s, for each Vigenère shift s;
+# 255 (a non-letter position) is kept
+_UNSHIFT = [bytes((x - s) % 26 if x < 26 else x for x in range(256)) for s in range(26)]
+
+Scored = Tuple[float, str]
+
+# Set in each worker process by _init_worker; inline runs use their own
+_stop_event: Any = None
+
+
+class DictionaryMatch(NamedTuple):
+    score: float
+    cipher: str
+    key: str
+    plaintext: str
+
+
+def read_words(path: str, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Yields the stripped, non-empty lines of a wordlist file, one at a time.
+    """
+    with open(path, encoding=encoding, errors="ignore") as f:
+        for line in f:
+            word = line.strip()
+            if word:
+                yield word
+
+
+def vigenere_key(word: str) -> str:
+    """
+    Returns the upper-case letters of a word cut to their shortest repeating
+    unit, or "" if it has no letters.
+    """
+    key = "".join(char for char in word.upper() if 'A' <= char <= 'Z')
+    for period in range(1, len(key)):
+        if len(key) % period == 0 and key == key[:period] * (len(key) // period):
+            return key[:period]
+    return key
+
+
+def playfair_key(word: str) -> str:
+    """
+    Returns the distinct letters of a word in order of first appearance, with
+    J folded into I: the part of the key square the word determines.
+    """
+    return "".join(dict.fromkeys(char for char in normalize_text(word) if char in ALPHABET))
+
+
+def unique_keys(words: Iterable[str], normalize: Callable[[str], str]) -> Iterator[str]:
+    """
+    Yields each distinct non-empty normalized key once, in wordlist order.
+    """
+    seen: Set[str] = set()
+    for word in words:
+        key = normalize(word)
+        if key and key not in seen:
+            seen.add(key)
+            yield key
+
+
+def vigenere_prefix(ciphertext: str, letters: int = PREFIX_LETTERS) -> bytes:
+    """
+    Returns the position codes (letter index or 255, see vigenere_analysis)
+    of the shortest ciphertext prefix holding this many letters. Vigenère
+    advances the key on every character, so positions are kept.
+    """
+    codes = position_codes(ciphertext)
+    seen = 0
+    for i, code in enumerate(codes):
+        if code != 255:
+            seen += 1
+            if seen == letters:
+                return codes[:i + 1]
+    return codes
+
+
+def playfair_letters(ciphertext: str) -> str:
+    """
+    Drops everything but the letters of a Playfair ciphertext (J counts as
+    I), as solve_playfair does.
+    """
+    letters = "".join(char for char in normalize_text(ciphertext) if char in ALPHABET)
+    if len(letters) < 4 or len(letters) % 2:
+        raise ValueError("Ciphertext needs an even number of letters, at least four.")
+    return letters
+
+
+def playfair_prefix(letters: str, count: int = PREFIX_LETTERS) -> List[int]:
+    """
+    Returns the first count letters, rounded down to whole digraphs, as
+    indices 0-25.
+    """
+    return [ord(char) - ord('A') for char in letters[:max(count - count % 2, 4)]]
+
+
+def score_vigenere(prefix: bytes, key: str) -> float:
+    """
+    Average quadgram score of the prefix decrypted with this key.
+    """
+    plain = bytearray(prefix)
+    period = len(key)
+    for j in range(min(period, len(prefix))):
+        plain[j::period] = prefix[j::period].translate(_UNSHIFT[ord(key[j]) - ord('A')])
+    indices = bytes(plain).translate(None, b"\xff")
+    return score_indices(indices) / max(len(indices) - 3, 1)
+
+
+def score_playfair(prefix: List[int], key: str) -> float:
+    """
+    Average quadgram score of the prefix decrypted with this key.
+    """
+    square = Square("".join(dict.fromkeys(key + ALPHABET)))
+    plain = [0] * len(prefix)
+    return decrypt_score(square, prefix, plain) / max(len(prefix) - 3, 1)
+
+
+def _init_worker(stop_event: Any) -> None:
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _score_batch(
+    cipher: str, prefix: Any, keys: List[str], top: int, threshold: Optional[float]
+) -> List[Scored]:
+    """
+    Scores a batch of keys, keeping the best `top`. Sets the stop event when
+    a key reaches the threshold, and returns early once it is set.
+    """
+    score = score_vigenere if cipher == "vigenere" else score_playfair
+    best: List[Scored] = []
+    for i, key in enumerate(keys):
+        if i % STOP_CHECK_INTERVAL == 0 and _stop_event is not None and _stop_event.is_set():
+            break
+        item = (score(prefix, key), key)
+        if len(best) < top:
+            heapq.heappush(best, item)
+        else:
+            heapq.heappushpop(best, item)
+        if threshold is not None and item[0] >= threshold and _stop_event is not None:
+            _stop_event.set()
+    return best
+
+
+def dictionary_attack(
+    ciphertext: str,
+    cipher: str,
+    wordlist: Union[str, Iterable[str]],
+    top: int = 5,
+    workers: Optional[int] = None,
+    threshold: Optional[float] = DEFAULT_THRESHOLD,
+    prefix_letters: int = PREFIX_LETTERS,
+    batch_size: int = BATCH_SIZE,
+) -> List[DictionaryMatch]:
+    """
+    Tries every distinct key from a wordlist (a file path, or any iterable
+    of words) and returns the best `top` matches, best first.
+
+    workers=None uses one process per CPU and workers=1 scores inline. With
+    threshold=None every word is tried; otherwise the search stops once a
+    prefix scores at least the threshold.
+    """
+    global _stop_event
+    if cipher not in DICTIONARY_CIPHERS:
+        raise ValueError(f"Dictionary attacks support: {', '.join(DICTIONARY_CIPHERS)}")
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    words = read_words(wordlist) if isinstance(wordlist, str) else iter(wordlist)
+    prefix: Any
+    if cipher == "vigenere":
+        prefix = vigenere_prefix(ciphertext, prefix_letters)
+        if not prefix.translate(None, b"\xff"):
+            raise ValueError("Ciphertext has no letters to analyze.")
+        keys = unique_keys(words, vigenere_key)
+    else:
+        letters = playfair_letters(ciphertext)
+        keys = unique_keys(words, playfair_key)
+        prefix = playfair_prefix(letters, prefix_letters)
+    best: List[Scored] = []
+
+    def collect(scored: List[Scored]) -> None:
+        for item in scored:
+            if len(best) < top:
+                heapq.heappush(best, item)
+            else:
+                heapq.heappushpop(best, item)
+
+    stop = multiprocessing.Event()
+    if workers == 1:
+        previous, _stop_event = _stop_event, stop
+        try:
+            for batch in _chunked(keys, batch_size):
+                collect(_score_batch(cipher, prefix, batch, top, threshold))
+                if stop.is_set():
+                    break
+        finally:
+            _stop_event = previous
+    else:
+        workers = workers or os.cpu_count() or 1
+        # As in batch_transform: a few batches per worker queued, and the
+        # wordlist read no further ahead than that
+        max_in_flight = 2 * workers
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(stop,)) as executor:
+            pending: Deque[Future[List[Scored]]] = deque()
+            for batch in _chunked(keys, batch_size):
+                if stop.is_set():
+                    break
+                pending.append(executor.submit(_score_batch, cipher, prefix, batch, top,
+                                               threshold))
+                if len(pending) >= max_in_flight:
+                    collect(pending.popleft().result())
+            while pending:
+                collect(pending.popleft().result())
+
+    matches = []
+    for _, key in best:
+        if cipher == "vigenere":
+            plaintext = vigenere_decrypt(ciphertext, key)
+        else:
+            plaintext = playfair_decrypt(letters, key)
+        matches.append(DictionaryMatch(fitness(plaintext), cipher, key, plaintext))
+    matches.sort(key=lambda match: (-match.score, match.key))
+    return matches
@@ -0,0 +1,622 @@
+"""
+English quadgram counts used for fitness scoring.
+
+The 8000 most frequent letter quadgrams in Isaac Newton's "Opticks"
+(Project Gutenberg, public domain), counted over the text upper-cased with
+everything but A-Z removed. Each entry is the quadgram followed by its count.
+"""
+
+TOTAL_QUADGRAMS = 436704
+
+QUADGRAM_COUNTS = """
+OFTH2747 FTHE2661 THER2629 NTHE1991 THES1791 TION1644 OTHE1486 HERE1428 THAT1350 DTHE1170
+NDTH1162 IGHT1155 ANDT1148 TTHE1131 INTH1115 ETHE1027 COLO1008 OLOU997 LOUR997 WHIC991 HICH991
+REFR945 EFRA935 THEI870 THEP867 LIGH855 SOFT853 RACT852 SAND790 STHE786 FROM776 THEM764 THEC763
+WITH757 TOTH748 FRAC732 EAND726 ATTH678 EREF677 PART671 THEL663 RAYS661 ACTI659 OURS657 YTHE640
+STAN638 ESOF617 THEF616 BYTH594 HESE590 THIS568 HEIR566 THAN564 EOFT560 RTHE559 ONTH558 CTIO545
+TAND544 IONS531 INGT524 EFOR514 NGTH510 ERTH510 HTHE509 DIST508 MTHE508 THEY497 HERA497 ATIO495
+HECO494 ROMT493 THET490 OMTH487 EFLE486 REFL484 RING484 ANCE482 CTED474 GLAS474 LASS474 HOSE462
+ERAY460 ENTH458 TANC452 ECOL452 TOFT451 ENCE446 THED441 THEO435 GREE426 HATT425 IONO419 RISM419
+HESA418 RAND416 THEB415 OUGH412 PRIS412 ECON408 ONOF405 PROP399 EDTH396 TING394 THOS393 ISTA392
+DAND391 MORE381 ERIN381 ATER378 INTO374 WILL373 INGS366 WHEN366 OUND366 SIDE363 NOTH357 SAME355
+EVER353 UPON352 LECT351 FORE349 RETH349 ESAM346 THEE345 APPE345 HELI344 HITE344 VERY342 WHIT342
+NTER340 THEA339 THEG337 EINT336 GTHE335 ANDI333 HEFI333 ANDB333 IRST329 ANDS328 FIRS328 LLOW328
+HETH323 INTE318 PPEA315 PEAR315 FLEC312 THIN312 HEDI311 RANG311 NOFT310 DINT308 MENT307 NESS306
+ERAN305 ESAN304 THEN302 EDIN301 ANDA300 ANOT297 SINT297 BLUE295 SPEC294 REAT292 COMP292 TSOF292
+APER291 WERE290 EGRE290 THEW288 ATED286 ROUG286 MADE285 IFTH285 ETHI282 ELIG280 LINE279 HEPR279
+OULD278 TOBE277 SWHI276 BEIN275 NEAN275 NAND271 THRO270 HROU268 ETHA267 HEPA266 ECTE264 DTHA263
+ONEA263 SOME262 INCI261 ESIN260 GREA259 EPAR259 IONA258 EFIR258 RTHA255 ERED254 MOST254 EDIS251
+SECO251 LTHE250 PAPE249 EDAN248 CHTH248 WHER248 ESTH248 ARTO247 LLTH246 PERI244 IDEN244 ETWE244
+HELE243 ROPO242 TRAN242 UGHT242 IBLE242 EING240 WATE240 EENT239 HATI237 CONS237 HESU237 EQUA237
+EDBY236 ARTS235 CIRC234 NDIN233 OFAN233 INCH233 BETW233 ELLO233 MEDI232 EWHI231 WEEN231 ALLT230
+RANS230 HESP230 TWEE230 EXPE229 CEOF229 QUAL229 HERI228 CIDE227 RTOF226 XPER226 BODI226 ODIE226
+DIES226 SARE226 NCID226 ESPE226 HAVE225 ORTH225 LESS224 THTH223 YELL223 ERAL222 ABOU220 NGLE220
+HENT220 SERV219 CONT218 HANT218 REFO217 FALL217 STHA215 EPRI214 SEVE214 CLES214 ICHT213 VIOL213
+IOLE213 ACTE212 OLET212 TURE212 BOUT210 ERVA210 ECOM209 DWIT209 PLAC209 ASTH209 EATE208 HEGL208
+EGLA208 ETER208 DBYT207 ANGI207 INGE206 EANO205 HEFO204 PASS204 FTER203 LACE203 PONT203 TERT202
+ESEC202 REAS202 TWHI202 TREF202 FRAN201 NGIB201 ANTH201 NCEO201 ALSO200 OMPO200 BSER200 STIN200
+OBSE199 EPAP199 REEN199 DING198 WARD198 AFTE197 INES197 POSI196 SITI196 HEIN196 ORTI195 SSES195
+THEH195 VERA194 ASSE194 ANGL192 ULAR192 EOTH192 ANIN191 LEXI191 LLBE191 ITIO190 IMEN190 THOU190
+NCES190 FLEX190 ITHT189 ERIM188 ESSI188 INGA187 FORM187 EREA187 ALLY187 NTHA187 LATE186 ANGE186
+RTSO185 ASTO185 MUCH185 OSIT184 COND184 ARTH184 EARE184 TERO184 YREF184 HESI183 NDBY183 FORT182
+ARDS182 EDIA182 RIME181 RATI181 EROF181 TIME180 SUCH180 CAUS179 ESUN178 EREN178 TEDT178 IONT178
+EPLA178 STRE178 EXIO178 XION178 SINE178 SOFA178 COME177 RTIO177 ANDW176 NEOF176 PORT175 SETH175
+FFER175 YAND174 AMET174 ERET174 DIFF174 IMAG174 ANDC173 HERS173 OPOR173 HEMI173 HAND172 ARTI172
+OUTO171 AUSE171 SOTH171 HOLE171 THIC171 HING170 ONSO170 LIQU170 UTTH169 TINT169 HICK169 SION168
+EPRO168 CTIN168 GHTH168 ANDR167 INGO167 MAGE167 TEDA166 RINT165 ITHO165 ONAN165 ESSO164 PARA164
+THEV164 NDRE163 PECT163 LITT163 ITTL163 TTLE163 REOF162 ANDF162 ROFT162 ONSI161 FLIG161 OTHA161
+FTHI161 EDTO160 PRES160 WOUL160 RCLE160 GHTO159 ISTH159 UTOF158 INGI158 SING158 LIKE158 IRCL158
+MOTI158 OTIO158 RSOF157 ANDL157 NDSO157 ORDE157 CHAN157 ALLE157 ISTI157 TEDB156 NSOF156 TINC156
+OFLI155 AYBE155 HEMO155 MAYB154 ORET154 SSOF154 GHTA154 OINT153 FERE153 ELEN153 BECO152 RALL152
+METE152 ECTI151 HERT151 JECT151 BEFO150 MAKE150 AINT150 DENC150 ENSI150 SWHE150 CKNE150 ITHA149
+KNES149 PEND148 TOFA148 ICUL148 GHTW147 REDA147 SSIN147 READ146 KING146 TERA146 DIAM146 ICKN146
+NINC146 HALL145 CULA145 HEOT145 ISMA144 EFRO144 NTOT144 GIBL144 GHTT143 ICHI143 EDWI143 POSE143
+LEAS143 MAND143 ALIT143 RDER142 OMET141 ESTO141 URFA141 FACE141 SORT141 NTRA141 ANDM140 RVAT140
+VATI140 DFRO140 SURF140 RFAC140 DEGR140 ITHE139 IMES139 ENDI139 EBYT139 RTIC139 OFRE138 ILLU138
+SPAR138 IFFE138 PERP137 IDES137 IAME137 ILLB137 HOUT136 ARED136 BECA136 ANDD136 SENS136 ENTA135
+SSTH135 AYSA135 INEO135 EREI135 ERES134 REST134 UMIN134 DARK134 HEMA133 EAST133 REAN133 ANSM133
+ESEN132 TERM132 LEOF132 ENTE132 ENSE131 THIR131 ETOT131 IOUS131 IONI131 NSMI131 GETH130 BJEC130
+OFCO130 AREN130 CETH130 THRE130 ENTS129 SHAL129 NCEI129 LESO129 ECIR129 EOFA129 NEAR128 TTHA128
+ICHA128 EREB128 ATES128 NING127 SFRO127 OBJE127 ATIS126 NCET126 INAT125 OVER125 FANI125 HEWH125
+TERS124 CESS124 ERPE124 POIN124 FITS124 REIN124 CENT124 TERI124 HIRD123 PERF123 SFOR123 AKIN123
+SNOT123 EINC123 EMOR123 LENS123 HEGR123 URSA123 RESE122 RENT122 AYSW122 ALTO122 OBLI122 BLIQ122
+ERSO122 ANDO122 PLAT122 TICL122 ICLE122 FOUN121 HENC121 BYRE121 RCOL121 ANYO120 FREF120 CONC120
+DENS120 HEPL120 NNER120 EMID120 INDI119 YCON119 TALL119 ANDP119 SWIT119 ENOT119 ASSI119 MINA119
+REBY119 ARAL119 DTHI119 ERGE119 TRUM119 SOFR118 FTHO118 LUMI118 OFIN118 PLAN118 UCHA118 ETWO118
+ABLE118 RESS118 NDCO117 NTIN117 NATE117 MBER117 NDWH116 DNOT116 TYOF116 ORAN116 TIES116 BODY116
+TOWA116 ECTR116 SWER116 TILL115 TEDI115 EWIT115 ONES115 STRA115 STTH115 EDIU115 DIUM115 MIDD115
+IDDL115 DOFT114 ONFI114 LLEL114 DDLE114 SSIO114 NINT113 UNDE113 ESWH113 GENE112 POUN112 STOT112
+NGAN111 ONST111 ARER111 FORI111 MEAN111 DENT111 RPEN111 LANE111 EBLU111 CHES111 BEAM111 STOB110
+MPOU110 ONVE110 ITYO109 NGTO109 TRAC109 HEBO109 RERE109 CONV109 LYTH109 SUNS109 ENTI108 ICHW108
+ASSA108 NDIC108 HEOB108 OFAL108 INCT108 RIGH108 TTRA108 IESO107 NFIG107 ORDI107 SHAD107 EIRC106
+AYSO106 DTHO106 TURN106 YTHA106 HEPO106 NWHI106 HEBL106 HOFT106 ITIS105 LAND105 LTOT105 OWAR105
+DLIG105 EMAN105 TFRO105 ACES105 HEVI105 ORES105 ADTH105 CTRU105 ALLI104 MAKI104 EDFR104 BUTT104
+SUCC104 UCCE104 AGRE104 ARLY104 HTOF104 PPOS104 DPAR104 SIBL104 EART104 REES104 HADO104 STRO104
+THOF104 NGES104 FCOL103 MALL103 ENGT103 ELES103 ESHA103 HATO103 KETH103 INGR103 EMER103 ERTO102
+HEIM102 ITHI102 NDED102 SIST102 CHAR102 RREF102 EPRE102 HANG102 HEAT102 ANNE101 FOUR101 ISCO101
+PERT101 ESOR101 REDI101 DICU101 BLAC101 LACK101 ERWI101 ADOW101 ATTR101 SEOF100 URED100 YWHI100
+OREA100 NCEA100 HECI100 MANN100 MUST100 HALF100 LERA100 ADEB100 GHTB99 ANDE99 GHTI99 BERE99
+FTHA99 ABOV99 BOVE99 ONTI99 EEYE99 EIMA99 NCHE99 HINT99 FRIN99 INED98 URSO98 TOGE98 OFIT98
+BREA98 LENG98 FINC98 DEBY98 ONLY98 ONSA97 RECT97 OGET97 TTER97 RSTO97 NTHI97 ESSE97 SBUT97
+NDER97 TPAR97 ERME97 ENTR97 RATE97 HREE97 UREO97 HEBR97 ROUN97 EIGH97 BLER97 SREF96 EBOD96
+EADT96 HEEY96 TLIG95 SABO95 REDT95 ININ95 ASON95 STOF95 ALLB95 STAL95 RDIN95 ANDV95 MERG95
+TWAS94 FART94 NDLE94 INAN94 HTWH94 SPRO94 HEWA94 UMBE94 OUTT93 ACCO93 EASO93 CEAN93 YOFT93
+ARET93 EALL93 SMAD93 OURA93 OWAN93 WAND93 TRON93 HEYA92 LONG92 NGIN92 ECAU92 NESO92 HATW92
+IONW92 ESID92 EASE92 HEME92 CONF92 ISMS92 OURT91 INAL91 MITT91 EDOF91 REPR91 ONTR91 BYCO91
+RONG91 TEDF90 ICAL90 REEK90 BOTH90 INST90 OONE90 EITH90 EDLI90 ATIN90 ACED90 ITIE90 IATE90
+NOTT89 MPOS89 ETIM89 OUTA89 LETT89 OFRA89 EMOS89 EMAD89 IONF89 NDIF89 RYST89 ERVE89 OWER89
+TWHE89 VARI89 ORIN89 GAND88 ONSE88 DWHE88 HENI88 PARE88 SEEM88 HATS88 TTHI88 OSED88 NTOA87
+SMAL87 THEU87 REMA87 FOLL87 OLLO87 ATWH87 NTLY87 LEAN87 ERAT87 ASIN87 CREA87 HERW87 ESTR87
+IRCO87 EVIO87 ENTL86 WHAT86 CESO86 ONWH86 NALL86 SEQU86 ESST86 ERCO86 NUMB86 ENTT85 FECT85
+METI85 EATT85 BETH85 NSID85 HTTO85 RENC85 ETTH85 YSTA85 ETAN85 TDIS85 SMIT85 MANY84 EWHE84
+LITY84 RMED84 SSAN84 EANG84 INGL84 ATUR84 RWHI84 HTAN84 IESA84 ERST83 SENT83 SOFC83 IONB83
+UNDT83 TRAT83 UALL83 ILLA83 EDGE83 LYAN83 LEIN83 HETW83 GESO83 NISH83 DIAT83 LOWA83 XTUR83
+EARS82 DWHI82 NTOF82 SUFF82 TAIN82 TAKE82 RPAR82 YSWH82 LETH82 OSET82 RARE82 NDBE82 RINC82
+CORD82 COUL82 MEAS82 TEST82 SINC81 SCON81 NTAN81 FRAY81 IDER81 HEAN81 ATOF81 CRYS81 EASU81
+ARIS81 MIXT81 ITTE80 NDTO80 LYRE80 ESEV80 YSOF80 ELIN80 ASST80 ILIT80 TIST80 EOFI80 SUPP80
+EONE80 RSID80 HEYW80 CCOR80 SALT80 NATU80 BSTA80 SPAC80 PACE80 IXTU80 ERSI79 ETHO79 CHIN79
+ESAR79 ISTO79 ESBE79 OREF79 MIGH79 SLIG79 FFIC78 ENTO78 VETH78 TERW78 NDAN78 UALT78 LYIN78
+NPRO78 ROMO78 EOBJ78 ESSA78 ASUR78 RISE78 SUBS78 HERP77 OREI77 ENDE77 RENO77 WING77 RFOR77
+SUAL77 ENEA77 UPPO77 OFWH77 ALLO77 SBYT77 HEHO77 TONE77 TICK76 SOFL76 NDOF76 LAST76 IRCU76
+QUAR76 RESO76 TTED76 INGF76 EDIF76 EASI76 OSTR76 HATA76 EOUT76 BUTI76 EBET76 TOON76 OWTH76
+ASTR76 ANDG76 FANY75 URSW75 METH75 EQUE75 CCES75 SMAN75 ITSO75 SWIL75 RMIN75 HERC75 PHER75
+STBE75 INGM75 ORRE74 SATT74 CEPT74 HEEX74 NOTB74 SEPA74 INEA74 ATEL74 ELEA74 ORTS74 OGEN74
+DTHR74 AGAI74 GAIN74 UGHA74 EWAS74 LUEA74 SURE74 ENES74 NSAN73 ERFE73 EEXP73 NTTH73 RSIN73
+ONAS73 RSAN73 DERS73 INFI73 RFRO73 DTOT73 LETA73 DEOF73 AKET73 EDAT73 ERWH73 OGRE73 ECHA73
+UBST73 HEDE72 ETIN72 EXCE72 BOOK72 NDIS72 STIL72 EPER72 ATIT72 ETRA72 OTHI72 DESC72 YTHI72
+INCL72 GLES72 GHTS72 OSEO72 ONIN72 TSTH72 ERWA72 FWHI72 CIES72 EYEL72 ESIS72 PECU72 ECUL72
+BROA71 ROAD71 FICI71 NTHO71 TOMA71 USED71 ISNO71 DERT71 NIFE71 BILI71 USUA71 ASSO71 INGP71
+TANY71 TINU71 DRED71 RSTP71 ITEN71 NGSO71 ULUM71 YARE70 LISH70 TOAN70 TFOR70 OAND70 TELY70
+LLUS70 HISB70 LLIN70 HTHA70 NSPA70 LLUM70 AREA70 SCOM70 CTLY70 EAIR70 EWAT70 LARL70 SPHE70
+IQUE70 ESFR70 RECO70 FEET70 EDBE70 ESTA70 SWAS70 RODU69 ODUC69 ICKS69 EFOU69 SEAN69 ONTO69
+FINE69 QUEN69 FGLA69 UTAN69 IVEL69 SEST69 NGLY69 BEDI69 MONE69 REDO69 ERCE69 CULU69 TWIT68
+ITAN68 OMAK68 LUST68 USTR68 NSTH68 ANSP68 EROR68 DREF68 WHOS68 NCLI68 CLIN68 RETO68 BLET68
+ERMI68 HEAI68 OFGL68 RWIT68 NSIB68 LESA68 CEBE68 OMON68 SDIS68 ULDB68 HESH68 FAIN68 ANTI68
+NCEB68 ETAL68 PROD67 OTTH67 EYAR67 ICIE67 GTOT67 DCON67 HATP67 HTBE67 EVEN67 ETHR67 EREW67
+ERBE67 TWIL67 EBUT67 DBYC67 TITS67 HPAR67 WTHE67 NSIT67 META67 THEK67 URTH66 NTED66 HEOR66
+ATTE66 DSTH66 OURE66 ESWI66 ATHE66 ARES66 ESCR66 IBIL66 REMO66 HARE66 EPOI66 REAL66 ECTS66
+INGB66 TERC66 VELY66 VIEW66 SEDT66 NCRE66 SMOR66 UEAN66 CEED66 LDBE66 NDVI66 ANDY66 TENE66
+EKNI66 KAND65 OPOS65 SHIN65 SCRI65 ONCE65 TATI65 NDIT65 TSAN65 OMES65 DLET65 ONEO65 TTOB65
+RTOT65 NSEQ65 SBET65 CHAS65 ONIT65 REIS65 EREO65 INCR65 THPA65 CAME65 FORC65 HEKN65 NSIN64
+WASA64 IENT64 LOWI64 INIT64 ICHC64 ERFO64 OSER64 ITSE64 RTHI64 EREC64 ESCO64 EWHO64 EWIN64
+EHOL64 IVES64 HOBS64 THOB64 DUCE63 VERT63 IHAV63 YOTH63 OMEO63 BYWH63 FIGU63 TANT63 OUSL63
+ALLS63 EDEN63 SERI63 RDST63 INGW63 STHR63 OURD63 LETO63 EAMO63 DLEO63 BRIG63 EIRS62 URSI62
+OPER62 DSOM62 GING62 BEEN62 EEQU62 OWIN62 WELL62 DOTH62 INGU62 TEAN62 INDO62 RWHE62 PECI62
+SESA62 DBLU62 EENA62 ERAS62 RIOU62 EASY62 USTB62 SOFS62 HEST62 TERV62 SAPP61 IGUR61 ANDH61
+ROPA61 DMOR61 ITSP61 AIRA61 NEAL61 WAYS61 NONE61 TEDL61 ENAN61 NCEF61 ESEE61 DERA61 HANI61
+SUPO61 ANDN61 EBRE61 UALI61 NDYE61 EABO60 YINT60 DATT60 NDMO60 GURE60 HWAS60 ORME60 EXPL60
+EACH60 SMAY60 ISSI60 ECEN60 POLI60 VERG60 NDBL60 ARIO60 BUBB60 UBBL60 BBLE60 IQUI60 SPIR60
+HERO59 COPI59 CHCO59 GIBI59 EIRP59 ACEO59 EOFR59 ORER59 ORIF59 OLIS59 SBEI59 NFIN59 DAFT59
+PERA59 ITTH59 NGED59 NGRA59 TEDW59 ERBY59 NCHA59 WHOL59 AMOF59 ONGE59 ULDN59 IRIT59 DCOL58
+ERTI58 DABO58 RESI58 OMPA58 TOIT58 EREM58 NDPR58 OPIO58 PIOU58 USLY58 EDAR58 ISSO58 TUPO58
+IDEO58 OSEC58 ENSA58 HISI58 TORE58 ALRE58 CTIV58 ISIN58 LREF58 RVAL58 SPOT58 PIRI58 HEYE57
+ECTA57 ISHD57 DONO57 ONOT57 NIVE57 CRIB57 CHIS57 SIVE57 AYST57 AYSI57 SERA57 NSTA57 OTAL57
+NDDI57 PAND57 LELT57 DETH57 CTTH57 EOBL57 ECAM57 HEHA57 LVER57 SOFE57 ENDO56 COMM56 NERA56
+ONBE56 RARY56 AMEP56 NITS56 SOFI56 HECE56 HISA56 UENC56 NGER56 LDNO56 TMOS56 NDFR56 ARAT56
+TIVE56 ENDS55 OTBE55 CHWA55 AVES55 ESTI55 DONE55 IRIN55 DGES55 TGLA55 ITBE55 FOCU55 OCUS55
+EANS55 AXIS55 HENA55 NDAL55 FIFT55 STPA54 GEOF54 NYOT54 ISHE54 TOFI54 NEQU54 MOFT54 RSTA54
+ALON54 ASIL54 RSTH54 TRAR54 ORMO54 LLUP54 LUPO54 OURI54 GROW54 ESER54 BLES54 REDB54 LATI54
+ITOF54 NDIG54 DIGO54 LCOL54 NDON53 DISP53 RFEC53 FULL53 ROPE53 GTHA53 URES53 NGSU53 APRI53
+ROMI53 RIBE53 SSIV53 NANY53 GATE53 ALLA53 AREM53 HETE53 TBEC53 ERRE53 LING53 ONCA53 HATH53
+QUIC53 WAST53 HERB53 OFEA53 ATAL53 UTIN53 ESBY53 DVIO53 SMIS53 HEMT53 TALS53 ORCE53 POWE53
+QUIT53 TEND52 ERPA52 EREP52 RSWH52 TNOT52 TENT52 TCON52 SCOP52 OPAG52 PAGA52 AGAT52 CALL52
+OMAN52 ONOR52 ISRE52 ELTO52 NDPA52 HISP52 LYTO52 LESC52 RTHR52 EFOC52 NDOW52 OAST52 GRAY52
+RBYT52 TAPP52 URIN52 ICOU52 OURO52 HEHE52 MISS52 POUR52 PTIC51 EARA51 TETH51 STPR51 NDSU51
+NESA51 SPOS51 NGFR51 GFRO51 NGOF51 USET51 ASTI51 LAPP51 EITS51 OFAI51 HATC51 ROSS51 NVEX51
+ECTG51 YING51 ORTO51 ESUP51 ELIK51 OCON51 WIND51 LOOK51 UICK51 TERB51 ILAT51 PURP51 REDW51
+SILV51 ILVE51 KNIV51 OPTI50 DFOR50 RIED50 IOND50 CKSI50 OMIT50 FORA50 PLAI50 LAIN50 ESFO50
+TEDO50 ETUR50 HOMO50 OMOG50 MOGE50 LLAP50 ERIS50 ERFR50 GULA50 ESMA50 CAST50 EMOT50 SONO50
+ANBE50 CEFR50 GHTL50 ANIS50 ENUM50 ESPA50 OFWA50 GSOF50 HAIR50 DISC49 HELA49 DUPO49 ESET49
+VING49 EDWH49 RNIN49 NGIT49 IESI49 DARE49 ERSU49 LETI49 EDOR49 NESI49 ITES49 ATAN49 ALAN49
+DDIS49 DERI49 FAIR49 REBE49 SVER49 PONA49 TWOP49 NDAS49 HEWI49 RAST49 HEOP49 SOAS49 MOVE49
+HISM49 DESO49 HECH49 EMIX49 NTIT49 EINS49 OBEA49 REIT49 ALCO49 FWAT49 HTTH48 HEED48 TMAY48
+ANTO48 SINA48 SOLI48 ATIC48 EDON48 MANI48 INOU48 SBEC48 AKEN48 HTIN48 REDL48 DRAW48 LBET48
+ISMT48 CETO48 NEXT48 CTGL48 INTS48 ALMO48 UNDI48 TBYT48 NDWI48 WHIL48 EEDG48 DBET48 SITE48
+STOO48 CEIV48 DYEL48 DPRI48 DGRE48 YTRA48 HISC48 EBRI48 TOCO47 STOA47 NEDT47 RCUM47 AINI47
+OUTI47 ITAT47 EFIN47 OMEN47 EIRD47 YSAN47 SESO47 TOTA47 EDRA47 NETH47 NDFO47 GINT47 TIFT47
+ISMO47 COPE47 NVER47 OTIN47 TCOL47 GHTE47 IRRE47 RALS47 OREC47 ISIT47 EEME47 ESAT47 DEEP47
+TITU47 IBIT47 EMEN46 AREI46 ERHA46 ENER46 SHEW46 TSIN46 IVER46 ASBE46 HOUG46 OTTO46 UARE46
+TOWH46 ANIF46 STOP46 EMED46 LLIT46 TESO46 AYSB46 IBED46 SSOL46 MAIN46 HAPP46 ONAL46 NDSE46
+SESI46 EMEA46 ISAN46 DOWS46 GEAN46 UREA46 MECO46 HATB46 SOMU46 OMUC46 DILA46 RBUT46 BUTA46
+NOTA46 ROFA46 EMAI46 ERIE46 TAST46 URPL46 OFAR46 EXHI46 XHIB46 HIBI46 BRAT46 ARAN45 EDAL45
+GIVE45 UFFI45 ICAT45 UCHT45 EFRI45 NDAT45 SITY45 EMAY45 SEDI45 ESAS45 FEST45 RDIS45 ISPO45
+FONE45 THUS45 DINA45 ISPR45 SILY45 SOON45 ONIS45 RESP45 ITYA45 CAND45 STHI45 TELE45 RCON45
+NCAV45 HEYC45 HETR45 MENA45 DBYA45 RVED45 ASSW45 SCOL45 URSB45 AVER45 HANA45 YWER45 NSLI45
+GTHO45 EOBS45 ERTA45 PERC45 EAMS45 ICHP45 NGEA45 RSAR45 REWI45 NEVE45 EHAI45 VIBR45 IBRA45
+PRIN44 EDES44 NGSA44 SATI44 ALTH44 SQUA44 LEST44 HWHI44 HEYM44 EMET44 THIT44 YREA44 ISBO44
+IFES44 ESIT44 OUSA44 LEWH44 IRAN44 OMMO44 ESOM44 DIFT44 AYTH44 TTIN44 NFOR44 SEEN44 VEDT44
+NERT44 SSED44 GHTM44 BLEA44 TSOM44 UNSL44 STUR44 HIST44 EATA44 AKES44 RPLE44 LSOR44 STIT44
+FORW43 TONT43 EEND43 NTEN43 ASAB43 NTIL43 ROTH43 YBEC43 ITED43 IRDE43 ASIT43 ORSO43 XPLA43
+ALLP43 NOTI43 HEBE43 TBUT43 INSU43 LTER43 ASMA43 LYAS43 BETO43 CESA43 ORBY43 TEDR43 ECTL43
+IFOU43 EDAS43 TISA43 REND43 EQUI43 TWOO43 EETA43 SAST43 ITSA43 NOWT43 TEPA43 DEIN43 NGON43
+DBUT43 ESUC43 SEXP43 URAN43 PERW43 GHTR43 RATT43 YWHE43 TBEI43 IEST43 LBOD43 ERIO43 EPEN43
+EIVE43 ELYT43 PPER43 TPRI43 RCEP43 LSOT43 TPRO42 RITO42 NDST42 DTOG42 TILI42 DLEA42 OUTS42
+INGC42 HEUN42 ICHM42 NOUS42 ALTE42 GLEO42 DISS42 MITS42 ESEA42 AMER42 NAST42 CLEA42 SOFO42
+GHTF42 GOIN42 ICHF42 RWAR42 ANYS42 AMES42 VIDE42 NOTS42 CHAM42 COVE42 HANB42 OVED42 HIND42
+ENST42 ERIT42 NOME42 ERSA42 DMAK42 ICHB42 EYWE42 ISOF42 REGU42 EGUL42 YWIT42 QUAN42 UANT42
+NDGR42 ITET42 IFIC42 MIXD42 OURW42 EOFS41 EYEA41 ELAS41 NTOB41 ADEI41 NDMA41 KNOW41 OFBO41
+UTIT41 CEWH41 ATLI41 SONE41 MINT41 MINO41 OSES41 MMON41 AINS41 ORED41 BEMA41 YCOM41 ASSB41
+ITST41 LUCI41 NDAF41 EINA41 SBEF41 CEDA41 OLEI41 HELD41 ECIE41 RWAS41 EMTO41 GRES41 ITRI41
+RIOR41 DOFA41 NIFO41 STOR41 ATEO41 VALS41 EPOW41 IQUO41 QUOR41 UCED40 ARGE40 HISS40 CTAN40
+DOWN40 OFSU40 SEWH40 UNDS40 EONT40 AVIT40 ANES40 ITIN40 ENTB40 EDMO40 SONT40 TSPA40 YSAR40
+STCO40 NEST40 TRAY40 HANO40 ERAR40 MING40 TERR40 MTHA40 EBEA40 FIND40 UCID40 OING40 VENT40
+NEIT40 ALLU40 VISI40 ISME40 UISH40 PHNO40 HNOM40 HESO40 ELLU40 TTHO40 ENCO40 VANI40 NGRE40
+ESNO40 SOFG40 GINA40 TWOU40 EAPP40 ALIN40 ESAL40 IFOR40 OFSE40 EWIL40 HONE40 NCOM40 DROP40
+SOLV40 GENT39 CHWE39 TARE39 AVET39 ILIN39 ONTA39 ITWA39 THOR39 VERS39 AGES39 BERS39 NOTE39
+HATL39 OFON39 TBOD39 OBET39 OREO39 ROMA39 RETU39 BEGI39 EGIN39 CEIS39 BLEI39 IREC39 ADET39
+NATI39 AIRI39 URST39 OFOR39 PONI39 CAVE39 USAN39 ITEP39 MINI39 ITEA39 HTLI39 OLID39 SSWH39
+RERT39 YSIN39 LUTE39 NPLA39 ISMI39 LITI39 ERFI39 ARTA39 NSTI39 EFIF39 STIC39 CULT39 SOFW39
+VAPO39 OSEP38 DPRO38 AGEO38 MEET38 MATT38 CIEN38 HATM38 EDSO38 MEOF38 UNTI38 ONDA38 RMER38
+VITY38 NCEW38 PROV38 OWHI38 TPAS38 YONE38 ACEA38 LONE38 BYAN38 NSUC38 EARL38 TERF38 OITS38
+TSID38 INGG38 NTSO38 LMOS38 SPER38 RPLA38 DEST38 AMBE38 TOFW38 HATE38 EETH38 NFUS38 EDEG38
+TLYT38 LARG38 LOWE38 TLIN38 EDCO38 DONT38 OFAB38 WASS38 ONGL38 ARTE38 AWHI38 TABL38 ROGR38
+MAGN38 NTOO38 RECE38 CERT38 BUTW38 SMUC38 ONDP38 TGRE38 AREO38 ERYS38 UNIF38 HEMS38 NDOR38
+UROF38 TEOF38 IESB38 EFIT38 ATMO38 TERN38 ACID38 TREA37 RWIL37 TTOT37 DALL37 ESEP37 ITHS37
+TICA37 SCAR37 RALC37 NSTR37 DEXP37 HERF37 HTIS37 TOFO37 NTIM37 CASE37 ACET37 NREF37 LLIG37
+ERYN37 YNEA37 SHAV37 HATR37 CROS37 SSUC37 RALP37 DIVE37 REEO37 USOF37 EIRI37 LESW37 YWIL37
+IKET37 ISBE37 BEYO37 EYON37 YOND37 ECTT37 AMEC37 ACON37 URET37 ENIN37 EIRE37 HEDA37 KSIL37
+REDM37 ENTW37 AQUA37 ESSW37 URAL37 ENIT37 PROG37 NDNO37 INPL37 RGEN37 SEFR37 ETOB37 RTAI37
+SUPE37 UPER37 EXTE37 HEYB37 STRU37 NTRI37 NGSW37 GLOB37 APOU37 INCE36 EROU36 SHOU36 HOUL36
+SELF36 WALL36 ARIN36 NSOR36 SALS36 YFOR36 EILL36 HEMB36 INOR36 EFOL36 DITS36 MESO36 CHMA36
+RPRO36 RTUR36 INLI36 ITER36 ESUR36 ALWA36 DIRE36 CEIT36 NSER36 RYNE36 INWH36 INPR36 HENE36
+RICA36 DEAN36 FAND36 UNDA36 DEDT36 EBYA36 BEAL36 PERB36 EYET36 PAIN36 RAIN36 YCOL36 RGIN36
+YAPP36 RTER36 ILST36 ATHI36 URSM36 WASN36 DBEC36 TITY36 IVED36 LDIS36 NGCO36 UALR36 THEX36
+HEXP36 EYBE36 OFAC36 GROU36 DEPE36 OWDE36 OILO36 FEAS36 UNUS36 NUSU36 SEME35 ENAT35 EMAT35
+NDEA35 ETTE35 RCOM35 IONM35 MATI35 SBOO35 OSEA35 NSIS35 HISL35 UFFE35 AMEM35 INSO35 HEPE35
+ONEI35 ANYR35 UTIF35 DAST35 ENDT35 AYSF35 QUEL35 UELY35 ATCO35 ONDI35 ERGI35 EENB35 UOUS35
+FELL35 HINP35 NDDE35 HISE35 STDI35 ERBU35 ATDI35 EENI35 NGMO35 NWIT35 DIVI35 IVID35 UMAN35
+ESSD35 AIRW35 OTHO35 ITWI35 HEAC35 SULP35 ULPH35 LPHU35 PHUR35 IRIS34 ONDO34 AVEA34 ORCO34
+HISO34 OVET34 SWEL34 INPA34 BUTB34 DRAY34 GSUR34 CEDE34 URAT34 REQU34 ONON34 HAMB34 SCOV34
+ONFO34 ANYC34 NCTL34 ADER34 HTHO34 EESO34 OBLO34 BLON34 LPAR34 TENS34 TATT34 CTIL34 NSWE34
+AREE34 EWAY34 IMME34 SEDB34 OADE34 ESMO34 ERTU34 STEA34 ILLT34 UTIO34 MPRE34 RBET34 ITHM34
+LSOF34 HEVA34 EHEA34 EADI33 RTIS33 ELVE33 TERD33 REPE33 NBEF33 ITMA33 SHED33 ITHW33 NTAI33
+NDAR33 AKEA33 TOMO33 ONSW33 REAR33 TOEX33 RTSA33 NOTO33 IRPA33 MINU33 BACK33 NSAT33 OSTC33
+LLCO33 ERPR33 EARI33 ITSR33 YUPO33 STON33 URNI33 ANYP33 NBYT33 LYBY33 MWHI33 SORI33 YFRO33
+SSHA33 SIXT33 INNE33 TYAN33 NCIP33 SESW33 ERCU33 ERDI33 NGUI33 HTRE33 LOFT33 WASI33 ALFO33
+ACKS33 SEDA33 LUEW33 DILU33 ILUT33 FNAT33 LEAR33 ISEF33 EEXC33 RFIC33 TOFR33 LINT33 BLEO33
+RGED33 CHPA33 EMIN33 AIRT33 ERNA33 PORE33 EEAR33 ILLI32 DESI32 NDSP32 SPRE32 ICHS32 TOBS32
+OOKI32 RSMA32 ONDE32 WTHA32 DEDO32 SEIT32 TYET32 THAS32 GHTP32 NORD32 DEFI32 SEIN32 ORLE32
+SSRE32 NGOR32 TSEE32 INRE32 IESW32 CEIN32 OMIN32 PTHE32 RIFT32 REWH32 INDE32 SSOR32 DSUC32
+NOFA32 INUA32 RTWO32 SAID32 PTED32 RINA32 YAST32 EBIG32 OPES32 ORWH32 FERI32 GUIS32 HILS32
+UCHM32 ISMW32 OLVE32 HRED32 NBUT32 LOSE32 LERE32 TWER32 OREB32 OFTE32 OFNA32 SCEN32 NDFI32
+ASTT32 ASYT32 BESO32 TBEA32 ELYA32 INAC32 AWAY32 CHIT32 DBEA32 DSOO32 SEDO32 LECO32 INUE32
+FSEV32 TUAL32 ALLD32 LYWH32 ITUT32 TREM32 TETO32 TECO32 ESQU32 POWD32 WDER32 HEFR32 ONCO31
+URSE31 OFSO31 NGEN31 DIND31 SIHA31 EDUP31 MINE31 EALS31 TSWH31 OSEW31 CEST31 NTIO31 YMAY31
+IXIN31 EMAK31 ASNO31 RAVI31 NCON31 USIN31 TTOM31 GHTC31 ESON31 ATPA31 NNOT31 IRDI31 NPAS31
+RLES31 INUT31 LLYR31 LART31 TLEA31 PLEA31 LWAY31 IVEN31 SIFT31 NLIG31 EACI31 CEDI31 TFAL31
+INDT31 SILL31 NTFR31 CUSO31 NUAL31 YSTH31 ESPH31 RULE31 WHET31 ISIS31 ENOU31 ONFU31 ESSU31
+IMIN31 IGNE31 CATI31 ERSE31 MWAS31 KLIN31 ATON31 OINC31 EDPA31 ARCE31 RYTH31 NLYT31 IXED31
+SWOU31 LYUP31 ISEX31 FFEC31 SNOW31 EPTI31 MMED31 ARIT31 RIES31 EMTH31 LOWO31 USES31 ERMO31
+ARAS31 STHO31 ETHP31 IFFI31 FICU31 NWAT31 MERC31 NCEN31 CITY31 LEAD31 NGSM31 FLUI31 LUID31
+HEEA31 TEVE30 ARRI30 TISE30 IONC30 INGD30 TENA30 NATT30 ISHI30 ESUB30 ESTT30 SIMP30 INTR30
+ESOL30 GRAV30 ALPR30 FBOD30 ICHH30 NSWH30 ELET30 ESBU30 ROVE30 ASWE30 VEIN30 INSE30 HCOM30
+TINA30 EORD30 ONET30 EEMS30 ATLE30 INET30 NDSI30 OMEM30 LLRE30 REDE30 EIFT30 NTOW30 OWWH30
+IRED30 RSTS30 SSBE30 LLED30 NDFA30 RESA30 AREP30 LLSO30 TCOM30 TOPA30 LLNO30 INIS30 ARSI30
+EIRR30 NSTO30 RESU30 GNES30 ENTM30 WISE30 SETW30 EWER30 ANAN30 ITTO30 EWAL30 AYSE30 ERAB30
+NDLI30 OSEB30 RSBE30 FLAM30 LAME30 TURA30 ORMA30 FIXD30 ASOF30 WASB30 THAL30 ITUD30 TUDE30
+AGEP30 ARKE30 TRED30 SGRE30 ASED30 MOFL30 DALS30 VESA30 EARO30 HENU30 EOFO30 FARA30 EOUS30
+SCAN30 EOFG30 INWA30 ITEL30 EENO30 LVES30 GOLD30 VITR30 VACU30 EVIB30 EDAB29 ESEM29 ULDS29
+DCOM29 EFAR29 MPAR29 DHAV29 DOUT29 MERE29 OSEI29 NTSI29 YSTO29 URNE29 RNED29 ESSR29 ESRE29
+ASES29 TOAI29 OAIR29 TEDM29 YSBE29 EIST29 EAXI29 NWHE29 TLET29 OADA29 ISLI29 ITSS29 ERCA29
+CUMF29 UMFE29 MFER29 ISMB29 EDLE29 ERIC29 ERMA29 PPEN29 INTA29 DIFI29 REPA29 OTSO29 CESB29
+SSOM29 ADAR29 ATEA29 EARC29 MEOT29 BIGG29 IGGE29 TONL29 RCUR29 ITYT29 NGST29 CKAN29 EHAL29
+LEBE29 AMED29 EBLA29 UMTH29 CCEE29 EDNO29 SDIF29 EDIM29 YDIS29 RGLA29 WENT29 LTHI29 SOFB29
+ERYR29 HISW29 BEOF29 RINS29 DORA29 TOAP29 BASE29 IMPR29 IUMS29 PROB29 BESU29 LIMI29 IMIT29
+PEST29 ANSO29 BLEB29 EDMA29 ITNO29 NOTF29 IRTH29 GITA29 ILOF29 DFRI29 ATRE28 EDIT28 HWER28
+ROWN28 OROT28 EFUL28 UTHO28 RTIE28 ANNO28 AMEW28 NGAL28 AYIN28 THEQ28 HEQU28 ELLI28 SPAS28
+AIRB28 AINE28 LNOT28 SOIN28 EIRO28 RVER28 ECES28 GEST28 UGHI28 ASIS28 EIRF28 TPLA28 NYOF28
+SPLA28 OFVI28 SSEE28 NLES28 DIMI28 EGRO28 METO28 ERPL28 HAPR28 BIGN28 AVEN28 LLYA28 GOOD28
+EISA28 REDC28 ITSB28 ALFA28 ELOW28 ORTW28 EAFT28 STOW28 CARC28 GESA28 TSCO28 EARB28 IRDP28
+ITEW28 GTHR28 SEMI28 BUTO28 ANSW28 CHOR28 EITI28 EALI28 ERYF28 ILLE28 DYET28 ASTA28 SMOS28
+OWGR28 EDRO28 RABL28 NDOT28 RSTI28 MPAS28 STFR28 RWIS28 EAPE28 TRIC28 OBEI28 TATE28 ENSO28
+RITS28 ETEN28 OAPP28 OWOR28 HEBA28 VERD28 EEXT28 EMUC28 MYEY28 YEYE28 RIVE28 NITE28 UALM28
+RIFI28 HART28 IGIN28 UITY28 UITI28 EEDI27 NTTO27 TESA27 ECTO27 HEMW27 THWH27 AVEO27 ONMA27
+ITSC27 EWED27 EBOT27 ISHA27 NITI27 AMEL27 RITI27 TLYA27 CANN27 YBES27 NLIK27 ARGU27 UMEN27
+NUTE27 IMEA27 INBO27 NBOT27 YBEI27 TANG27 ALLC27 REEA27 SEAR27 TSRE27 DTOB27 DSIN27 DSAN27
+NGUP27 LOWF27 OREP27 ALSA27 THWA27 TEQU27 RLYA27 AMEA27 HEAX27 STOM27 ENTP27 ESTB27 EPTE27
+ONDT27 VESI27 ILLN27 FUSE27 HORT27 FORS27 EHIN27 SASI27 RAWN27 NOWI27 TBES27 TYTH27 DESA27
+SRED27 IDPA27 DERD27 ATET27 UART27 ESCA27 EVAR27 LOWS27 MERA27 ALBO27 IONP27 OPPO27 REEQ27
+EBEI27 SLES27 VEME27 FIVE27 SOVE27 PROC27 UCHI27 GEPT27 WGRE27 ODIF27 UTMO27 PTIN27 ASWA27
+ONEC27 ISES27 STOS27 TOBL27 CESF27 TOUC27 OUCH27 RMOF27 LYDI27 BYIT27 OFGR27 HEAP27 ORMD27
+HEYD27 NDCR27 URNS27 COPP27 OPPE27 YMIX27 FIRE27 IVEP27 ORIG27 RIGI27 TILE27 LMAN27 STRI26
+RETA26 EETI26 XCEP26 UTES26 OUTM26 ISAL26 SALL26 THSO26 ASAL26 NTOS26 VESO26 DEDI26 LPRO26
+HISD26 BOTT26 HTBY26 FINI26 NYON26 BEST26 ANYT26 REOR26 SBOD26 YRAY26 ONSB26 SSAG26 OSEN26
+HERM26 NDRA26 DMOS26 CCUR26 ELYO26 CEON26 DETE26 EDIL26 CEAS26 LYON26 RMOR26 AYSD26 NTRE26
+USTH26 IDET26 HITS26 NSOM26 DATA26 RASI26 RDAN26 EYES26 UNLE26 HTSO26 BEHI26 GGER26 HTHI26
+EORI26 THAP26 DOWA26 SERE26 BOAR26 OARD26 LEND26 EWOU26 RALB26 UTON26 DIMA26 TERE26 EFFE26
+RPRI26 BERO26 ITWO26 UTAT26 ACHO26 UTWH26 UNSH26 ASMU26 TTHR26 ITSI26 EBEC26 RDEG26 OOFT26
+LESM26 EIRA26 NTAT26 KEST26 LBEA26 UCHL26 EDEE26 EEPE26 EBUB26 IRON26 RNAT26 SOFM26 PELL26
+DBOD26 UORS26 TRIO26 RIOL26 ALMA26 KNIF26 CEDB25 ORAT25 EIRM25 DBEI25 TODE25 PERH25 TRIE25
+FIED25 UBLI25 XING25 KIND25 CITE25 UEST25 ISDE25 RYIN25 TISM25 SSTO25 NGOU25 SOUT25 REAC25
+YTOT25 NSBE25 LLAN25 YINC25 MEMO25 AYSC25 TSHA25 BEDE25 ADEO25 OWFR25 WFRO25 MESI25 CTUR25
+ARKC25 ETOF25 IXTH25 HEOU25 ASBY25 EIND25 ATOR25 GHAP25 DSOT25 IPLE25 NCOL25 HERD25 ALPA25
+EPHN25 BEMO25 NEDA25 OBEC25 TOGR25 IPLA25 CHBY25 DASI25 MIXE25 SMTH25 RSTT25 ULDH25 TITI25
+ANTF25 ISDI25 OVEM25 EATM25 AGNI25 EESA25 SMAT25 LOWG25 YANY25 NACI25 YPRO25 ARYT25 CHTO25
+AINB25 FTWO25 WOPR25 TTOA25 ISOR25 EOFW25 SOBS25 MIXI25 AYSM25 TELI25 AREC25 PAKE25 ENOR25
+NALT25 CANB25 RISI25 VEST25 RGRE25 OSTA25 URWH25 EARD25 QUIS25 SSIS25 HINA25 ERYT25 HARD25
+TALA25 HPAS25 YPER25 OLUT25 TRIN25 ELIQ25 EXCI25 XCIT25 SYTR25 EUNU25 DVER24 IMPE24 MPER24
+FABO24 MESA24 UMST24 OOTH24 OFSI24 IONE24 MONS24 ESES24 SESB24 OBER24 LYCO24 GOFT24 BEPR24
+SITS24 SINS24 TSUR24 BYIN24 AYCO24 NDHE24 LTHO24 RIMA24 SAXI24 DETO24 NINA24 IPRO24 NDAB24
+NDSA24 SPRI24 RSTR24 TOFG24 IDEA24 DPLA24 ERRO24 NGWI24 UNDB24 ENOW24 IDED24 RDSO24 AYSS24
+HEYH24 ITEB24 URSF24 ESPO24 RTED24 SEET24 RVES24 INAR24 HECA24 USEO24 NYCO24 NOUG24 ONWI24
+ACEB24 RTHO24 BESE24 EDBU24 UMOF24 ATHA24 CIPL24 HATF24 UREW24 IEWD24 AFOR24 ONGA24 REDS24
+ECAN24 CESW24 REWA24 LFTH24 FTEN24 LOWL24 CEND24 RANC24 WASO24 REEF24 LETB24 VESS24 WASP24
+AIND24 DBYR24 ATEC24 BERT24 MEPR24 TSUC24 SMEA24 EADO24 CHFA24 RMIX24 WAYT24 ESWE24 ASEA24
+ISAS24 OURB24 ECED24 VERI24 OPAK24 ASFO24 OBST24 SESF24 HESQ24 ADIS24 EPES24 SGRO24 STAR24
+ITRE24 EMSE24 MSEL24 ETIC24 HEAR24 STSU24 FERM24 CURY24 HEON23 ETOP23 INFL23 DITI23 CORR23
+AMIN23 NTSA23 ECRE23 ESTW23 SAFT23 PUTT23 NDWE23 RHAP23 HAPS23 TISF23 YNOT23 EAVE23 NTOM23
+DFOU23 EYMA23 ENMA23 TOSO23 SITW23 EATH23 LLER23 SBEE23 CKSP23 SEAS23 GOUT23 IUMI23 BEND23
+UTBY23 SAGE23 TSEV23 ONAR23 EROG23 ROGE23 TISS23 ACCU23 CURA23 OFOT23 FOTH23 HANY23 SRAY23
+EUPO23 YBET23 APAR23 REDG23 ITSF23 FLOW23 ORAL23 SOMA23 SORB23 EYCO23 TWOR23 YSOR23 EANY23
+ANDU23 ESAI23 DBEF23 EYHA23 EBEE23 OWSH23 RUPO23 NERV23 NGET23 HTWI23 INGN23 MWHE23 LESI23
+DGLA23 OTON23 NSEA23 TWOS23 LLOF23 VEDI23 USCO23 ERYL23 MEST23 LDTH23 ASRE23 ALLW23 FORB23
+NOTM23 AREB23 SLOW23 OSTU23 LDHA23 TOOD23 SDES23 TEEN23 EPOS23 ATEI23 RUMS23 IDTH23 OFAP23
+EISN23 XCEE23 EFEE23 HINI23 PREA23 FSUC23 OWIF23 RSEV23 ATSP23 EDAF23 EALT23 NITA23 ATAG23
+TAGR23 NDDO23 OPRI23 DORD23 ODIS23 RCAU23 EENY23 NYEL23 OPEN23 ECOP23 HEUS23 EUSU23 ASEN23
+IFIT23 INVA23 UNDR23 ERYW23 SSAR23 TSTR23 ALSI23 HEIG23 ODYA23 NDMI23 BYME23 RARI23 DCRY23
+OSTI23 ANET23 SARI23 RRED23 RSTC23 ROPS23 LOBE23 HEDR23 EGLO23 RMEN23 ASYR23 SYRE23 HINE22
+NEDI22 EATI22 ONPR22 FSOM22 NSEN22 DEDA22 MPLE22 TOFS22 PERS22 EIMP22 RIEN22 TBET22 AGEW22
+PLES22 EDOU22 ACTS22 TOPR22 SFOU22 ELAT22 IFIE22 ISET22 HTCO22 ISTS22 NEWI22 DERE22 SUNT22
+TCOP22 GLEW22 NARE22 EDDI22 TLYB22 NOUT22 SSOT22 NWAR22 ADAN22 ETOA22 TISI22 IKEM22 UALA22
+NTHR22 TPER22 ERPO22 WORA22 SCAS22 HPRO22 ATIF22 EYWI22 SHUT22 ASHE22 NDEN22 SISM22 STBY22
+ESIX22 YMAK22 OUTW22 GLYA22 LATT22 NVEN22 ENBY22 EINF22 HELO22 ADEA22 TODI22 UCHB22 VENO22
+ASSU22 IENC22 CHDI22 INCO22 YEXP22 HEPH22 NANG22 GANG22 PERM22 WERT22 LFOF22 DGEO22 GEXP22
+YLIT22 ERAP22 OWSO22 RSWE22 LWHI22 WEAK22 NDHO22 MEIN22 SMSA22 RCUL22 SBYA22 DEWA22 GWIT22
+RREG22 INEQ22 EDED22 ETAB22 HERU22 STWH22 IEWI22 LUEG22 UEGR22 LETS22 OTAN22 TSUP22 NACO22
+MSOF22 NTIG22 TIGU22 IGUO22 GUOU22 EATD22 ERBO22 IGOA22 CHHA22 ENYE22 RFER22 REAB22 OUSP22
+OURF22 TYEL22 NORA22 TUTE22 DLES22 YMEA22 ENPR22 MAYC22 REAM22 RSOM22 SEOB22 ICKT22 CHMO22
+HMOR22 WERS22 RTRA22 PING22 REFA22 TACT22 EATO22 OFTA22 BENT22 IAND21 TEDP21 SORA21 YSAT21
+HEEN21 COUR21 HTWA21 TWEL21 OOKA21 GEDI21 SEMA21 INTI21 OMEA21 OREM21 NGAS21 CERN21 OMEF21
+QUES21 USEI21 CESI21 OMOF21 RSTB21 OEXP21 YOUM21 TOPP21 EMST21 BYBE21 ATSU21 UTBE21 CKTO21
+OWAT21 TOIN21 NTST21 HISR21 TOAD21 TBER21 NECE21 YONT21 AINA21 ENEX21 HASI21 BAND21 OORT21
+DINP21 ASTE21 LOWT21 OWTO21 DTOW21 YHAV21 ILLM21 LSOI21 TSPR21 ERTE21 YEAN21 VERE21 EYEW21
+TEDE21 SSUP21 DBYI21 YATT21 ETOO21 NTON21 TIMA21 LYBE21 LICA21 ONSP21 YPAR21 UETH21 WASM21
+MTOB21 MTOT21 DOES21 SETO21 SMIG21 SIXF21 DSOF21 CHLI21 SEEX21 ANAL21 LARI21 DTWO21 RETT21
+NDWA21 SUBT21 REME21 HEEM21 GERT21 TESP21 SBEA21 HENB21 IMAL21 RDEX21 IDEW21 NTOI21 MSTO21
+ATGR21 EMIT21 NDTR21 NGWH21 TAFT21 LSTT21 TEAD21 LETW21 HEVE21 DDAR21 TICO21 SACC21 FGRE21
+YSMA21 CTST21 EENW21 DWIL21 ESSF21 RCEI21 ITSW21 VEFO21 ESDI21 TRUE21 EACT21 BEAB21 ESTS21
+LUEO21 LYFR21 HUND21 RICK21 NETS21 OFAM21 YETT21 HANW21 EABL21 TALW21 LLYT21 HOWT21 RITH21
+SELV21 PHIL21 HILO21 ILOS21 LOSO21 OSOP21 SOPH21 AGIT21 HEBU21 RSOR21 RECI21 RTAR21 WEIG21
+EDFO20 LEPA20 SIRE20 OCOM20 PTTH20 RDPA20 THAD20 ISSU20 IHAD20 WSOF20 BETR20 NSLA20 SLAT20
+OUNT20 STOC20 SECT20 SORO20 MSAN20 GOAN20 NOWN20 HEPU20 STBO20 NDEX20 LLSU20 SOFP20 NFRO20
+SSAT20 TESI20 SASW20 RACC20 NCLU20 MEWH20 KEMA20 ONEE20 GTHI20 GHIT20 ONDS20 ONBO20 ISAB20
+CIDP20 ALSU20 ROMS20 YSEN20 YBYT20 ADIL20 ETAK20 INDA20 HFRO20 TSAX20 NSAR20 EOPE20 AVEB20
+HEPI20 NAWA20 NVIE20 HINN20 NDAC20 DEDB20 EBRO20 EMOV20 STLY20 TATO20 TERP20 THBE20 ICHD20
+BYEX20 OTWO20 RWER20 OTHT20 NGSB20 YSEE20 REDH20 CARR20 FOFT20 RDTH20 ETOG20 SSTI20 ERDE20
+AMEO20 IXFE20 XFEE20 DPER20 SICO20 ATSO20 OREE20 NMAY20 LELI20 SOFN20 ARBY20 EOPP20 EPAS20
+POST20 OSEM20 MOFA20 BYSO20 CHAP20 GENC20 IEDT20 LYWI20 ETFR20 OROF20 CLOU20 LOUD20 BUTS20
+YSOM20 SSEL20 OSSI20 TBLU20 OFEV20 FEVE20 ENAW20 WIFT20 RSBU20 TISO20 TISR20 LEDI20 CHBE20
+TORD20 SMUS20 AMEB20 SSWI20 PTAN20 SALI20 RMAN20 RPER20 FANO20 ATBO20 ATEP20 RONE20 CIAL20
+ERSP20 HFAL20 ASWH20 YLIG20 OBES20 RMOS20 TMOT20 ONDF20 EXTT20 NDDA20 NOTD20 BEGA20 DOUB20
+MODI20 FICA20 NTLI20 PREC20 SHES20 URIS20 USIO20 OIST20 PALE20 ITEI20 ILTH20 KEEP20 HASA20
+GERA20 YBEA20 CTLI20 FORO20 SONW20 RMOT20 ITYW20 SYOU20 EORA20 ILLS20 ETRU20 RALI20 THME20
+GROS20 ITCH20 INAS20 DOWO20 LLBO20 ENDU20 IUMA20 AMON20 SEBO20 AMIX20 RALO20 ALOF20 ORPU20
+XTER20 DECR20 IROR20 LLUC20 NFLE19 RISA19 ESTE19 ESIR19 HITH19 ERSW19 ANSL19 HECR19 THAV19
+IMPL19 NMAD19 HITA19 OPRO19 ISCA19 AREF19 EROO19 HTOR19 MSTH19 MAYA19 YFAL19 TLEN19 INEB19
+ETOW19 OGLA19 IGRE19 YSHA19 RADI19 NERI19 SMBE19 SLYT19 ESOU19 INTQ19 RMAY19 EORS19 LSAN19
+ASET19 BENO19 KEAN19 TWOF19 YPLA19 ISEA19 SITU19 ENSW19 REVE19 EBYR19 WSHU19 RSHA19 ORAS19
+ARKR19 YETH19 ICKC19 MATE19 ICES19 OMEP19 DACC19 IRSI19 NMAK19 EOFC19 SHOR19 ITCO19 UREI19
+DSHA19 TSEL19 VENI19 OBEE19 EGAN19 ONGS19 ISPA19 UTSI19 OPAR19 LOTH19 EEMT19 SMTO19 ESUF19
+ERDA19 OLLE19 RAPP19 ISIB19 RYWH19 IUMT19 ARIE19 ICHE19 OLEL19 SHTH19 ERYD19 OLEA19 CHCA19
+AMEI19 ASCE19 DSON19 PRET19 YBUT19 SEND19 EEST19 WASD19 ALES19 REOB19 IVET19 ERGL19 HWAT19
+ONAT19 RUMP19 UMPT19 HEFA19 EFAI19 OLES19 GEOU19 YTHO19 ERNO19 RSUP19 YALL19 REAP19 TOSE19
+CLEW19 UEOF19 UALS19 EWMO19 HTAS19 EMUS19 ILLF19 LSOB19 ETTI19 OFTW19 RSOT19 LLDI19 RSRE19
+NSTE19 ADOF19 NINE19 NBLU19 LOVE19 SSDI19 EOFB19 DINC19 CHOF19 ENIS19 LLBY19 CEBY19 ERYM19
+KCOL19 EBAS19 ERDO19 HALI19 ONBY19 NECO19 RONT19 TMAK19 XCES19 HCOL19 IRWH19 ODYW19 BEAS19
+UCHD19 ANYM19 IDIN19 YWOU19 ENAO19 NAOF19 UISI19 YCAN19 IDAN19 BUTY19 RSWI19 TART19 ANBY19
+UTYE19 NIMA19 PITC19 OLEN19 EOFL19 SECA19 NGEO19 TADI19 FRED19 SSBY19 LUTI19 HENM19 PENA19
+NAIR19 KSPO19 SEXC19 DRIN19 GSMA19 VIRT19 IRTU19 RTUE19 CORP19 VOLA19 OLAT19 LUMW19 UTED18
+ADIN18 HEWE18 GSAN18 SCAT18 CATT18 NDSH18 SUNA18 IVEA18 VEAN18 WANT18 UTAL18 CUMS18 MSTA18
+RALT18 AMAN18 VEON18 DUCT18 NCER18 OWNT18 IDON18 ONSF18 YGRE18 UATI18 RTOW18 HISH18 UMAY18
+ESPR18 ONEP18 NEOR18 IRWA18 ODYI18 SELI18 NINS18 INER18 HTPA18 IRBE18 THTO18 ICON18 EBEF18
+GREP18 WWHI18 QAND18 ONCL18 ANEA18 UTTI18 EINE18 TLYI18 BOUN18 NEEN18 ENDA18 SISA18 ORSP18
+RSPE18 ANOB18 OFAT18 GUPO18 OSTP18 TSOR18 EERR18 ROMW18 OMWH18 YSDI18 ATPL18 STAK18 LTOO18
+LLYI18 CHPR18 INEW18 SENO18 YSWI18 NORT18 HEYS18 OREG18 PENS18 EREV18 EENM18 NITT18 EBYM18
+REXP18 TISB18 UTWA18 LIVE18 ONGT18 OFAS18 LYAT18 EEOF18 SBES18 EIRL18 CTAT18 OKIN18 RPOS18
+RSAT18 PLIC18 EUND18 DINO18 ROPI18 TOTW18 ERYB18 OUST18 HORI18 NGBY18 LBEC18 LELE18 EEKP18
+SLEN18 FSIX18 REDP18 ITWE18 REDU18 WASR18 ISHT18 KTHE18 BERA18 ATHO18 REGR18 ACEI18 NDTW18
+ATAT18 TICU18 EETF18 OUDS18 OBEO18 EEDE18 IFYO18 ARTT18 INGH18 ITAP18 SBYR18 URBE18 DDIL18
+INSI18 PTTO18 SREP18 SITO18 HAST18 DTOA18 ATEQ18 OREW18 LDIN18 ONEB18 RTAN18 DSEE18 ITYI18
+DTRA18 ERYO18 UETO18 TWOB18 BYAT18 DERO18 DINS18 NSHI18 LETM18 IALL18 IEWE18 ISWH18 ENBL18
+HENV18 RERA18 EYCA18 OOKT18 YSUC18 TICE18 LSUP18 NESB18 YOBS18 RSAS18 NGPR18 SMIX18 THON18
+ESLE18 NSES18 ORSI18 ASAR18 DEAS18 TITW18 TBYR18 IMAT18 UEMA18 ACER18 EYWO18 STSE18 ESSB18
+GATH18 INNA18 FACT18 SRAR18 LLAT18 NGPO18 TALO18 INGV18 BESI18 FUSI18 HETO18 SOLU18 RDLI18
+COMB18 EHEI18 ALAT18 HMET18 GRMI18 ONDC18 ATAD18 OWOF18 FVIT18 MONY18 ATIL18 LIDP18 ANIM18
+MALS18 TFRI18 TOPT17 NGDI17 TTEN17 ENOF17 IRSE17 ESAB17 DSTI17 UNIT17 CTOF17 LEFT17 AVIN17
+TEDS17 NICA17 CATE17 ALLM17 ISIM17 NGSI17 ETWI17 ATME17 EWTH17 EGRA17 AYOF17 YOFA17 NASI17
+HORS17 TSAR17 REMI17 OTHS17 ETIT17 TORS17 YSIS17 MEME17 SATE17 TELL17 KINT17 SESU17 ALIK17
+ALLR17 EEIN17 LBER17 WNIN17 FIGR17 COMI17 OWNW17 DSTO17 ILET17 HATD17 GLEA17 DIUS17 ACIR17
+LPER17 TRIA17 NTUP17 OUTF17 ASSS17 VEXO17 THSI17 SFIR17 RORA17 YTWO17 WOOR17 EORT17 DILY17
+FOCI17 BYAL17 LLMA17 RDSA17 VEBE17 OUTD17 ORSA17 ATEV17 TINS17 ROOM17 TORI17 EENP17 OLDA17
+HRIN17 ECOR17 TINO17 EVIS17 MENS17 GONT17 SATA17 UCHC17 HCON17 ELSE17 NCTA17 NDLA17 HENO17
+INOT17 NDBO17 MEPA17 ECLO17 DOBS17 OBSC17 CURE17 GSBE17 ONED17 PERD17 COLL17 LLEC17 ERER17
+OSTD17 OSEF17 EBES17 LLWH17 LUEI17 GESW17 XISO17 HTAT17 TSTO17 IMAD17 ETTY17 ERYC17 DWAS17
+FREE17 ITSD17 TMEA17 YSPA17 FILL17 NOTP17 FYOU17 HFOR17 NOTR17 MESL17 TSMO17 UEIN17 MTHR17
+NBET17 IOBS17 ESGR17 EREG17 OESN17 TIFI17 DAPP17 KENA17 OSIN17 HASM17 ISWA17 SCER17 ONBU17
+ECIA17 RBEC17 ALDI17 NEWM17 RIND17 SOBY17 ALAR17 PETU17 TWEN17 GMOR17 PONO17 HERH17 RHAL17
+NESP17 URSS17 WSTH17 AKED17 DEYE17 LLOV17 OBLU17 AMEN17 NDNE17 EWOR17 ISLA17 YITS17 TALR17
+LOWW17 TMUS17 OSTO17 NGLI17 OBEP17 RYRE17 OTRE17 DALI17 AROF17 ESUL17 RSBY17 NEOU17 LPLA17
+OWHE17 SFOL17 UCHO17 IKEA17 SSTR17 ISVE17 INEI17 MPUT17 RSUR17 LWIT17 IRPR17 HORD17 NCHT17
+USEA17 ESHE17 MESM17 OVEA17 OSPH17 ELIM17 ICKE17 BORD17 YVAR17 YBOD17 OUSC17 URSP17 ENLI17
+SOUN17 ORIU17 RIUM17 ITEO17 BYMI17 GETA17 ECIP17 ASIH17 CIDS17 BITE17 USCL17 SCLE17 TIMO17
+IMON17 DYAN17 VEPO17 SUBL17 BLIM17 FSAL17 OFSA17 EONL16 STEN16 EENS16 YEAR16 EPTT16 AREG16
+ULLY16 ISFI16 OANO16 ANGU16 BUTF16 RTOB16 RSNO16 UCTI16 TANO16 OSOM16 BELO16 GITS16 TBYW16
+YWAY16 HISF16 WASC16 ITSL16 MEPL16 EYOU16 OUMA16 MESP16 ONEW16 ORPR16 RANY16 HNOT16 OUSB16
+OSEL16 EETO16 YASI16 LYOR16 BLED16 ERLI16 RAYA16 ERAC16 NTOG16 GNAT16 PPRO16 BEEQ16 ADIU16
+LLPE16 UENT16 MEMA16 NGGL16 GGLA16 ACLE16 NYRE16 RROR16 GEMA16 IRFO16 ASLE16 ANDQ16 KENO16
+ENON16 ISEC16 OSEE16 YOUT16 NSMA16 LETC16 TEAS16 LLTO16 AAND16 RDSI16 PICT16 ICTU16 RKCH16
+KCHA16 BEHE16 SONL16 ISBY16 GEDW16 ASEO16 CTSA16 NWIL16 RSOA16 ENWH16 TBED16 ACEW16 AGET16
+EFIG16 EACC16 STIM16 RYCO16 ASDI16 TOAS16 ODOF16 SDON16 NDEG16 ABLU16 YBLA16 ACKA16 LAID16
+TMIG16 SCUR16 RDSB16 ANIT16 EDHA16 LFAN16 ARDI16 ANYB16 CKLI16 NESW16 ERIG16 SEBE16 LYFO16
+RYLI16 NSFO16 NITW16 NOTW16 LYTR16 NGEX16 UTEA16 DHOL16 CHBR16 TEWA16 ISAT16 SOBL16 NCHO16
+TWOL16 CING16 EOFF16 NABO16 TEIT16 SFAR16 VAND16 GSTH16 TABO16 ECAS16 YETI16 TINE16 YCHA16
+ESDO16 MTHI16 NDIM16 AYAN16 NGSP16 NDBR16 ASAT16 GBUT16 HBEI16 LEIS16 DUNI16 WAVE16 TLEC16
+NDGL16 TBEN16 YOUW16 NEAT16 AMSO16 OCOL16 OFIR16 YTUR16 LELO16 HILE16 DTIM16 ELLA16 RPET16
+ETUA16 ACEN16 NEHA16 TMUC16 ITWH16 LEON16 ENVI16 NTAS16 NAKE16 KEDE16 EDEY16 NGPA16 RFIR16
+UNEQ16 EPUR16 XTTH16 YMUC16 NEXP16 GHAL16 TEME16 ARTL16 STAS16 SOCO16 TEIN16 OONA16 TILT16
+OUSR16 XTEN16 RSUC16 HTER16 RKER16 OUBL16 UBLE16 OTOF16 RALR16 UREB16 OFFI16 TDEG16 OMPU16
+GPRO16 ORVI16 ANRE16 EARW16 UTOR16 PRED16 ESRA16 ESTP16 UMWA16 ERON16 ERYE16 TVIO16 EYDO16
+LEBY16 MESR16 USPA16 IMET16 MOSP16 EPIT16 YSTR16 IRFI16 OFMA16 ILLR16 EDYE16 REOU16 LUEM16
+IRDO16 ECOA16 WERO16 ENAI16 NGBE16 ENAC16 ARCS16 AIRO16 IRAT16 ALME16 GOTH16 ACUU16 CUUM16
+LTOF16 FTAR16 TCRY16 DBYS15 RGER15 EDPR15 RREC15 EADA15 UTTO15 IFAN15 REGO15 TDOW15 TITM15
+CHSO15 UNAN15 COUN15 UNTO15 HAVI15 EPEA15 PEAT15 DIDT15 RCIR15 TEWH15 NQUI15 QUIR15 SIGN15
+THOD15 SORC15 MWIT15 ESTF15 NCEM15 EFIX15 ONGI15 SCAU15 NBEC15 ETSA15 ITFO15 ASCO15 AUTH15
+GEIN15 HASB15 DEMO15 EMON15 GNIF15 ROOT15 SQRT15 YPOT15 EMIS15 MELI15 ORAR15 ARYI15 ORIT15
+RTSB15 SLET15 LARA15 YOFL15 ODYO15 NDAG15 EBEN15 TBYA15 HEYF15 CHAT15 LINI15 EDEF15 NSWI15
+RLIG15 ITSH15 BELE15 ATPR15 NGBO15 OLIT15 DILL15 NGWA15 EINW15 NYRA15 CLUD15 MBUT15 ERAD15
+RLYO15 ERIF15 RAYI15 GOES15 HAFT15 ALEN15 SORS15 NERM15 MAYT15 ESIL15 DFAL15 GPLA15 EEOR15
+SASA15 VEOR15 ISPE15 CEDT15 HTOT15 SFAL15 MIST15 OMOR15 MITA15 RGEA15 NDME15 SHAP15 MESF15
+ILLG15 BYMA15 INAD15 TWAR15 REDF15 ANAT15 ARDA15 REON15 NPER15 EYEB15 TNES15 EBYW15 NSDI15
+AGEA15 TOHA15 OSTL15 ORSE15 FIGI15 ERYG15 NGEL15 AYSU15 FICE15 CEFO15 LMOR15 ATFO15 FOOT15
+OTES15 RSLE15 OFDE15 LUET15 HMAN15 ORIZ15 RIZO15 IZON15 ERUN15 LVED15 HATN15 HTMI15 BSCU15
+SORD15 IFTE15 HIGH15 IKEC15 SSUF15 ITHP15 ACKL15 BETT15 PERO15 HESF15 ESEI15 ALFT15 RBYA15
+ANHA15 SBYW15 EEAS15 GALL15 LTHA15 HBRO15 THOL15 TSPE15 SASO15 PENU15 UMBR15 MBRA15 LEAT15
+ISMH15 MFOR15 YSWE15 NTWO15 YTHR15 DEND15 MARE15 WERI15 UPPE15 RTTH15 EDRE15 ESSC15 ANTL15
+GFOR15 HINB15 ARTW15 YDIL15 THPR15 ESHO15 RTST15 TOUG15 TSOT15 RDPR15 NTBY15 GMEN15 TASI15
+NDUN15 NARI15 UALD15 ESWA15 RYTO15 LESB15 CHRE15 TORA15 EDAP15 LORI15 SMAB15 NSAL15 DSEC15
+RATH15 GONE15 HERR15 HGRE15 EYAP15 PIEC15 IECE15 TATA15 ERVI15 ESTL15 ABLY15 RYMU15 OTDI15
+NABE15 ATOT15 TFIR15 RTLY15 NPAR15 YOBL15 TEON15 LLAS15 NSCO15 EXPA15 XPAN15 SARY15 INMA15
+URSD15 ATEN15 RYDI15 REIG15 RETR15 NDVE15 SINW15 DEVE15 TALT15 DEAR15 VENP15 EMAL15 OHER15
+ORFO15 PUTA15 VELO15 ELYI15 RTOI15 TOOR15 LOFV15 LUEB15 OPHY15 SRES15 XAND15 RRIN15 HTES15
+GRAD15 RADU15 ADUA15 DUAL15 SBRO15 IFEA15 ILLC15 TEPR15 EGET15 LEOR15 ICKA15 RTOA15 TAIR15
+OWMA15 ENTC15 BYLI15 ASHA15 KFOR15 WCOL15 SLYA15 ALST15 RSPR15 RGUE15 EVOL15 LLGR15 NORE15
+UBTI15 DSAL15 EMPT15 BYPR15 ASOL15 ESME15 CHON15 POTA15 MERI15 RSUB15 NBOD15 DDEN15 EPOR15
+DWAT15 RDEN15 ACIT15 RPUS15 PUSC15 OSMA15 ESPI15 IDSA15 ARKL15 RKLI15 DSPI15 MATH14 NSRE14
+SINF14 SCOU14 RITT14 HENS14 OKAN14 EPUT14 ILLH14 LLHA14 LHAV14 OFMY14 IEDA14 LAWS14 EANA14
+ORWA14 EXAM14 XAMI14 ETRI14 OITA14 DSWH14 ISSE14 ESEO14 ELON14 STIO14 HWIT14 OOKS14 RELA14
+PTIO14 IEDB14 HYPO14 POTH14 TTOP14 NSEV14 MAYS14 ONEM14 LETP14 OPPD14 NEWH14 EORL14 KEIN14
+LLYC14 ILYA14 GORR14 NCED14 IITH14 UNDH14 FIRM14 YSCO14 TSAS14 INON14 NEBE14 YINA14 OWNI14
+LINA14 GBOD14 STOI14 NOWW14 LUDE14 NSHA14 ANEO14 ADES14 DSID14 SORE14 CEOU14 DINF14 HSID14
+BURN14 UIRE14 HTFA14 NGPL14 ENIF14 NIFT14 RGEO14 INTT14 EOFE14 BEAN14 ORTE14 EANI14 EGOI14
+ULES14 ERUL14 OFAD14 CKCO14 NSEE14 EBRA14 BRAI14 TSAP14 ONER14 ATBY14 BYAG14 LLMO14 APPR14
+GANT14 ESEF14 SEFO14 NLYI14 SSFR14 WASV14 TBEM14 UGHW14 GLEI14 ADEW14 UPWA14 LUEH14 DHAL14
+RRIE14 TEDD14 STOG14 SLIK14 ETOI14 TWOI14 ERUP14 NAWH14 NGSS14 TSIT14 TLYR14 SINP14 EEVE14
+SMST14 ACOL14 OWLY14 HTON14 BEUN14 NTSU14 ARIM14 SIMA14 TSEN14 EEIG14 NCHI14 HINC14 SDEG14
+MEVE14 EEFF14 DSPE14 SMIN14 LSOA14 EDIR14 ISHO14 NITU14 AYSP14 OFPO14 TACC14 EIRV14 ROCE14
+OCEE14 POSS14 SSIB14 IBLY14 DCHA14 ELAN14 CHFO14 SEEI14 HEUP14 EUPP14 NDOU14 BEPE14 OOKE14
+SSIT14 ISTU14 ASGR14 NGFO14 EDID14 ISWI14 LITS14 NDCH14 OSTF14 CHLE14 LSOM14 CHAL14 SCIR14
+ISCE14 ITOR14 SECI14 ETMA14 DSTR14 REMU14 TOSU14 OMED14 OUWI14 UWIL14 WOPA14 TSFO14 EEIT14
+IRET14 GCOL14 ETOM14 OPAS14 URSR14 ETEE14 HBLU14 ETON14 DISA14 GESB14 ENTY14 HEWO14 URSH14
+SEAT14 ETIS14 PIPE14 ATAC14 DONL14 RIST14 IESS14 AFAI14 SYEL14 BYDI14 NSAS14 ITAS14 ONSC14
+RELE14 SSFO14 DHEN14 OWST14 HTFO14 SSCA14 NOWB14 OWBE14 TSPO14 ARRE14 ULTT14 GEDB14 RUME14
+ISEE14 OFVA14 ARMO14 TRUT14 RUTH14 FACO14 SUBD14 UBDU14 NCHF14 RCES14 UEWH14 RORS14 ETOR14
+STVI14 TRIK14 DMAY14 ESED14 GTHS14 APTT14 TOST14 FORP14 LLYB14 ETAI14 DYWH14 REDY14 EDOM14
+VARY14 OACH14 URNA14 BEEX14 UPTH14 ERSC14 JACE14 EGRM14 LOBU14 OBUL14 OMPR14 MUTU14 UTUA14
+SENC14 LOBL14 RRIV14 ROBA14 OBAB14 BABL14 IESC14 NITR14 STCR14 METS14 FUME14 SITN14 SMED14
+COAS14 WRIT13 ADDE13 ROUT13 DPAP13 VEDE13 DWER13 SETD13 ETDO13 AYNO13 HSOM13 MOON13 ANAC13
+EREX13 OLEF13 SNOR13 NORR13 ATEW13 STTO13 RSFO13 LENT13 DSUB13 JOIN13 SWHO13 OHAV13 TOSH13
+WAYO13 LYPR13 TBEF13 AREL13 OTED13 TBOO13 OOKO13 OFOP13 RTIM13 OFPA13 THSU13 OPTH13 LYAF13
+YAFT13 FERA13 THNO13 NTBO13 IKEI13 YAGR13 REET13 NEDB13 EHOM13 LCOM13 ULDA13 REEI13 YBER13
+KTOT13 INAG13 CEIF13 AYSH13 SLIN13 CESH13 FSHA13 NBEI13 LLPO13 ETHT13 ENTU13 STSI13 USTO13
+IRDA13 CHAF13 LEDA13 TSFI13 BEPA13 GETO13 FIGB13 IFIN13 FINT13 ERTW13 ONSM13 SSUR13 ENSB13
+DSOR13 ITUA13 TUAT13 ANYW13 AHOL13 ATOB13 HAPE13 OMOT13 RRES13 RELI13 LBEI13 INVE13 VULG13
+ULGA13 LGAR13 OFOB13 ECRY13 DBYM13 ISIO13 NOTC13 DITA13 EPAI13 HEWS13 FCON13 NSHO13 RTSI13
+BYAC13 NBYR13 GWHE13 SESE13 GELS13 LSET13 ENIE13 NIEN13 YBEM13 ESUM13 ELFT13 NTOR13 NDGO13
+TFOL13 NOUR13 LARR13 ASVE13 WDTH13 EHOR13 LEWI13 SMWA13 OWCO13 DOVE13 ITHB13 HECL13 SELY13
+LUEC13 SMWH13 SAGR13 ITHR13 NSOT13 HEFL13 WOIN13 EREL13 FEAC13 NGGR13 GGRE13 ASNE13 NTWH13
+HTMO13 OMER13 ETOD13 IESF13 AWTH13 ESCE13 DSTA13 GLET13 EREE13 ENAS13 TWOC13 FAST13 OLAR13
+GEWA13 TOVA13 DVAN13 WASE13 ACTL13 NTWI13 HOTH13 ORFI13 RYFA13 INTL13 HOLL13 OLLY13 OMEI13
+IDNO13 GNIT13 NTAC13 OFMO13 LEMA13 ABEA13 SELE13 OFHA13 NDBU13 ATBE13 OKED13 ISMU13 FBOT13
+OBEM13 ARST13 TURB13 NOBL13 LATA13 RYRA13 NGIM13 ACTT13 DAGA13 EAGA13 INLE13 DERB13 STIS13
+OAGR13 TTOW13 DFAR13 YMOR13 SUNI13 TISC13 ANUN13 TISN13 ILLL13 SOOF13 HSOF13 AOFT13 LYDE13
+SSWA13 TALI13 SYET13 TRAI13 OUSI13 OSUC13 HREF13 EVID13 LLON13 SSPE13 EEKA13 WOBE13 RUMO13
+BYTU13 PENE13 MABC13 EITW13 ONEH13 ENWI13 LLFA13 TINF13 WEDT13 IGOB13 GHTN13 YORD13 WORL13
+ORLD13 LDAN13 HEFU13 LFOR13 EUSE13 LYMO13 LEFO13 SEPR13 SREM13 ANOR13 SOIS13 LYMA13 OWIS13
+DNOW13 ALBE13 FCOM13 TOCA13 DOWT13 RECA13 REEX13 ORTR13 NDPE13 ESEB13 TSWE13 EAKE13 AKER13
+TRUL13 RKIN13 OUSE13 LTTO13 HLIK13 UTDE13 ELOC13 LOCI13 OCIT13 NGAT13 ARDE13 DERW13 FITB13
+EBEG13 ACTU13 ALOR13 TTRI13 DMIN13 DNUM13 NCOU13 NDCA13 YTOB13 ELIT13 EICO13 RYSM13 ITEC13
+BLEM13 NWHY13 DERF13 EROB13 ROBS13 EEPI13 HLES13 HEER13 MIDI13 IDIA13 ITYB13 STLU13 LBES13
+GPOW13 TWOG13 WOGL13 OFME13 NGME13 CKTH13 YBEE13 GMOT13 SSHE13 RTII13 WMOD13 RFOU13 DOMI13
+OWRE13 FEAT13 EENL13 LOWM13 ROBL13 IXDW13 XDWI13 HENL13 TMED13 URTO13 OFUN13 LLAM13 URDL13
+PROA13 ROAC13 ONWA13 NWAS13 CELE13 COAL13 REVO13 SIZE13 FGRA13 ORMI13 ORON13 NOFI13 BOWS13
+TORN13 BULE13 ROPX13 RBOD13 ULTL13 TOME13 YBEG13 VESU13 SWAT13 BSTH13 LOWR13 WOFT13 RSAL13
+MPIN13 AGNE13 GNET13 NVAC13 ACUO13 HURE13 QUAF13 UAFO13 COHE13 BYSU12 ELYB12 DOFS12 ETAR12
+RYAN12 DDED12 WELV12 ARSA12 DBOO12 SSUB12 TOUT12 ENBE12 HADT12 OWNA12 MYSE12 YSEL12 ELAW12
+HERL12 CROW12 RABO12 DEAV12 SLEA12 EWHA12 ESIG12 NDHA12 ERNI12 HECU12 DMAD12 HEWT12 HUSI12
+ITBY12 NOTY12 OTYE12 ISFO12 ISNE12 LLYP12 SLEC12 EUNI12 RSIT12 FOPT12 TTOE12 TOFL12 ISST12
+ORPA12 HMAY12 NYTH12 OTHN12 RWAY12 RORL12 ELUM12 ODYT12 REAK12 DTHU12 OFTI12 ASIF12 AGLA12
+GINS12 NIST12 SICA12 ACKT12 ORVE12 AGIV12 NEIN12 CTUP12 LETF12 RCAN12 CHME12 NNIN12 APLA12
+SSET12 OBYT12 TACL12 ANYL12 NYPO12 NGOI12 UNDW12 ALPO12 LLAF12 ICHR12 LEDT12 ILYT12 UALP12
+OTHW12 UCHP12 SSER12 ETAS12 RYWA12 ANST12 SORR12 TAGA12 ECTW12 EHEL12 EACO12 ONAW12 ORSH12
+SKIN12 FFRO12 NALO12 FIBR12 IBRE12 BRES12 URAS12 DENO12 GHAN12 TTOS12 DUED12 NGNO12 NCTU12
+TSBE12 SEYE12 RDFR12 EINP12 MELE12 HEBI12 AVEF12 EADY12 CQUA12 TOOK12 LSID12 THAB12 NSPI12
+EWDT12 ELDI12 DEWI12 EMIG12 PWAR12 LIFT12 DSBY12 UEHA12 IGHE12 HEEL12 UECO12 ARDT12 NESD12
+EFLA12 DSCA12 NUPO12 OPLA12 NHAL12 OTWI12 TEXP12 OUSO12 HTAR12 TSMA12 GILL12 ASSP12 NFIR12
+TTOD12 STWO12 BYDE12 TTWO12 UBTE12 PPAR12 ASDE12 ATWA12 TRYI12 HEAB12 IREM12 EEFR12 ESIF12
+ETWA12 RUMT12 UTSO12 LLYO12 ASSC12 LEDW12 RLET12 YTOW12 TSEM12 SOFV12 GRED12 ITSM12 NDLO12
+NWER12 YARI12 ANYD12 UTWI12 BYAS12 ASEC12 WAYA12 HERN12 YSBY12 AFOU12 ICHL12 ORBI12 TOAL12
+ITOU12 YSCA12 TOAG12 DASW12 MPTI12 GWHI12 LLES12 ISAP12 TIPL12 ERLE12 INLY12 OTBY12 INAF12
+OMEC12 ERCI12 WOOF12 MESS12 ROKE12 NGMA12 ONDB12 WNTH12 ANWH12 ILEA12 CHWH12 NERO12 ISAW12
+OBED12 IUSE12 NEBY12 OVEF12 ENAK12 GPAR12 WASF12 VABL12 OURC12 KTHA12 STHU12 RYOR12 OKTH12
+LBYT12 NCTE12 DFIR12 GREF12 VEDA12 DSOB12 SOBE12 NEIS12 LYVA12 BYAP12 APPL12 TVAN12 SOUG12
+NDEI12 YBEP12 RBYR12 EITA12 ARSB12 OSEV12 ESAG12 ATSH12 UDES12 OVIN12 TLYW12 NGHO12 NARR12
+ACOM12 KERA12 LLSE12 TSDI12 UMSA12 ROPV12 HHAV12 NTAL12 CHWI12 MBOT12 BYVI12 RBEI12 VEAT12
+MITO12 SACT12 RCEA12 ALWI12 AVEI12 EANR12 TCIR12 RSPA12 IVEF12 EORF12 UMTO12 YDIF12 ECKO12
+CALP12 HESM12 NTCO12 EDTI12 TYWI12 CINN12 SDEN12 FTHP12 OUTB12 ETBE12 ARIF12 TARS12 OREL12
+OTRA12 SSAS12 EHAV12 MPRO12 AREV12 TEYE12 RTOO12 WARM12 LIMA12 COLD12 GRIN12 ESOB12 CKER12
+OFSH12 EBYL12 LSBE12 LBED12 ROIL12 GEDT12 RYEL12 OYEL12 NGEI12 RDWI12 CHDE12 BECH12 RSCO12
+TOAR12 SITM12 GREY12 URWI12 WMAK12 MONG12 NEIG12 LCON12 DMED12 IUMB12 NAME12 UEWI12 OLOR12
+ACTO12 TEET12 BTIL12 ENEV12 RCED12 NRES12 ESSM12 ROME12 SENE12 SEBY12 UTRE12 EDBL12 POTW12
+OBSW12 IXDB12 ORNI12 SRIN12 EXPR12 XPRE12 URPE12 RWAT12 YHEA12 HEMU12 SLAN12 PENT12 IMPI12
+SGOT12 FSUL12 DSUR12 ETSG12 NEPA11 ISTR11 ORWI11 UING11 TLEM11 RDBO11 ISPU11 AVED11 ITON11
+VEHE11 REPU11 DWHA11 MAYN11 ECRO11 ESAP11 EAVO11 OBEF11 VEAL11 FTIM11 MEFR11 NDSW11 CKIN11
+INAP11 CARE11 REFU11 NIFI11 RSQU11 EMBY11 IVEI11 YINS11 ETPA11 ASTL11 ORSU11 GHTD11 NETR11
+TICI11 ICIA11 LITE11 GEFR11 UCHG11 HCAS11 ESDE11 EXIB11 DBAC11 INSA11 TLIK11 VTHE11 DORR11
+LLAL11 ALLH11 FFIR11 NAGI11 DEOU11 ETFA11 TSSI11 NGEQ11 GEQU11 RIAN11 EREQ11 OWLI11 DPOI11
+SDIV11 ORBE11 RGET11 ETOS11 NYSE11 EORM11 REPL11 YFIN11 CTHE11 BETA11 ARYW11 IETH11 THFR11
+CESP11 NDUP11 TOTE11 MOTE11 REGI11 CHSH11 ORFR11 YSSH11 ALLF11 BEON11 ECTM11 NYWH11 TEBO11
+BERW11 DMEE11 SHEE11 LLOR11 RETI11 CANT11 TLYO11 LYIF11 ENAL11 RTIN11 FLAT11 OTCO11 LESF11
+RGES11 ASSH11 ADUE11 ENEI11 UREM11 ECTB11 RTIL11 UNTE11 NISM11 OWIT11 TVER11 HEND11 URAU11
+RAUT11 ORSL11 NTME11 VEDF11 DFIG11 RDIF11 ABLA11 STIF11 IVIE11 GHWH11 THBL11 CLOT11 NDOB11
+DDOW11 FEAN11 EAFO11 EBOA11 HTAP11 RLIK11 CLOS11 RMTH11 REAF11 SEFI11 EIRB11 ASIC11 REDD11
+DSOA11 UREP11 SNEA11 VESE11 TMOR11 TLES11 UNCO11 IGIL11 ATAR11 STAT11 TSHO11 FITW11 REIL11
+WORE11 NDVA11 UNSD11 EBYS11 SOGR11 LYOU11 ISMM11 TBEE11 ASSF11 BUTH11 MESU11 RLYW11 SIFO11
+AKEI11 ENTF11 TFOU11 VETI11 MOFC11 YFAI11 USPE11 NDPO11 DIDN11 NTMA11 AGEN11 SMAK11 ISFA11
+HADA11 ECEI11 BYAD11 ADBE11 YTIM11 NERE11 YSUP11 ISAC11 YDIV11 RCAS11 GIMA11 UTAS11 ONSS11
+ISEN11 ISMD11 AYTO11 ESEL11 LARS11 NLEN11 TMAD11 NLYB11 ASMO11 RDBY11 ENRE11 REAG11 NNUM11
+AGBH11 NTIR11 SITH11 OFPE11 WMOR11 AINL11 ORCR11 ORPE11 BEPL11 HEYT11 INBY11 WOFI11 ACEM11
+NDIA11 TOMY11 DTOM11 UPAN11 GHTU11 NDTI11 ARON11 EDIV11 LLYD11 ESLI11 ITHG11 TFAR11 DOFO11
+NATA11 TWOM11 DOWW11 RVIO11 ARYO11 NSBY11 DCAS11 RSFR11 IESM11 BYAB11 YABO11 EPOL11 DSUF11
+DDON11 RSTF11 SREC11 IRMO11 NHIS11 OUSS11 LOST11 EASA11 OTFO11 MOIS11 EKIN11 DRAR11 GANY11
+RTHP11 CHAC11 RIAL11 NGSE11 LOSI11 LYOF11 ITTI11 EINN11 EPTH11 RITW11 ESSP11 KEND11 ARRO11
+RROW11 ROWE11 EASS11 OFEQ11 FEQU11 TLEI11 DEGM11 UMWH11 ROMB11 RULY11 SHEL11 PERG11 ERBL11
+STAC11 SELS11 AINW11 ETDI11 RYOB11 EMAR11 AIDT11 TTIM11 RTEE11 VESW11 ATEB11 TEBU11 SSMA11
+SSAL11 HOLD11 IESR11 NORM11 OANY11 AVEM11 SGLA11 HESW11 ICHO11 CHFR11 URSU11 RNTH11 OURM11
+STOD11 EASF11 OMEL11 LEMO11 RECK11 CKON11 EDWA11 ANTA11 DMUC11 GSWE11 ERTR11 TORT11 TLUM11
+TSWI11 ENAB11 NHUN11 UTET11 ORWE11 TALB11 DCOP11 OLDI11 RYFI11 ISAR11 SQUI11 VERO11 NGBU11
+RBYS11 TBYM11 LUMA11 OOUT11 LUMT11 DYIS11 YNEW11 RBLU11 NYSU11 ALSB11 MEWA11 ERDW11 ISTE11
+ROSE11 INDB11 URSC11 NEWC11 EWCO11 EDHO11 SDEP11 NDUE11 UEDW11 PERL11 TGRO11 YSMO11 YTOU11
+DELI11 RORB11 NENT11 OFDI11 EFAC11 GSWH11 FARG11 ORGR11 INQU11 LAMI11 DBLA11 OSTE11 SHAN11
+BYST11 CIPR11 ROCA11 OCAL11 REBL11 ROMP11 LEBL11 IDOF11 EBOW11 OPOF11 RINW11 MIND11 NAFT11
+HEAV11 VENS11 ORBU11 ATSI11 HALO11 PLEN11 RINE11 LTLY11 MASS11 LPOS11 TSUB11 BSWH11 EMBE11
+GREW11 ARDB11 WRED11 ULTI11 GOBS11 KRIN11 ALOB11 RDRI11 EEXH11 EEMD11 ARIA11 IATI11 POTS11
+RBUB11 OCCU11 ALPH11 TQUA11 YSUB11 IZES11 VEGE11 EFLU11 IREA11 RHEA11 TSGO11 LEME10 TYIN10
+UTTW10 TOAV10 NGAG10 SPUT10 AVEH10 DSPR10 EIHA10 AWSO10 LANG10 OWNS10 AVOU10 VOUR10 CCOU10
+UTFO10 LEAV10 NTSW10 UNIC10 IGNI10 MSAB10 EARF10 RFIG10 PARI10 EMWI10 ONIC10 ESIM10 GSIN10
+NGSC10 TMET10 EOPT10 EADD10 MEQU10 HISN10 NOFS10 YPRI10 THWI10 OOTS10 ERSS10 AXIO10 XIOM10
+EASW10 STSO10 HSUC10 STLI10 RAYO10 DORT10 EIRW10 SREA10 USBO10 TBEP10 UTSE10 EDBA10 ACKI10
+MFRO10 ONSU10 LEDE10 NEDE10 RAYC10 TWHO10 TSBU10 SOFH10 OFHO10 FHOM10 HTSI10 EINO10 EISE10
+ISEI10 YBED10 NSBU10 WNWA10 YOUG10 OEQU10 IANG10 NGUL10 LARE10 REEP10 ELLP10 EDSI10 DESW10
+WLIG10 IDPO10 CALS10 ATRA10 FIGA10 ALRA10 LRAY10 NYOB10 RALM10 RPOI10 EDSU10 BYTW10 GEOR10
+ECAL10 RFOC10 YSAS10 NONT10 NALS10 DANY10 WAYF10 SDRA10 TEOR10 ASEB10 RLEN10 TBEO10 ETAG10
+SOIF10 IFAS10 HEET10 EPIC10 POND10 TEAC10 RKRO10 EYEI10 EISC10 OFFF10 FFFR10 LYPA10 EOFV10
+YIFT10 ARCO10 HYTH10 CAVI10 EARN10 RNOT10 MEPO10 LYPL10 CTIT10 YGLA10 OWHA10 TICP10 ICPA10
+CPAR10 ROPT10 EDFI10 NSPR10 LELS10 THAR10 RYBL10 ERIV10 TSIX10 YDEG10 DOWI10 ERWE10 HFEL10
+VERW10 ATNO10 TMIN10 FWIT10 NSEL10 ONIF10 DSUP10 PAST10 URSL10 IKES10 AWNO10 SBEL10 ACHE10
+TLEH10 EDAG10 TALE10 NASH10 NCTT10 RETE10 TINL10 MNTH10 HWHE10 ORBO10 ESOT10 ESWO10 BEGR10
+YDAR10 RATA10 NCHB10 OLEM10 RDIM10 FITT10 SAWT10 NARY10 IXDI10 DBEM10 NSON10 WOCO10 MSAR10
+SUNL10 NSIO10 EENF10 CHSU10 OUTE10 ACIN10 EXAC10 XACT10 EDSP10 SMSW10 MSUC10 SUSP10 UDEO10
+BLEC10 GESI10 ATRI10 LELA10 DATL10 ADDI10 RAFT10 EATW10 TROU10 RINR10 UEAT10 NLYA10 SEBR10
+ASPR10 ELDT10 MINS10 REDV10 EOUG10 SSCO10 NYDI10 YSIT10 DIDA10 AGEM10 RRAY10 ATIM10 EORB10
+GHTY10 OBEW10 ERSB10 ITSU10 EDFA10 CLEB10 EALO10 IVEO10 NUME10 UMER10 YMUS10 USTA10 ALSE10
+GSPE10 SEDW10 GBHC10 NOWA10 YWAS10 BEDA10 TIRE10 SLYI10 TLYD10 EYTH10 DESB10 UTTY10 REWE10
+RSEN10 SEVI10 LLFI10 ORMS10 WOLI10 GMAD10 BCAN10 EDWE10 VEFE10 OMOV10 INMO10 OVES10 TRAJ10
+RAJE10 AJEC10 DNEX10 WOOB10 AGOO10 ITHV10 EBYC10 HORA10 NANO10 OVEI10 REDN10 COIN10 TIND10
+GOBL10 DNEA10 EEAC10 ETBY10 GEON10 UCHS10 ARKA10 KEIT10 ADEU10 LYGR10 WASG10 EHAD10 MBEI10
+ANEV10 TUTI10 ARVE10 TEDN10 INHI10 QUET10 LESE10 NGEB10 ATFI10 GCON10 MEKI10 TCHA10 DFAI10
+YGOO10 YVAN10 ENPA10 EENR10 LEGR10 OFAF10 SOSO10 SVAR10 RDAS10 ENEO10 OUSM10 IRDF10 UNDO10
+KECO10 GLED10 LYUN10 WEAR10 AKEB10 DBES10 BENE10 MOVI10 ANSI10 RORD10 UDET10 SDIR10 DINI10
+EGMI10 ESSS10 WORK10 RBIT10 SFIT10 TARI10 CLEO10 UTEO10 EMAS10 NYME10 NOBS10 RMEA10 SURI10
+STAP10 ARGR10 NABL10 ETOH10 OFWI10 HADI10 HWIL10 FVAR10 TLEB10 LARM10 RVEL10 ALLN10 RCEO10
+TOAC10 CTSU10 ITEM10 ARWH10 CEMA10 TOPO10 ATAS10 EMWH10 ATWE10 NNES10 NTOE10 VEIT10 UTHE10
+GEDA10 LLWI10 CTWH10 UEOR10 TORO10 ESTM10 OWBY10 LNES10 PUTI10 RYGR10 RIKE10 RTSW10 DSOI10
+GERB10 IRLI10 EMOO10 NOTG10 TRET10 ECUB10 CUBE10 EMAG10 EBYB10 OCAU10 MESB10 EYEF10 ITEY10
+VECO10 OSSE10 TLEO10 DASM10 BRIN10 ERDT10 NGVE10 SCRA10 ATCH10 RCRY10 ASUB10 DUPL10 UPLI10
+MAYP10 FPER10 GOOU10 SNEC10 ETRE10 SMOT10 RVAR10 MORS10 SWIF10 HARI10 TODO10 AYWI10 TWAT10
+ENEW10 ERGR10 LUES10 USEW10 STEM10 HTMA10 ISHB10 LOWN10 NYBO10 RMAK10 NPOW10 NASS10 DALM10
+TOHI10 NMIX10 ETBL10 FICQ10 ICQU10 DRET10 IKEF10 SMOV10 HTOG10 TEWI10 HEMF10 OFBL10 TOPU10
+RDOF10 SOLL10 OLLA10 RTHC10 NSEB10 ESEX10 DINW10 DMAN10 TLYF10 RTAK10 NINF10 LSTO10 NNAB10
+ABER10 ENET10 GHTX10 HTXY10 OTFR10 STAB10 TRAL10 SATW10 ELYU10 OTWH10 IUMW10 ACTA10 RIAT10
+EATB10 SEXH10 BEIM10 RDOR10 SREQ10 SCRY10 IDME10 LLPA10 ALTS10 URNT10 EXHA10 EOIL10 RINP10
+FANT10 UIDS10 REPO10 RMDB10 MDBY10 NFIT10 RMON10 QUDO10 TOFN10 FING10 EVAP10 TOFU10 ILES10
+LPHI10 RSTE9 EHAR9 ONLI9 BUTE9 GDIS9 MENO9 IETY9 DREA9 ADAT9 IRME9 PLET9 EORY9 ASTP9 TTOG9 VOID9
+GOTO9 SHER9 EHER9 NACC9 ATMA9 DEDW9 IDID9 NTOU9 TANI9 ICIT9 SHDA9 DTOS9 ITYF9 TYFO9 SISC9 EBOO9
+ELYP9 NSFR9 LGRE9 SUSE9 RERO9 OKOF9 LSUC9 TEMP9 FPAR9 ITPA9 WAYI9 IANS9 HELU9 YILL9 RPAS9 NEME9
+IFLI9 TOUS9 PONW9 EYFA9 BLEW9 HTOB9 SBEG9 EALA9 IRMI9 EATL9 EOFH9 ASWI9 IONL9 ANEW9 ONOU9 EISS9
+EEDS9 EDSE9 ALLG9 ECTU9 LBEF9 INEH9 CUTT9 TWOE9 EEPA9 EEAN9 OSST9 HTHR9 TAKI9 EXTR9 XTRE9 RMUS9
+ENSS9 ITFR9 YPOI9 DBYE9 ONDR9 EALR9 MSOM9 BLEE9 NESM9 BISE9 EDBO9 AYFR9 ANYI9 XIST9 DPAS9 VEWH9
+XISA9 BEAC9 CLEI9 LMAK9 SFLO9 ATPO9 NTFO9 NTBE9 ISON9 ETOC9 GEBY9 TOBJ9 ELDA9 ERYP9 INSH9 KROO9
+ATEF9 ORNE9 SBEY9 NOFF9 OSTT9 RAMA9 RIMP9 EBEY9 SIGH9 ESOO9 UREF9 EERE9 NGEY9 GEYE9 TINI9 EYEN9
+OBEN9 GERO9 GEAT9 GEWH9 UNFO9 OLDS9 YOFM9 NDTE9 HGLA9 ANCO9 RWHA9 LYAP9 ENDW9 SANE9 NGIS9 ROPP9
+HDIF9 CHFE9 MBET9 TEDU9 SBLU9 GHER9 ERAG9 LEIL9 LYBL9 GLEB9 ALFI9 RDIL9 ASTU9 STUP9 PTOT9 EHIG9
+STST9 SEPL9 HBYR9 SSWE9 NDSC9 RSON9 ULDT9 NCTI9 MONI9 OFOL9 NOMO9 OALS9 ADEF9 RLYU9 DIME9 SOLA9
+SONI9 SSID9 LYBU9 TONI9 UTHA9 ENTD9 SANG9 WASL9 OMEV9 NOSE9 DFRE9 OABO9 ORAB9 ANYF9 YETA9 YREC9
+RKEN9 MAGI9 AGIN9 NDPT9 AGEI9 POFT9 SODI9 DTUR9 TSBR9 SBRE9 EDVI9 TTOH9 SHAT9 SBED9 RTWH9 NDAP9
+NLET9 HPRI9 HTEN9 SMSO9 YSHO9 BEAG9 RITY9 CESM9 DATH9 SQUE9 METR9 LEBU9 ULDI9 INNU9 EYMU9 HMEA9
+ARIG9 ESMU9 UMSP9 SDID9 MSBE9 NLYW9 ANEB9 NORO9 BLEP9 SOEV9 OEVE9 NMOR9 ISEV9 NTPR9 ISYE9 MMAY9
+MGRE9 LFIN9 DCRO9 BYTR9 IREN9 BROK9 ASTD9 ITFA9 OMYD9 GEBE9 NDCL9 RDTO9 LBEM9 EXTA9 UNCH9 SEWE9
+TLYU9 DVIE9 LLYW9 ELYW9 ETWH9 NLYS9 EWST9 TIFA9 REPT9 TASW9 SMSI9 AMEF9 RDSW9 HESB9 IRSP9 DTIL9
+TWOA9 ULDM9 ANYA9 DEUS9 ULLI9 DLIV9 IONN9 TENO9 YATO9 TOTR9 NTOP9 FABL9 LARV9 CEAR9 DOIN9 INEX9
+DAPA9 GLIG9 RDWH9 CHEM9 GEDO9 SIFI9 TSUF9 HTOP9 ASEX9 MYOB9 URFR9 OODO9 LLYV9 EAMM9 TPRE9 SULT9
+RAGA9 DEIG9 USRA9 ATSE9 OREN9 REEL9 HANS9 ASAN9 EPTA9 OTHR9 ULDD9 EOPA9 ISOB9 HITW9 LESP9 AYBY9
+ASPE9 ADEM9 FORD9 ERNE9 THSA9 BYHE9 RSIX9 ISVI9 LEPR9 LDRE9 CEBU9 OPVI9 ANTT9 RMLY9 EISI9 TOSA9
+ISGR9 STFO9 BEVE9 EMBO9 HETA9 TEFO9 RASA9 ANYV9 YBRO9 DONB9 ANEI9 LYLI9 LMOT9 LACC9 CTON9 OFFO9
+EITT9 GMIN9 NDNU9 SANA9 NOOT9 DDEG9 HDIS9 MEFO9 THCO9 SOFF9 TOEM9 SVIO9 ESTD9 TLEL9 TLEF9 ICHV9
+SFEL9 WESH9 NSWA9 LDSE9 NETI9 YEND9 AFAR9 REVI9 YDON9 EGAT9 VEXS9 OBEV9 HDAR9 NGLA9 NGEW9 TERH9
+OSSB9 DBRI9 ORNO9 RONO9 IXDS9 LYSO9 ROMH9 RNSI9 OTTE9 STER9 RTOE9 HEMD9 KERI9 RUBB9 REEM9 EEMI9
+EDGR9 LYBR9 ASTW9 ESBR9 SBYM9 NDQU9 LENC9 NPRE9 LLDE9 PQRS9 OFLE9 SOIT9 OSTS9 YIMP9 YWHO9 OWMU9
+WMUC9 LIND9 TOYE9 DBYO9 SCHA9 NUED9 SSOA9 NRED9 STED9 RSDE9 NOFL9 KEUP9 OALL9 NGEM9 UGHS9 GMED9
+ONFR9 ERKN9 RISH9 EAGR9 EENE9 IXDA9 AMID9 NDEV9 CUSG9 EATG9 SLYR9 VALO9 LYPE9 DMIX9 NSTT9 CALM9
+OPUR9 LITB9 PLEB9 FASO9 MONC9 DLEB9 OWBU9 WBUT9 RORI9 NALP9 TWHA9 YPRE9 EENC9 EBOR9 TBYI9 ERAI9
+EHOW9 GINO9 SOWH9 DYTH9 SPLE9 FGOL9 ORGL9 UDON9 VEDB9 CIPA9 IPAL9 YIEL9 IELD9 ALSP9 MULT9 EPEL9
+NGOB9 FANA9 ESAC9 MUSC9 DSPO9 OREV9 HEAS9 DBYV9 ROUS9 ULER9 HOUS9 IAMO9 MOND9 DOIL9 TURP9 TRUU9
+RUUM9 NTOV9 MPTY9 RORG9 XHAL9 PUTR9 EHYP9 LTOR9 FWIN9 WINE9 ONYA9 NYAN9 ONIA9 SHDP9 HDPL9 EIRH9
+RSEO9 HYPE9 RBOL9 EELA9 XDBO9 ELEC9 CTRI9 XPLO9 PLOS9 OSIO9 ISCR9 FUNU9 CIAN8 NLIN8 RIBU8 PROO8
+ROOF8 NETO8 ONSR8 WEST8 ISEM8 YALS8 LSOC8 YEXC8 IRDB8 PUTE8 RTOD8 HADN8 ADNO8 OTOU8 TOFM8 WNAN8
+NDFU8 LLYS8 PUBL8 ABRO8 TOGI8 OGIV8 FBUT8 RWAN8 ERSN8 HADS8 TIHA8 TOOT8 NDPU8 DBYW8 EORE8 RESW8
+RSAG8 CRIP8 RIPT8 GSUC8 DEIT8 REFI8 ERSM8 LTRA8 LSOW8 WNTO8 TTAK8 SSEN8 YETS8 TSAT8 SOPT8 RDED8
+SCOR8 ESOP8 ICKL8 RSUS8 IPTI8 BYGR8 HEEQ8 KSPA8 SBOT8 MOME8 MEWI8 ISLE8 TORP8 ARAY8 HTDE8 DAGR8
+BETU8 BELI8 USMA8 NANI8 RGUM8 GUME8 HETI8 AVEC8 OLIG8 XIBI8 OFAG8 DAIR8 IKER8 SSIM8 IWOU8 HAGR8
+LPRI8 RAYT8 OMBE8 GWAT8 AIRF8 ONSH8 INEC8 HEYO8 QTHE8 ECUT8 SMOF8 SSBO8 HTWO8 DWEL8 ETAC8 DEBE8
+OESO8 EXON8 LYCA8 TOKN8 OKNO8 TOLE8 LPOI8 LAFT8 RBEP8 ORAY8 IGBE8 GBET8 ECIN8 DSEV8 USAS8 IONH8
+ETTO8 ETHF8 IGAN8 TSSU8 TRES8 IOFT8 NSSO8 YSFA8 OOBL8 VENA8 YSFL8 CEOR8 SANY8 INTB8 SITA8 OMAL8
+LDAT8 XTHA8 LYEX8 FOBJ8 NADA8 FIGT8 TSLI8 YMOT8 KNER8 YOFS8 WHYT8 PPLY8 TYOR8 DDIV8 STOE8 ELOO8
+ALLV8 ACKW8 SERT8 NFOL8 FOLD8 RYOF8 STNO8 IREX8 XPLI8 SUMO8 EEDO8 YSUF8 LEDG8 ITOO8 CUOU8 IHEL8
+AWIN8 RUND8 SINV8 GBYT8 LEIT8 LFWI8 ALFW8 TEDH8 SINL8 GOFA8 ELYR8 AMEE8 FIGE8 IGEX8 HEAF8 OFVE8
+RSLI8 ORLI8 ARKS8 RSMI8 EDAC8 ACAN8 ENSF8 DAQU8 ORMT8 KNEW8 RBLA8 WNUP8 RCEB8 NESU8 AHAL8 REDR8
+CKPA8 CENO8 DOFR8 REBU8 RVET8 DWEA8 CEWO8 DBEG8 WINT8 NAVE8 SSPR8 LEWA8 DFIX8 SOAL8 OBEU8 LBUT8
+EDLY8 HEEI8 BTEN8 OUTH8 FADE8 HMAD8 NTRY8 MEEX8 DWHO8 IREP8 UROR8 RORF8 EETW8 TMAG8 HUTA8 ADEN8
+RDID8 EOFP8 FPOL8 FAPR8 DFIL8 BLYB8 DTOO8 ABCA8 GEIT8 HEHI8 HADB8 DBER8 BEWE8 GESU8 NMUS8 NDTU8
+ETAT8 DATO8 GONL8 LESH8 DSBE8 ONWE8 SISV8 RBYC8 AYIS8 ESPL8 WNOU8 TASM8 CTSO8 GSAS8 NFER8 RNOW8
+GLEP8 LEPO8 YTOA8 EKPT8 TERU8 TYIS8
+"""
@@ -0,0 +1,107 @@
+"""
+Quadgram fitness scoring for ciphertext-only cryptanalysis.
+
+Text is reduced to its A-Z letters (A=0 ... Z=25, case folded, everything
+else dropped), and each run of four letters is scored with its English
+log10 probability from a precomputed 26**4 table. Higher scores look more
+like English. A 26**2 bigram table derived from the same counts is used
+where a cheaper, coarser score is enough.
+"""
+
+import math
+from array import array
+from functools import lru_cache
+from typing import Union
+
+from english_quadgrams import QUADGRAM_COUNTS, TOTAL_QUADGRAMS
+
+QUADGRAM_SPACE = 26 ** 4
+BIGRAM_SPACE = 26 ** 2
+
+# Log probability for quadgrams missing from the table
+QUADGRAM_FLOOR = math.log10(0.01 / TOTAL_QUADGRAMS)
+
+# Relative frequency of each letter A-Z in English text
+ENGLISH_LETTER_FREQUENCIES = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+
+# Index of coincidence of English text and of uniformly random letters
+ENGLISH_IOC = 0.0667
+RANDOM_IOC = 1 / 26
+
+# ASCII byte -> letter index; non-letters are removed by letter_indices
+_LETTER_INDEX = bytes(
+    (code - ord('A')) % 32 if chr(code).isascii() and chr(code).isalpha() else 0
+    for code in range(256)
+)
+_NON_LETTERS = bytes(
+    code for code in range(256) if not (chr(code).isascii() and chr(code).isalpha())
+)
+
+
+def letter_indices(text: Union[str, bytes]) -> bytes:
+    """
+    Returns the A-Z letters of the text as indices 0-25, dropping all else.
+    Bytes are read as ASCII, so any non-ASCII byte is dropped too.
+    """
+    if isinstance(text, str):
+        text = text.encode('ascii', 'ignore')
+    return text.translate(_LETTER_INDEX, _NON_LETTERS)
+
+
+@lru_cache(maxsize=None)
+def quadgram_table() -> "array[float]":
+    """
+    Returns log10 probabilities indexed by a*26**3 + b*26**2 + c*26 + d.
+    """
+    table = array('d', [QUADGRAM_FLOOR]) * QUADGRAM_SPACE
+    for entry in QUADGRAM_COUNTS.split():
+        a, b, c, d = (ord(char) - ord('A') for char in entry[:4])
+        table[((a * 26 + b) * 26 + c) * 26 + d] = math.log10(int(entry[4:]) / TOTAL_QUADGRAMS)
+    return table
+
+
+@lru_cache(maxsize=None)
+def bigram_table() -> "array[float]":
+    """
+    Returns log10 probabilities indexed by a*26 + b, estimated from the
+    quadgram counts (each quadgram contributes its three bigrams).
+    """
+    counts = [0] * BIGRAM_SPACE
+    for entry in QUADGRAM_COUNTS.split():
+        a, b, c, d = (ord(char) - ord('A') for char in entry[:4])
+        count = int(entry[4:])
+        counts[a * 26 + b] += count
+        counts[b * 26 + c] += count
+        counts[c * 26 + d] += count
+    total = 3 * TOTAL_QUADGRAMS
+    return array('d', (math.log10((n or 0.01) / total) for n in counts))
+
+
+def score_indices(indices: bytes) -> float:
+    """
+    Sums the quadgram log probabilities over a sequence of letter indices.
+    """
+    if len(indices) < 4:
+        return 0.0
+    table = quadgram_table()
+    quad = (indices[0] * 26 + indices[1]) * 26 + indices[2]
+    total = 0.0
+    for index in indices[3:]:
+        quad = (quad % 17576) * 26 + index
+        total += table[quad]
+    return total
+
+
+def fitness(text: str) -> float:
+    """
+    Average quadgram log probability of the text's letters, comparable across
+    texts of different lengths. English scores far higher than random letters.
+    """
+    indices = letter_indices(text)
+    if len(indices) < 4:
+        return QUADGRAM_FLOOR
+    return score_indices(indices) / (len(indices) - 3)
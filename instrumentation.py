@@ -0,0 +1,223 @@
+"""
+Opt-in counters and phase timings for the cipher entry points.
+
+The public encrypt/decrypt functions are wrapped with ``instrumented`` and
+their key setup and text preparation helpers with ``timed``. While
+instrumentation is off (the default) each wrapper only tests one flag before
+calling through. Once enable() is called, or CLASSIC_CIPHERS_INSTRUMENT=1 is
+set, every outermost call records per cipher:
+
+- calls: encrypt/decrypt calls (a decrypt implemented through encrypt
+  counts once),
+- bytes: characters of text processed (bytes for the bytes API),
+- seconds per phase: key_setup (key squares, tables, shifts and
+  permutations, cache lookups included), prepare (text normalization such as
+  Playfair's prepare_plaintext) and transform (the rest of the call).
+
+A helper called on its own, outside any entry point, is charged to the
+cipher named in its decorator. Counters are per process, like the key cache;
+worker processes inherit the environment variable but report nothing back.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+
+INSTRUMENT_ENV = "CLASSIC_CIPHERS_INSTRUMENT"
+PHASES = ("key_setup", "prepare", "transform")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CipherMetrics:
+    """
+    Counters for one cipher.
+    """
+
+    __slots__ = ("calls", "bytes", "seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.bytes = 0
+        self.seconds: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "bytes": self.bytes, "seconds": dict(self.seconds)}
+
+
+class Recorder:
+    """
+    Thread-safe per-cipher metrics, updated only while enabled.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._metrics: Dict[str, CipherMetrics] = {}
+        self._lock = threading.Lock()
+        # The entry point (cipher, time spent in timed phases) running on
+        # each thread, so nested calls are charged to the outermost one
+        self._local = threading.local()
+
+    def _get(self, cipher: str) -> CipherMetrics:
+        metrics = self._metrics.get(cipher)
+        if metrics is None:
+            metrics = self._metrics[cipher] = CipherMetrics()
+        return metrics
+
+    def add_call(self, cipher: str, size: int, total: float, phases: float) -> None:
+        with self._lock:
+            metrics = self._get(cipher)
+            metrics.calls += 1
+            metrics.bytes += size
+            metrics.seconds["transform"] += max(total - phases, 0.0)
+
+    def add_phase(self, cipher: str, phase: str, seconds: float) -> None:
+        with self._lock:
+            self._get(cipher).seconds[phase] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns {cipher: {"calls", "bytes", "seconds": {phase: seconds}}}.
+        """
+        with self._lock:
+            return {cipher: self._metrics[cipher].as_dict() for cipher in sorted(self._metrics)}
+
+
+RECORDER = Recorder(os.environ.get(INSTRUMENT_ENV, "") not in ("", "0"))
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, list):  # Playfair digraphs
+        return sum(len(item) for item in value)
+    try:
+        return memoryview(value).nbytes
+    except TypeError:
+        return 0
+
+
+def instrumented(cipher: str, text_arg: int = 0) -> Callable[[F], F]:
+    """
+    Decorates an encrypt/decrypt entry point, recording its calls, size and
+    timings under this cipher. text_arg is the position of the text (1 for
+    methods).
+    """
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = RECORDER
+            if not recorder.enabled or getattr(recorder._local, "active", None) is not None:
+                return func(*args, **kwargs)
+            local = recorder._local
+            local.active = cipher
+            local.phases = 0.0
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - start
+                local.active = None
+                size = _size(args[text_arg]) if len(args) > text_arg else 0
+                recorder.add_call(cipher, size, total, local.phases)
+        return cast(F, wrapper)
+    return decorate
+
+
+def timed(phase: str, cipher: str) -> Callable[[F], F]:
+    """
+    Decorates a key setup or text preparation helper, charging its time to
+    this phase of the running entry point's cipher (or of this cipher when
+    called directly). Phases nested in another timed call are not counted
+    twice.
+    """
+    if phase not in PHASES:
+        raise ValueError(f"Unknown phase '{phase}'. Choose from: {', '.join(PHASES)}")
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = RECORDER
+            local = recorder._local
+            if not recorder.enabled or getattr(local, "in_phase", False):
+                return func(*args, **kwargs)
+            local.in_phase = True
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                local.in_phase = False
+                active: Optional[str] = getattr(local, "active", None)
+                if active is not None:
+                    local.phases += seconds
+                recorder.add_phase(active or cipher, phase, seconds)
+        return cast(F, wrapper)
+    return decorate
+
+
+def enable() -> None:
+    """
+    Starts recording in this process.
+    """
+    RECORDER.enabled = True
+
+
+def disable() -> None:
+    """
+    Stops recording; the counters are kept until reset().
+    """
+    RECORDER.enabled = False
+
+
+def reset() -> None:
+    """
+    Clears every counter.
+    """
+    RECORDER.reset()
+
+
+def metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the counters as a dict keyed by cipher name.
+    """
+    return RECORDER.snapshot()
+
+
+def metrics_json() -> str:
+    """
+    Returns the counters as a JSON object.
+    """
+    return json.dumps(metrics(), indent=2, sort_keys=True)
+
+
+def metrics_prometheus(prefix: str = "classic_ciphers") -> str:
+    """
+    Returns the counters in the Prometheus text exposition format.
+    """
+    snapshot = metrics()
+    lines: List[str] = []
+
+    def family(name: str, help_text: str) -> None:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} counter")
+
+    family("calls_total", "Encrypt and decrypt calls.")
+    for cipher, values in snapshot.items():
+        lines.append(f'{prefix}_calls_total{{cipher="{cipher}"}} {values["calls"]}')
+    family("bytes_total", "Characters (or bytes) of text processed.")
+    for cipher, values in snapshot.items():
+        lines.append(f'{prefix}_bytes_total{{cipher="{cipher}"}} {values["bytes"]}')
+    family("phase_seconds_total", "Time spent in each phase of the calls.")
+    for cipher, values in snapshot.items():
+        for phase in PHASES:
+            lines.append(f'{prefix}_phase_seconds_total{{cipher="{cipher}",phase="{phase}"}} '
+                         f'{values["seconds"][phase]:.9f}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,140 @@
+"""
+One bounded LRU cache of prepared key material, shared by every cipher.
+
+Entries are keyed by (cipher, normalized key) and hold whatever the cipher
+derives from its key before touching any text: translation tables for Caesar
+and Affine (with the modular inverse already applied for decryption), the
+per-letter shifts for Vigenère, the indexed square for Playfair and the
+column order for Row Transposition. Hit, miss and eviction counters are kept
+so the size can be tuned; each process (batch and service workers included)
+has its own cache.
+
+The size defaults to DEFAULT_KEY_CACHE_SIZE and can be set with
+resize_key_cache() or the CLASSIC_CIPHERS_KEY_CACHE_SIZE environment
+variable, which worker processes inherit.
+
+Permutations that depend on the message length (Rail Fence, the Row
+Transposition bytes API) are much larger per entry and stay in their own
+small caches.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, Tuple, TypeVar
+
+KEY_CACHE_ENV = "CLASSIC_CIPHERS_KEY_CACHE_SIZE"
+DEFAULT_KEY_CACHE_SIZE = 512
+
+T = TypeVar("T")
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def combine_stats(stats: Iterable[CacheStats]) -> CacheStats:
+    """
+    Sums the counters of several caches, e.g. one per worker process.
+    """
+    return CacheStats(*(sum(column) for column in zip(CacheStats(0, 0, 0, 0, 0), *stats)))
+
+
+class KeyCache:
+    """
+    Thread-safe LRU mapping of (cipher, key) to prepared key objects.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_KEY_CACHE_SIZE) -> None:
+        self._entries: OrderedDict[Tuple[str, Hashable], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, cipher: str, key: Hashable, build: Callable[[], T]) -> T:
+        """
+        Returns the prepared object for (cipher, key), calling build() to
+        create it on a miss. Errors raised by build() are not cached.
+
+        build() runs without the lock held, so it may itself use the cache
+        (Affine decryption tables are built from encryption tables). Two
+        threads missing on the same key may both build it; the first stored
+        entry wins.
+        """
+        entry = (cipher, key)
+        with self._lock:
+            try:
+                value: T = self._entries[entry]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(entry)
+                self.hits += 1
+                return value
+        value = build()
+        with self._lock:
+            value = self._entries.setdefault(entry, value)
+            self._entries.move_to_end(entry)
+            self._evict()
+        return value
+
+    def _evict(self) -> None:
+        while len(self._entries) > max(self.maxsize, 0):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Changes the capacity, evicting the least recently used entries.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions,
+                              len(self._entries), self.maxsize)
+
+
+KEY_CACHE = KeyCache(int(os.environ.get(KEY_CACHE_ENV, DEFAULT_KEY_CACHE_SIZE)))
+
+
+def prepared_key(cipher: str, key: Hashable, build: Callable[[], T]) -> T:
+    """
+    Looks (cipher, key) up in the shared cache, building it on a miss.
+    """
+    return KEY_CACHE.get(cipher, key, build)
+
+
+def key_cache_stats() -> CacheStats:
+    """
+    Returns the shared cache's counters for this process.
+    """
+    return KEY_CACHE.stats()
+
+
+def resize_key_cache(maxsize: int) -> None:
+    """
+    Sets the shared cache's capacity; 0 disables caching.
+    """
+    if maxsize < 0:
+        raise ValueError("Key cache size must be >= 0")
+    KEY_CACHE.resize(maxsize)
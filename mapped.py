@@ -0,0 +1,117 @@
+"""
+Memory-mapped encryption of large files.
+
+The input and output files are mapped with ``mmap`` and the cipher runs over
+fixed-size windows through the bytes API (``*_into`` functions), so no part
+of the file is ever decoded into a Python string. Each window is independent
+for the position-independent ciphers (Caesar, Affine, and Vigenère with the
+key offset set to the window's file offset), so windows are spread across
+worker processes, each mapping the files itself.
+
+Bytes are treated as ASCII: letters A-Z/a-z are transformed and every other
+byte, including multi-byte UTF-8 sequences, is copied unchanged. Vigenère
+advances the key on every byte, so files with non-ASCII characters encrypt
+differently than in text mode and must be decrypted in mapped mode too.
+
+The transposition ciphers and Playfair are refused: Rail Fence and Row
+Transposition permute the whole message by its total length, so no window
+can be written without reading the entire file, and Playfair output is not
+the same length as its input. Use the streaming mode for them.
+"""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from AffineCipher import affine_decrypt_into, affine_encrypt_into, affine_key
+from CeaserCipher import caesar_decrypt_into, caesar_encrypt_into
+from registry import ACTIONS, CIPHERS
+from VigenereCipher import vigenere_decrypt_into, vigenere_encrypt_into
+
+DEFAULT_WINDOW_SIZE = 64 * 1024 * 1024
+
+IntoFunction = Callable[..., int]
+
+# cipher -> (encrypt_into, decrypt_into); Vigenère also takes offset=
+MAPPED_CIPHERS: Dict[str, Tuple[IntoFunction, IntoFunction]] = {
+    "caesar": (caesar_encrypt_into, caesar_decrypt_into),
+    "affine": (affine_encrypt_into, affine_decrypt_into),
+    "vigenere": (vigenere_encrypt_into, vigenere_decrypt_into),
+}
+
+
+def _process_window(
+    input_path: str,
+    output_path: str,
+    cipher: str,
+    action: str,
+    args: Tuple[Any, ...],
+    start: int,
+    end: int,
+) -> int:
+    func = MAPPED_CIPHERS[cipher][ACTIONS.index(action)]
+    kwargs = {"offset": start} if cipher == "vigenere" else {}
+    if input_path == output_path:
+        with open(output_path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mapped:
+            with memoryview(mapped) as view, view[start:end] as window:
+                return func(window, window, *args, **kwargs)
+    with open(input_path, "rb") as fin, open(output_path, "r+b") as fout:
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as src, \
+                mmap.mmap(fout.fileno(), 0) as dst:
+            with memoryview(src) as src_view, memoryview(dst) as dst_view:
+                with src_view[start:end] as source, dst_view[start:end] as target:
+                    return func(source, target, *args, **kwargs)
+
+
+def mmap_transform(
+    input_path: str,
+    output_path: str,
+    cipher: str,
+    action: str,
+    params: Mapping[str, Any],
+    workers: Optional[int] = None,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+) -> int:
+    """
+    Encrypts or decrypts input_path into output_path through memory maps and
+    returns the number of bytes processed. output_path may be input_path to
+    transform the file in place.
+
+    params holds the key by the registry's parameter names (shift, a, b,
+    key). Windows of window_size bytes run in worker processes; workers=None
+    uses one per CPU and workers=1 runs inline.
+    """
+    if cipher not in MAPPED_CIPHERS:
+        raise ValueError(
+            f"{cipher} cannot run memory-mapped; it needs the whole message at once. "
+            f"Supported: {', '.join(MAPPED_CIPHERS)}"
+        )
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action '{action}'. Choose 'encrypt' or 'decrypt'.")
+    if window_size < 1:
+        raise ValueError("window_size must be >= 1")
+    args = tuple(params[name] for name in CIPHERS[cipher].params)
+    if cipher == "affine" and action == "decrypt":
+        affine_key(*args)
+    if cipher == "vigenere" and not args[0]:
+        raise ValueError("Keyword must not be empty.")
+
+    size = os.path.getsize(input_path)
+    in_place = os.path.exists(output_path) and os.path.samefile(input_path, output_path)
+    if in_place:
+        output_path = input_path
+    else:
+        with open(output_path, "wb") as f:
+            f.truncate(size)
+    if size == 0:
+        return 0
+
+    jobs: List[Tuple[Any, ...]] = [
+        (input_path, output_path, cipher, action, args, start, min(start + window_size, size))
+        for start in range(0, size, window_size)
+    ]
+    if workers == 1 or len(jobs) == 1:
+        return sum(_process_window(*job) for job in jobs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(_process_window, *zip(*jobs)))
@@ -0,0 +1,317 @@
+"""
+Letter, bigram and quadgram counts over text of any size.
+
+NgramCounts keeps fixed-size arrays of 26, 26**2 and 26**4 64-bit counters,
+indexed like the rest of the project (A=0 ... Z=25, a bigram ab at a*26 + b,
+a quadgram abcd at ((a*26 + b)*26 + c)*26 + d). Only A-Z letters count,
+case folded; everything else is skipped, so "th e" holds the bigram HE.
+Memory stays at about 3.6 MB whatever the amount of text.
+
+Counts update from streamed chunks, keeping the last three letters so
+n-grams spanning chunk boundaries are counted. Counts of consecutive parts
+of a text merge into exactly the counts of the whole, so count_file splits a
+file into windows, counts them in worker processes and merges the results in
+order. Counts save to and load from a compact binary file, e.g. to combine
+runs over several archives.
+"""
+
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterable, List, Optional, Sequence, Tuple, Union
+
+from fitness import (
+    BIGRAM_SPACE,
+    ENGLISH_LETTER_FREQUENCIES,
+    QUADGRAM_FLOOR,
+    QUADGRAM_SPACE,
+    letter_indices,
+    quadgram_table,
+)
+from optional_deps import HAVE_NUMPY
+from optional_deps import numpy as np
+from streaming import DEFAULT_CHUNK_SIZE
+from vigenere_analysis import index_of_coincidence
+
+# Bytes of a file counted by one worker job
+DEFAULT_WINDOW_SIZE = 64 * 1024 * 1024
+
+# Saved files: magic, then head and tail (a length byte and three letter
+# bytes each), then the letter, bigram and quadgram counts as little-endian
+# 64-bit integers
+MAGIC = b"NGRAMS1\n"
+
+# Letters kept from each end of the text to join n-grams across boundaries
+EDGE = 3
+
+
+def _zeros(length: int) -> "array[int]":
+    return array('q', bytes(8 * length))
+
+
+class NgramCounts:
+    """
+    Letter, bigram and quadgram counts of a text, updated chunk by chunk.
+
+    head and tail hold the first and last (up to) three letters seen, as
+    indices 0-25, so counts of consecutive texts can be merged exactly.
+    """
+
+    __slots__ = ("letters", "bigrams", "quadgrams", "head", "tail")
+
+    def __init__(self) -> None:
+        self.letters = _zeros(26)
+        self.bigrams = _zeros(BIGRAM_SPACE)
+        self.quadgrams = _zeros(QUADGRAM_SPACE)
+        self.head = b""
+        self.tail = b""
+
+    @classmethod
+    def from_text(cls, text: Union[str, bytes]) -> "NgramCounts":
+        """
+        Counts a whole text at once.
+        """
+        counts = cls()
+        counts.update(text)
+        return counts
+
+    def update(self, chunk: Union[str, bytes]) -> None:
+        """
+        Counts the next chunk of the text. Bytes are read as ASCII.
+        """
+        indices = letter_indices(chunk)
+        if not indices:
+            return
+        # Every quadgram of window ends in the new letters, since the tail
+        # holds at most three
+        window = self.tail + indices
+        joined = len(self.tail)
+        self._add(self.letters, indices, 1)
+        self._add(self.bigrams, window[max(joined - 1, 0):], 2)
+        self._add(self.quadgrams, window, 4)
+        self.head = (self.head + indices)[:EDGE]
+        self.tail = window[-EDGE:]
+
+    def merge(self, other: "NgramCounts", contiguous: bool = True) -> None:
+        """
+        Adds other's counts to these. With contiguous=True other's text is
+        taken to follow this one directly, and the n-grams across the join
+        are counted too, so merging the counts of consecutive chunks in
+        order gives the counts of the whole text.
+        """
+        for mine, theirs in ((self.letters, other.letters), (self.bigrams, other.bigrams),
+                             (self.quadgrams, other.quadgrams)):
+            self._add_array(mine, theirs)
+        if contiguous and self.tail and other.head:
+            window = self.tail + other.head
+            joined = len(self.tail)
+            self._add(self.bigrams, window[joined - 1:joined + 1], 2)
+            self._add(self.quadgrams, window, 4)
+        self.head = (self.head + other.head)[:EDGE]
+        self.tail = (self.tail + other.tail)[-EDGE:]
+
+    @staticmethod
+    def _add_array(target: "array[int]", source: "array[int]") -> None:
+        if HAVE_NUMPY:
+            view = np.frombuffer(target, dtype=np.int64)
+            view += np.frombuffer(source, dtype=np.int64)
+        else:
+            for i, n in enumerate(source):
+                if n:
+                    target[i] += n
+
+    @staticmethod
+    def _add(target: "array[int]", indices: bytes, n: int) -> None:
+        """
+        Counts every run of n letters in indices into target.
+        """
+        if len(indices) < n:
+            return
+        if HAVE_NUMPY:
+            letters = np.frombuffer(indices, dtype=np.uint8).astype(np.int32)
+            codes = letters[:len(letters) - n + 1].copy()
+            for k in range(1, n):
+                codes *= 26
+                codes += letters[k:len(letters) - n + 1 + k]
+            view = np.frombuffer(target, dtype=np.int64)
+            view += np.bincount(codes, minlength=len(target))
+        elif n == 1:
+            for letter in range(26):
+                target[letter] += indices.count(letter)
+        else:
+            size = 26 ** (n - 1)
+            code = 0
+            for index in indices[:n - 1]:
+                code = code * 26 + index
+            for index in indices[n - 1:]:
+                code = (code % size) * 26 + index
+                target[code] += 1
+
+    @property
+    def total(self) -> int:
+        """
+        Number of letters counted.
+        """
+        return sum(self.letters)
+
+    def frequencies(self) -> List[float]:
+        """
+        Relative frequency of each letter A-Z.
+        """
+        total = self.total
+        return [n / total if total else 0.0 for n in self.letters]
+
+    def index_of_coincidence(self) -> float:
+        """
+        Probability that two letters drawn from the text are the same
+        (about 0.0667 for English, 0.0385 for random letters).
+        """
+        return index_of_coincidence(list(self.letters))
+
+    def chi_squared(self, expected: Sequence[float] = ENGLISH_LETTER_FREQUENCIES) -> float:
+        """
+        Chi-squared distance of the letter counts from the expected
+        frequencies; lower is closer.
+        """
+        total = self.total
+        return sum((observed - total * p) ** 2 / (total * p)
+                   for observed, p in zip(self.letters, expected)) if total else 0.0
+
+    def fitness(self) -> float:
+        """
+        Average quadgram log probability, as fitness.fitness() would give
+        for the whole text.
+        """
+        table = quadgram_table()
+        if HAVE_NUMPY:
+            counts = np.frombuffer(self.quadgrams, dtype=np.int64)
+            quads = int(counts.sum())
+            total = float(counts @ np.frombuffer(table, dtype=np.float64))
+        else:
+            quads = sum(self.quadgrams)
+            total = sum(n * table[code] for code, n in enumerate(self.quadgrams) if n)
+        return total / quads if quads else QUADGRAM_FLOOR
+
+    def most_common(self, size: int, count: int = 10) -> List[Tuple[str, int]]:
+        """
+        Returns the count most frequent n-grams of the given size (1, 2 or
+        4) with their counts, most frequent first.
+        """
+        table = {1: self.letters, 2: self.bigrams, 4: self.quadgrams}[size]
+        if HAVE_NUMPY:
+            values = np.frombuffer(table, dtype=np.int64)
+            order = [int(code) for code in np.argsort(-values, kind="stable")[:count]]
+        else:
+            order = sorted(range(len(table)), key=lambda code: -table[code])[:count]
+        return [(_ngram(code, size), table[code]) for code in order if table[code]]
+
+    def save(self, path: str) -> None:
+        """
+        Writes the counts to a file, see load().
+        """
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            for edge in (self.head, self.tail):
+                f.write(bytes([len(edge)]) + edge.ljust(EDGE, b"\0"))
+            for table in (self.letters, self.bigrams, self.quadgrams):
+                if sys.byteorder == "big":
+                    table = array('q', table)
+                    table.byteswap()
+                table.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> "NgramCounts":
+        """
+        Reads counts written by save(); raises ValueError for any other file.
+        """
+        counts = cls()
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a saved n-gram count file")
+            edges = []
+            for _ in range(2):
+                edge = f.read(EDGE + 1)
+                if len(edge) != EDGE + 1 or edge[0] > EDGE:
+                    raise ValueError(f"{path} is truncated")
+                edges.append(edge[1:1 + edge[0]])
+            counts.head, counts.tail = edges
+            for table in (counts.letters, counts.bigrams, counts.quadgrams):
+                length = len(table)
+                del table[:]
+                try:
+                    table.fromfile(f, length)
+                except EOFError:
+                    raise ValueError(f"{path} is truncated") from None
+                if sys.byteorder == "big":
+                    table.byteswap()
+        return counts
+
+
+def _ngram(code: int, size: int) -> str:
+    letters = []
+    for _ in range(size):
+        code, index = divmod(code, 26)
+        letters.append(chr(ord('A') + index))
+    return "".join(reversed(letters))
+
+
+def count_chunks(chunks: Iterable[Union[str, bytes]]) -> NgramCounts:
+    """
+    Counts a text arriving as a stream of chunks.
+    """
+    counts = NgramCounts()
+    for chunk in chunks:
+        counts.update(chunk)
+    return counts
+
+
+def _count_window(path: str, start: int, end: int, chunk_size: int) -> NgramCounts:
+    counts = NgramCounts()
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            counts.update(chunk)
+            remaining -= len(chunk)
+    return counts
+
+
+def count_file(
+    path: str,
+    workers: Optional[int] = None,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> NgramCounts:
+    """
+    Counts a file's letters, bigrams and quadgrams. The file is read as
+    bytes in windows of window_size, counted in worker processes (one per
+    CPU for workers=None, inline for workers=1) and merged in file order,
+    giving the same counts as reading it in one go.
+    """
+    if window_size < 1 or chunk_size < 1:
+        raise ValueError("window_size and chunk_size must be >= 1")
+    size = os.path.getsize(path)
+    jobs = [(path, start, min(start + window_size, size), chunk_size)
+            for start in range(0, size, window_size)]
+    counts = NgramCounts()
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            counts.merge(_count_window(*job))
+        return counts
+    workers = workers or os.cpu_count() or 1
+    # Each result holds a full quadgram table, so only a few are in flight
+    max_in_flight = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future[NgramCounts]] = deque()
+        for job in jobs:
+            pending.append(executor.submit(_count_window, *job))
+            if len(pending) >= max_in_flight:
+                counts.merge(pending.popleft().result())
+        while pending:
+            counts.merge(pending.popleft().result())
+    return counts
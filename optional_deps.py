@@ -0,0 +1,40 @@
+"""
+Optional dependencies, imported on first use.
+
+NumPy takes longer to import than the rest of the package put together, and
+most one-shot commands never reach a NumPy code path (short texts always take
+the Python kernels). Modules therefore take ``numpy`` from here instead of
+importing it themselves: it is found at import time, so HAVE_NUMPY is known
+up front, but only executed when one of its attributes is first used.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    Returns the module, loaded on first attribute access, or None if it is
+    not installed. A module that is already imported is returned as is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+if TYPE_CHECKING:
+    import numpy
+else:
+    numpy = lazy_import("numpy")
+
+HAVE_NUMPY = numpy is not None
@@ -0,0 +1,144 @@
+"""
+Index-permutation helpers shared by the transposition ciphers.
+
+A transposition is described by an index array ``perm`` where output
+character ``k`` is ``text[perm[k]]``. Index arrays are stored as compact
+``array('q')`` buffers; when NumPy is installed, large permutations are
+applied as a single vectorized gather over the encoded text. ``gather_into``
+applies a permutation to bytes, writing into a caller-supplied buffer.
+"""
+
+from array import array
+from typing import Any, Iterable, Sequence, Tuple
+
+from optional_deps import HAVE_NUMPY
+from optional_deps import numpy as np
+from translation import Buffer, output_length
+
+# Below this many characters the NumPy round trip costs more than it saves
+NUMPY_THRESHOLD = 4096
+
+
+def index_array(values: Iterable[int] = ()) -> "array[int]":
+    """
+    Builds a compact signed 64-bit index array.
+    """
+    return array('q', values)
+
+
+def zeros(length: int) -> "array[int]":
+    """
+    Builds an index array of the given length filled with zeros.
+    """
+    return array('q', bytes(8 * length))
+
+
+def invert(perm: Sequence[int]) -> "array[int]":
+    """
+    Returns the inverse permutation, so gather(gather(t, p), invert(p)) == t.
+    """
+    if HAVE_NUMPY and len(perm) >= NUMPY_THRESHOLD:
+        inverse = np.empty(len(perm), dtype=np.int64)
+        inverse[_as_numpy(perm)] = np.arange(len(perm), dtype=np.int64)
+        return array('q', inverse.tobytes())
+    result = zeros(len(perm))
+    for k, i in enumerate(perm):
+        result[i] = k
+    return result
+
+
+def compose(first: Sequence[int], second: Sequence[int]) -> "array[int]":
+    """
+    Returns the single permutation that applies first and then second, so
+    gather(t, compose(first, second)) == gather(gather(t, first), second).
+    """
+    if HAVE_NUMPY and len(second) >= NUMPY_THRESHOLD:
+        return array('q', _as_numpy(first)[_as_numpy(second)].tobytes())
+    return array('q', map(first.__getitem__, second))
+
+
+def gather(text: str, perm: Sequence[int]) -> str:
+    """
+    Returns the string whose k-th character is text[perm[k]].
+    """
+    if HAVE_NUMPY and len(perm) >= NUMPY_THRESHOLD:
+        return _numpy_gather(text, perm)
+    return "".join(map(text.__getitem__, perm))
+
+
+def gather_into(src: Buffer, perm: Sequence[int], dst: Buffer) -> int:
+    """
+    Writes src[perm[k]] to dst[k] for every k and returns len(perm). dst may
+    be src itself.
+    """
+    length = output_length(src, dst, len(perm))
+    if HAVE_NUMPY:
+        source = np.frombuffer(src, dtype=np.uint8)
+        target = np.frombuffer(dst, dtype=np.uint8)[:length]
+        # 'clip' skips numpy's output buffering, which is only needed when
+        # the gather overwrites its own input
+        if np.shares_memory(source, target):
+            np.take(source, _as_numpy(perm), out=target, mode='raise')
+        else:
+            np.take(source, _as_numpy(perm), out=target, mode='clip')
+    else:
+        source_view = memoryview(src).cast('B')
+        memoryview(dst).cast('B')[:length] = bytes(map(source_view.__getitem__, perm))
+    return length
+
+
+def read_columns(text: str, num_cols: int, order: Sequence[int]) -> str:
+    """
+    Lays text out row-major in num_cols columns and reads the columns in the
+    given order. len(text) must be a multiple of num_cols.
+    """
+    if HAVE_NUMPY and len(text) >= NUMPY_THRESHOLD:
+        codes, is_ascii = _encode(text)
+        grid = codes.reshape(-1, num_cols)
+        return _decode(np.ascontiguousarray(grid[:, list(order)].T), is_ascii)
+    return "".join([text[col::num_cols] for col in order])
+
+
+def write_columns(text: str, num_cols: int, order: Sequence[int]) -> str:
+    """
+    Inverse of read_columns for a possibly ragged grid: consecutive runs of
+    text fill the columns in the given order, and the grid is read row-major.
+    Only the first len(text) % num_cols columns reach the last row.
+    """
+    full_cols = len(text) % num_cols
+    num_rows = -(-len(text) // num_cols)
+    if HAVE_NUMPY and full_cols == 0 and len(text) >= NUMPY_THRESHOLD:
+        codes, is_ascii = _encode(text)
+        grid = np.empty((num_rows, num_cols), dtype=codes.dtype)
+        grid[:, list(order)] = codes.reshape(num_cols, num_rows).T
+        return _decode(grid, is_ascii)
+    result = [""] * len(text)
+    pos = 0
+    for col in order:
+        col_len = num_rows if col < full_cols or full_cols == 0 else num_rows - 1
+        result[col::num_cols] = text[pos:pos + col_len]
+        pos += col_len
+    return "".join(result)
+
+
+def _encode(text: str) -> "Tuple[np.ndarray[Any, Any], bool]":
+    if text.isascii():
+        return np.frombuffer(text.encode('ascii'), dtype=np.uint8), True
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32), False
+
+
+def _decode(codes: "np.ndarray[Any, Any]", is_ascii: bool) -> str:
+    if is_ascii:
+        return codes.tobytes().decode('ascii')
+    return codes.tobytes().decode('utf-32-le', 'surrogatepass')
+
+
+def _as_numpy(perm: Sequence[int]) -> "np.ndarray[Any, Any]":
+    if isinstance(perm, array):
+        return np.frombuffer(perm, dtype=np.int64)
+    return np.asarray(perm, dtype=np.int64)
+
+
+def _numpy_gather(text: str, perm: Sequence[int]) -> str:
+    codes, is_ascii = _encode(text)
+    return _decode(codes[_as_numpy(perm)], is_ascii)
@@ -0,0 +1,245 @@
+"""
+Chains of cipher stages, fused where the math allows.
+
+A Pipeline runs registry Transforms one after another, e.g. Vigenère, then
+Row Transposition, then Rail Fence. Instead of calling each stage with a
+full intermediate copy of the text, consecutive stages are grouped into
+steps that each make one pass:
+
+- Caesar and Affine (either direction) are all x -> (m * x + c) mod 26 on
+  letters, so a run of them composes into one affine map and one cached
+  translation table. The result is upper-cased if any Affine stage is in
+  the run, as Affine does. Non-ASCII text falls back to the stages one by
+  one, since upper-casing can change its length.
+- Rail Fence (either direction) and Row Transposition decryption are index
+  permutations of the whole text, so a run of them composes into one
+  permutation and one gather. Row Transposition encryption also drops
+  spaces, upper-cases and pads with 'X', so it can only start such a run:
+  the text is normalized once and the rest of the run is a permutation of
+  the padded length. Composite permutations are cached per text length, up
+  to CACHE_MAX_LENGTH characters like the single-cipher ones.
+- Vigenère and Playfair stages run as they are.
+
+Stages are written ``cipher:action:name=value,...``, with the same parameter
+names as the CLI options, e.g. ``affine:encrypt:a=5,b=8``.
+"""
+
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from AffineCipher import modinv
+from backends import get_backend
+from permutation import compose, gather
+from RailFenceCipher import zigzag_permutation
+from registry import CIPHERS, Transform
+from RowTranspositionCipher import read_permutation, write_permutation
+from translation import affine_table, caesar_table
+
+# Parameters that are integers; the others (keys) are strings
+INT_PARAMS = ("shift", "a", "b", "rails")
+
+# Number of (length, stages) composite permutations kept
+PERMUTATION_CACHE_SIZE = 16
+CACHE_MAX_LENGTH = 1 << 20
+
+SUBSTITUTIONS = ("caesar", "affine")
+PERMUTATIONS = ("railfence", "rowtrans")
+
+StageKey = Tuple[str, str, Tuple[Any, ...]]
+
+
+def parse_stage(spec: str) -> Transform:
+    """
+    Parses ``cipher:action:name=value,...`` into a Transform; raises
+    ValueError for unknown ciphers, actions or parameters.
+    """
+    parts = spec.split(":", 2)
+    if len(parts) < 2:
+        raise ValueError(f"Stage '{spec}' must look like cipher:action:name=value,...")
+    cipher, action = parts[0].strip().lower(), parts[1].strip().lower()
+    params: Dict[str, Any] = {}
+    if len(parts) == 3 and parts[2]:
+        for item in parts[2].split(","):
+            name, sep, value = item.partition("=")
+            name = name.strip()
+            if not sep or cipher in CIPHERS and name not in CIPHERS[cipher].params:
+                raise ValueError(f"Stage '{spec}': bad parameter '{item}'")
+            try:
+                params[name] = int(value) if name in INT_PARAMS else value.strip()
+            except ValueError:
+                raise ValueError(f"Stage '{spec}': {name} must be an integer") from None
+    return Transform(cipher, action, params)
+
+
+def affine_map(stage: Transform) -> Tuple[int, int]:
+    """
+    Returns (m, c) such that a Caesar or Affine stage maps letter index x to
+    (m * x + c) mod 26. Raises AffineKeyError for an Affine decryption key
+    without an inverse.
+    """
+    if stage.cipher == "caesar":
+        shift = stage.args[0]
+        return 1, (shift if stage.action == "encrypt" else -shift) % 26
+    a, b = stage.args
+    if stage.action == "encrypt":
+        return a % 26, b % 26
+    inverse = modinv(a)
+    return inverse, -inverse * b % 26
+
+
+class SubstitutionStep:
+    """
+    A run of Caesar/Affine stages applied as one translation table.
+    """
+
+    def __init__(self, stages: Sequence[Transform]) -> None:
+        self.stages = list(stages)
+        multiplier, offset = 1, 0
+        for stage in self.stages:
+            m, c = affine_map(stage)
+            multiplier, offset = m * multiplier % 26, (m * offset + c) % 26
+        self.fold_case = any(stage.cipher == "affine" for stage in self.stages)
+        if self.fold_case:
+            self.table = affine_table(multiplier, offset)
+        else:
+            self.table = caesar_table(offset)
+
+    def __call__(self, text: str) -> str:
+        if not text.isascii():
+            for stage in self.stages:
+                text = stage(text)
+            return text
+        return get_backend().translate(self.table, text.upper() if self.fold_case else text)
+
+
+def _stage_key(stage: Transform) -> StageKey:
+    return stage.cipher, stage.action, stage.args
+
+
+def _stage_permutation(key: StageKey, length: int) -> "array[int]":
+    cipher, action, args = key
+    if cipher == "railfence":
+        perm, inverse = zigzag_permutation(length, args[0])
+        return perm if action == "encrypt" else inverse
+    if action == "encrypt":
+        return read_permutation(length, args[0])
+    return write_permutation(length, args[0])
+
+
+def _composite_permutation(length: int, keys: Tuple[StageKey, ...]) -> "array[int]":
+    perm = _stage_permutation(keys[0], length)
+    for key in keys[1:]:
+        perm = compose(perm, _stage_permutation(key, length))
+    return perm
+
+_cached_composite_permutation = lru_cache(maxsize=PERMUTATION_CACHE_SIZE)(_composite_permutation)
+
+
+class PermutationStep:
+    """
+    A run of transposition stages applied as one composite gather. Only the
+    first stage may be a Row Transposition encryption.
+    """
+
+    def __init__(self, stages: Sequence[Transform]) -> None:
+        self.stages = list(stages)
+        self.keys = tuple(_stage_key(stage) for stage in self.stages)
+        first = self.stages[0]
+        self.normalize_width = (
+            len(first.args[0]) if first.cipher == "rowtrans" and first.action == "encrypt" else 0
+        )
+
+    def __call__(self, text: str) -> str:
+        if self.normalize_width:
+            # As in row_transposition_encrypt
+            text = text.replace(" ", "").upper()
+            text = text.ljust(-(-len(text) // self.normalize_width) * self.normalize_width, 'X')
+        if len(text) <= 1:
+            # Every transposition leaves these unchanged
+            return text
+        length = len(text)
+        if length <= CACHE_MAX_LENGTH:
+            perm = _cached_composite_permutation(length, self.keys)
+        else:
+            perm = _composite_permutation(length, self.keys)
+        return gather(text, perm)
+
+
+Step = Union[SubstitutionStep, PermutationStep, Transform]
+
+
+class Pipeline:
+    """
+    A chain of cipher stages, callable as pipeline(text).
+
+    steps holds the fused steps actually run: a SubstitutionStep or
+    PermutationStep for each run of two or more fusable stages, and the
+    Transform itself for any other stage.
+    """
+
+    def __init__(self, stages: Iterable[Transform]) -> None:
+        self.stages = list(stages)
+        if not self.stages:
+            raise ValueError("A pipeline needs at least one stage.")
+        self.steps: List[Step] = []
+        run: List[Transform] = []
+        for stage in self.stages:
+            if run and not self._extends(run, stage):
+                self.steps.append(self._fuse(run))
+                run = []
+            if stage.cipher in SUBSTITUTIONS or stage.cipher in PERMUTATIONS:
+                run.append(stage)
+            else:
+                self.steps.append(stage)
+        if run:
+            self.steps.append(self._fuse(run))
+
+    @staticmethod
+    def _extends(run: List[Transform], stage: Transform) -> bool:
+        if run[0].cipher in SUBSTITUTIONS:
+            return stage.cipher in SUBSTITUTIONS
+        return stage.cipher in PERMUTATIONS and not (
+            stage.cipher == "rowtrans" and stage.action == "encrypt"
+        )
+
+    @staticmethod
+    def _fuse(run: List[Transform]) -> Step:
+        if len(run) == 1:
+            return run[0]
+        if run[0].cipher in SUBSTITUTIONS:
+            return SubstitutionStep(run)
+        return PermutationStep(run)
+
+    @classmethod
+    def parse(cls, specs: Iterable[str]) -> "Pipeline":
+        """
+        Builds a pipeline from stage strings, see parse_stage().
+        """
+        return cls(parse_stage(spec) for spec in specs)
+
+    @property
+    def streamable(self) -> bool:
+        """
+        True when every step maps characters independently of their
+        position, so the pipeline can run chunk by chunk.
+        """
+        return all(isinstance(step, SubstitutionStep) or
+                   isinstance(step, Transform) and step.cipher in SUBSTITUTIONS
+                   for step in self.steps)
+
+    def __call__(self, text: str) -> str:
+        for step in self.steps:
+            text = step(text)
+        return text
+
+    def stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Runs a streamable pipeline over chunks; any other pipeline collects
+        the whole input first.
+        """
+        if self.streamable:
+            for chunk in chunks:
+                yield self(chunk)
+        else:
+            yield self("".join(chunks))
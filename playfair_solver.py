@@ -0,0 +1,238 @@
+"""
+Ciphertext-only Playfair key search by simulated annealing.
+
+The candidate key square is a flat list of 25 letter indices plus a
+letter -> cell index, both mutated in place by the standard moves (swap two
+letters, swap two rows or columns, flip the square top-to-bottom or
+left-to-right, reverse it). Every move is its own inverse, so a rejected
+move is undone by applying it again, and each step decrypts into a reused
+buffer and scores it with English quadgram log probabilities. Independent
+restarts run in a process pool and the best key so far is streamed back as
+restarts finish.
+"""
+
+import math
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from fitness import quadgram_table
+from PlayfairCipher import normalize_text, playfair_decrypt
+
+ALPHABET = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
+
+
+def _decrypted_cells(p1: int, p2: int) -> Tuple[int, int]:
+    r1, c1, r2, c2 = p1 // 5, p1 % 5, p2 // 5, p2 % 5
+    if r1 == r2:
+        return r1 * 5 + (c1 - 1) % 5, r2 * 5 + (c2 - 1) % 5
+    if c1 == c2:
+        return ((r1 - 1) % 5) * 5 + c1, ((r2 - 1) % 5) * 5 + c2
+    return r1 * 5 + c2, r2 * 5 + c1
+
+
+# The Playfair rules only depend on where the two letters sit, so for every
+# pair of cells (p1 * 25 + p2) the cells holding the plaintext are fixed
+# whatever the key; decrypting a digraph is then two lookups per letter.
+_PLAIN_CELL_1 = [_decrypted_cells(p1, p2)[0] for p1 in range(25) for p2 in range(25)]
+_PLAIN_CELL_2 = [_decrypted_cells(p1, p2)[1] for p1 in range(25) for p2 in range(25)]
+
+DEFAULT_ITERATIONS = 300_000
+DEFAULT_RESTARTS = 8
+
+
+class PlayfairSolution(NamedTuple):
+    score: float
+    key: str
+    plaintext: str
+    restart: int
+
+
+class Square:
+    """
+    A 5x5 key square stored as 25 letter indices in row-major order, with
+    the inverse letter -> cell index kept in sync by every move.
+    """
+
+    __slots__ = ("cells", "position")
+
+    def __init__(self, letters: str) -> None:
+        self.cells = [ord(char) - ord('A') for char in letters]
+        self.position = [-1] * 26
+        for cell, letter in enumerate(self.cells):
+            self.position[letter] = cell
+
+    def key(self) -> str:
+        return "".join(chr(letter + ord('A')) for letter in self.cells)
+
+    def swap_cells(self, i: int, j: int) -> None:
+        cells = self.cells
+        cells[i], cells[j] = cells[j], cells[i]
+        self.position[cells[i]] = i
+        self.position[cells[j]] = j
+
+    def swap_rows(self, r1: int, r2: int) -> None:
+        for c in range(5):
+            self.swap_cells(r1 * 5 + c, r2 * 5 + c)
+
+    def swap_cols(self, c1: int, c2: int) -> None:
+        for r in range(5):
+            self.swap_cells(r * 5 + c1, r * 5 + c2)
+
+    def flip_rows(self) -> None:
+        self.swap_rows(0, 4)
+        self.swap_rows(1, 3)
+
+    def flip_cols(self) -> None:
+        self.swap_cols(0, 4)
+        self.swap_cols(1, 3)
+
+    def reverse(self) -> None:
+        for i in range(12):
+            self.swap_cells(i, 24 - i)
+
+
+def random_move(square: Square, rng: random.Random) -> Tuple[int, int, int]:
+    """
+    Applies a random move and returns it, so undo_move can reverse it.
+    Letter swaps are by far the most common, as in the usual Playfair
+    annealing schedules.
+    """
+    roll = rng.randrange(50)
+    if roll < 45:
+        i, j = rng.sample(range(25), 2)
+        move = (0, i, j)
+    elif roll < 47:
+        i, j = rng.sample(range(5), 2)
+        move = (1, i, j)
+    elif roll < 49:
+        i, j = rng.sample(range(5), 2)
+        move = (2, i, j)
+    else:
+        move = (3 + rng.randrange(3), 0, 0)
+    undo_move(square, move)
+    return move
+
+
+def undo_move(square: Square, move: Tuple[int, int, int]) -> None:
+    """
+    Applies a move; since every move is its own inverse this also undoes it.
+    """
+    kind, a, b = move
+    if kind == 0:
+        square.swap_cells(a, b)
+    elif kind == 1:
+        square.swap_rows(a, b)
+    elif kind == 2:
+        square.swap_cols(a, b)
+    elif kind == 3:
+        square.flip_rows()
+    elif kind == 4:
+        square.flip_cols()
+    else:
+        square.reverse()
+
+
+def decrypt_score(square: Square, cipher: Sequence[int], plain: List[int]) -> float:
+    """
+    Decrypts the ciphertext letter indices into plain (reused between calls)
+    and returns the quadgram log probability of the result.
+    """
+    cells = square.cells
+    position = square.position
+    for k in range(0, len(cipher), 2):
+        pair = position[cipher[k]] * 25 + position[cipher[k + 1]]
+        plain[k] = cells[_PLAIN_CELL_1[pair]]
+        plain[k + 1] = cells[_PLAIN_CELL_2[pair]]
+    table = quadgram_table()
+    quad = (plain[0] * 26 + plain[1]) * 26 + plain[2]
+    total = 0.0
+    for index in plain[3:]:
+        quad = (quad % 17576) * 26 + index
+        total += table[quad]
+    return total
+
+
+def anneal(
+    cipher: Sequence[int], iterations: int, seed: Optional[int], start_key: str = ALPHABET
+) -> Tuple[float, str]:
+    """
+    Runs one simulated-annealing search and returns (best score, best key).
+    The temperature falls linearly to zero over the iterations, starting
+    higher for longer texts since their scores move in bigger steps.
+    """
+    rng = random.Random(seed)
+    letters = list(start_key)
+    rng.shuffle(letters)
+    square = Square("".join(letters))
+    plain = [0] * len(cipher)
+    current = decrypt_score(square, cipher, plain)
+    best, best_key = current, square.key()
+    start_temperature = 10 + 0.087 * max(len(cipher) - 84, 0)
+    for step in range(iterations):
+        temperature = start_temperature * (1 - step / iterations)
+        move = random_move(square, rng)
+        score = decrypt_score(square, cipher, plain)
+        delta = score - current
+        if delta >= 0 or (temperature > 0 and rng.random() < math.exp(delta / temperature)):
+            current = score
+            if current > best:
+                best, best_key = current, square.key()
+        else:
+            undo_move(square, move)
+    return best, best_key
+
+
+def _restart(cipher: Sequence[int], iterations: int, seed: Optional[int]) -> Tuple[float, str]:
+    return anneal(cipher, iterations, seed)
+
+
+def solve_playfair(
+    ciphertext: str,
+    restarts: int = DEFAULT_RESTARTS,
+    iterations: int = DEFAULT_ITERATIONS,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Iterator[PlayfairSolution]:
+    """
+    Searches for the Playfair key square of a ciphertext.
+
+    Runs independent annealing restarts (in worker processes unless
+    workers=1) and yields a PlayfairSolution each time a finished restart
+    beats the best score so far, so the last value yielded is the best key.
+    The key is the 25-letter square, usable directly as a Playfair keyword.
+
+    Everything but the letters is dropped (J counts as I) before the text is
+    paired, and the plaintext is the decryption of those letters alone.
+    """
+    letters = "".join(char for char in normalize_text(ciphertext) if char in ALPHABET)
+    cipher = [ord(char) - ord('A') for char in letters]
+    if len(cipher) < 4 or len(cipher) % 2:
+        raise ValueError("Ciphertext needs an even number of letters, at least four.")
+    seeds = [None if seed is None else seed + i for i in range(restarts)]
+    best = float("-inf")
+
+    def solution(result: Tuple[float, str], restart: int) -> PlayfairSolution:
+        score, key = result
+        return PlayfairSolution(score, key, playfair_decrypt(letters, key), restart)
+
+    if workers == 1:
+        for restart, restart_seed in enumerate(seeds):
+            result = _restart(cipher, iterations, restart_seed)
+            if result[0] > best:
+                best = result[0]
+                yield solution(result, restart)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_restart, cipher, iterations, restart_seed): restart
+            for restart, restart_seed in enumerate(seeds)
+        }
+        pending: Set[Future[Tuple[float, str]]] = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result[0] > best:
+                    best = result[0]
+                    yield solution(result, futures[future])
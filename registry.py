@@ -0,0 +1,74 @@
+"""
+Common dispatch table for the six ciphers.
+
+Every cipher is registered with the module and names of its encrypt/decrypt
+functions and the names of the key parameters they take after the text,
+using the same names as the CLI options (shift, a, b, key, rails). Modules
+are imported only when a cipher is first used, so a one-shot command loads
+just the cipher it runs. ``Transform`` binds a cipher, an action and a key
+into a picklable one-argument callable, so it can be shipped to worker
+processes.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Tuple
+
+ACTIONS = ("encrypt", "decrypt")
+
+
+class CipherSpec(NamedTuple):
+    module: str
+    encrypt_name: str
+    decrypt_name: str
+    params: Tuple[str, ...]
+
+    @property
+    def encrypt(self) -> Callable[..., str]:
+        return self.function("encrypt")
+
+    @property
+    def decrypt(self) -> Callable[..., str]:
+        return self.function("decrypt")
+
+    def function(self, action: str) -> Callable[..., str]:
+        """
+        Imports the cipher's module and returns its function for the action.
+        """
+        name = self.encrypt_name if action == "encrypt" else self.decrypt_name
+        func: Callable[..., str] = getattr(importlib.import_module(self.module), name)
+        return func
+
+
+CIPHERS: Dict[str, CipherSpec] = {
+    "caesar": CipherSpec("CeaserCipher", "caesar_encrypt", "caesar_decrypt", ("shift",)),
+    "affine": CipherSpec("AffineCipher", "affine_encrypt", "affine_decrypt", ("a", "b")),
+    "vigenere": CipherSpec("VigenereCipher", "vigenere_encrypt", "vigenere_decrypt", ("key",)),
+    "playfair": CipherSpec("PlayfairCipher", "playfair_encrypt", "playfair_decrypt", ("key",)),
+    "railfence": CipherSpec("RailFenceCipher", "rail_fence_encrypt", "rail_fence_decrypt",
+                            ("rails",)),
+    "rowtrans": CipherSpec("RowTranspositionCipher", "row_transposition_encrypt",
+                           "row_transposition_decrypt", ("key",)),
+}
+
+
+class Transform:
+    """
+    One cipher action with its key bound, callable as transform(text).
+    """
+
+    def __init__(self, cipher: str, action: str, params: Mapping[str, Any]) -> None:
+        if cipher not in CIPHERS:
+            raise ValueError(f"Unknown cipher '{cipher}'. Choose from: {', '.join(CIPHERS)}")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action '{action}'. Choose 'encrypt' or 'decrypt'.")
+        spec = CIPHERS[cipher]
+        missing = [name for name in spec.params if params.get(name) is None]
+        if missing:
+            raise ValueError(f"{cipher} requires: {', '.join('--' + name for name in missing)}")
+        self.cipher = cipher
+        self.action = action
+        self.func = spec.function(action)
+        self.args = tuple(params[name] for name in spec.params)
+
+    def __call__(self, text: str) -> str:
+        return self.func(text, *self.args)
@@ -0,0 +1,259 @@
+"""
+Long-running cipher service over a Unix domain socket or localhost TCP.
+
+The protocol is JSON lines. Each request is one object naming the cipher,
+the action, the text and the key parameters by their registry names::
+
+    {"id": 1, "cipher": "caesar", "action": "encrypt", "text": "Hello", "shift": 3}
+
+and each response echoes the id with either the result or an error::
+
+    {"id": 1, "text": "Khoor"}
+    {"id": 2, "error": "caesar requires: --shift"}
+
+A connection may pipeline any number of requests; responses come back in
+request order. A request of ``{"id": 3, "stats": true}`` is answered with the
+server process's key cache counters (see keycache) instead of a text::
+
+    {"id": 3, "key_cache": {"hits": 41, "misses": 2, ...}}
+
+Short texts are transformed on the event loop, long ones in a
+process pool. At most MAX_PIPELINE requests per connection are in flight;
+beyond that the server stops reading until responses have been written, so
+a client that does not read its responses is slowed down, not buffered.
+
+CipherClient is a small blocking client for scripts that want to reuse one
+warm server process instead of starting the CLI for every message.
+"""
+
+import asyncio
+import json
+import socket
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from keycache import key_cache_stats
+from registry import Transform
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Texts at least this long are sent to the worker pool
+OFFLOAD_THRESHOLD = 64 * 1024
+
+# Requests read ahead of the responses written, per connection
+MAX_PIPELINE = 64
+
+# Longest request line accepted
+MAX_LINE = 64 * 1024 * 1024
+
+Response = Dict[str, Any]
+
+
+def handle_request(line: bytes) -> Tuple[Optional[Transform], str, Response]:
+    """
+    Parses a request line into (transform, text, response template). The
+    transform is None when the request is invalid; the template then already
+    holds the error.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return None, "", {"id": None, "error": f"Invalid JSON: {e}"}
+    if not isinstance(request, dict):
+        return None, "", {"id": None, "error": "Request must be a JSON object"}
+    response: Response = {"id": request.get("id")}
+    if request.get("stats"):
+        response["key_cache"] = key_cache_stats()._asdict()
+        return None, "", response
+    text = request.get("text")
+    if not isinstance(text, str):
+        response["error"] = "Request needs a string 'text' field"
+        return None, "", response
+    try:
+        transform = Transform(str(request.get("cipher")), str(request.get("action")), request)
+    except ValueError as e:
+        response["error"] = str(e)
+        return None, "", response
+    return transform, text, response
+
+
+async def _respond(
+    transform: Optional[Transform], text: str, response: Response, executor: Executor
+) -> bytes:
+    if transform is not None:
+        try:
+            if len(text) >= OFFLOAD_THRESHOLD:
+                loop = asyncio.get_running_loop()
+                response["text"] = await loop.run_in_executor(executor, transform, text)
+            else:
+                response["text"] = transform(text)
+        except Exception as e:
+            response["error"] = f"{type(e).__name__}: {e}"
+    return (json.dumps(response) + "\n").encode('utf-8')
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Reads the next request line; b"" at end of input. A line longer than
+    the reader's limit is discarded through its newline and None returned,
+    so it gets exactly one error response however it arrives.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+    while True:
+        # The overrun leaves the data buffered; drop it and look again
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+
+async def _serve_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, executor: Executor
+) -> None:
+    pending: asyncio.Queue[Optional[asyncio.Future[bytes]]] = asyncio.Queue(MAX_PIPELINE)
+
+    async def write_responses() -> None:
+        # Once the client is gone, keep draining the queue so the reader
+        # never blocks on a full pipeline
+        connected = True
+        while True:
+            task = await pending.get()
+            if task is None:
+                return
+            if not connected:
+                task.cancel()
+                continue
+            try:
+                writer.write(await task)
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+
+    writing = asyncio.ensure_future(write_responses())
+    try:
+        while True:
+            try:
+                line = await _read_request(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                break
+            if line is None:
+                error = {"id": None, "error": f"Request line longer than {MAX_LINE} bytes"}
+                await pending.put(asyncio.ensure_future(_respond(None, "", error, executor)))
+                continue
+            if not line:
+                break
+            if line.strip():
+                await pending.put(asyncio.ensure_future(_respond(*handle_request(line), executor)))
+        await pending.put(None)
+        await writing
+    finally:
+        writer.close()
+
+
+async def serve(
+    path: Optional[str] = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Serves requests on the Unix socket at path, or on host:port, until
+    cancelled.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        async def on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _serve_connection(reader, writer, executor)
+
+        if path is not None:
+            server = await asyncio.start_unix_server(on_connect, path, limit=MAX_LINE)
+        else:
+            server = await asyncio.start_server(on_connect, host, port, limit=MAX_LINE)
+        async with server:
+            await server.serve_forever()
+
+
+class CipherClient:
+    """
+    Blocking client for the cipher service.
+
+    request() sends one message and waits for its result; transform_many()
+    pipelines a sequence of requests, keeping up to MAX_PIPELINE in flight.
+    Errors reported by the server are raised as ValueError.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+    ) -> None:
+        if path is not None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(path)
+        else:
+            self.sock = socket.create_connection((host, port))
+        self.reader = self.sock.makefile("rb")
+
+    def close(self) -> None:
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self) -> "CipherClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _send(self, cipher: str, action: str, text: str, params: Dict[str, Any]) -> None:
+        request = {**params, "cipher": cipher, "action": action, "text": text}
+        self.sock.sendall((json.dumps(request) + "\n").encode('utf-8'))
+
+    def _receive_response(self) -> Response:
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Cipher service closed the connection")
+        response: Response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response
+
+    def _receive(self) -> str:
+        return str(self._receive_response()["text"])
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the server's key cache counters (hits, misses, evictions,
+        size, maxsize).
+        """
+        self.sock.sendall(b'{"stats": true}\n')
+        return dict(self._receive_response()["key_cache"])
+
+    def request(self, cipher: str, action: str, text: str, **params: Any) -> str:
+        """
+        Transforms one text, e.g. request("caesar", "encrypt", "Hi", shift=3).
+        """
+        self._send(cipher, action, text, params)
+        return self._receive()
+
+    def transform_many(
+        self, cipher: str, action: str, texts: Iterable[str], **params: Any
+    ) -> Iterator[str]:
+        """
+        Transforms every text under one key, yielding results in order.
+        """
+        in_flight = 0
+        for text in texts:
+            self._send(cipher, action, text, params)
+            in_flight += 1
+            if in_flight == MAX_PIPELINE:
+                yield self._receive()
+                in_flight -= 1
+        for _ in range(in_flight):
+            yield self._receive()
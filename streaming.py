@@ -0,0 +1,112 @@
+"""
+Chunked generator pipelines for running the ciphers over files and pipes.
+
+Each ``*_stream`` function takes an iterable of text chunks and yields the
+transformed chunks, carrying whatever state the cipher needs across chunk
+boundaries, so memory stays bounded by the chunk size. Joining the output of
+a stream always gives the same text as calling the one-shot function on the
+joined input.
+
+The transposition ciphers (Rail Fence, Row Transposition) permute the whole
+message by its total length, so ``buffered_stream`` collects their input
+before transforming it.
+
+Each stream imports its cipher module when called, so the CLI loads only
+the cipher it runs.
+"""
+
+from typing import Callable, Iterable, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def read_chunks(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yields fixed-size chunks of text from a stream until it is exhausted.
+    """
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_chunks(chunks: Iterable[str], stream: TextIO) -> None:
+    """
+    Writes every chunk to the stream as it is produced.
+    """
+    for chunk in chunks:
+        stream.write(chunk)
+    stream.flush()
+
+
+def caesar_stream(chunks: Iterable[str], shift: int, decrypt: bool = False) -> Iterator[str]:
+    """
+    Caesar over a chunked stream; the cipher has no state between characters.
+    """
+    from CeaserCipher import caesar_decrypt, caesar_encrypt
+
+    transform = caesar_decrypt if decrypt else caesar_encrypt
+    for chunk in chunks:
+        yield transform(chunk, shift)
+
+
+def affine_stream(
+    chunks: Iterable[str], key_a: int, key_b: int, decrypt: bool = False
+) -> Iterator[str]:
+    """
+    Affine over a chunked stream. For decryption the key is validated once,
+    up front, raising AffineKeyError for an 'a' without an inverse.
+    """
+    from AffineCipher import affine_encrypt, affine_key
+
+    if decrypt:
+        key = affine_key(key_a, key_b)
+        for chunk in chunks:
+            yield key.decrypt(chunk)
+        return
+    for chunk in chunks:
+        yield affine_encrypt(chunk, key_a, key_b)
+
+
+def vigenere_stream(chunks: Iterable[str], key: str, decrypt: bool = False) -> Iterator[str]:
+    """
+    Vigenère over a chunked stream, carrying the key position between chunks.
+    """
+    from VigenereCipher import VigenereStream
+
+    stream = VigenereStream(key, decrypt)
+    for chunk in chunks:
+        yield stream.update(chunk)
+
+
+def playfair_stream(chunks: Iterable[str], key: str, mode: int) -> Iterator[str]:
+    """
+    Playfair over a chunked stream (mode = 1 to encrypt, -1 to decrypt).
+    A letter left unpaired at the end of a chunk is carried into the next one,
+    so digraphs and the double-letter 'X' rule match the one-shot output.
+    """
+    from PlayfairCipher import normalize_text, playfair_key, prepare_ciphertext, split_digraphs
+
+    prepared_key = playfair_key(key)
+    carry = ""
+    for chunk in chunks:
+        text = carry + normalize_text(chunk)
+        if mode == 1:
+            pairs, carry = split_digraphs(text, final=False)
+        else:
+            split = len(text) - len(text) % 2
+            pairs, carry = prepare_ciphertext(text[:split]), text[split:]
+        if pairs:
+            yield prepared_key.crypt(pairs, mode)
+    if carry:
+        pairs = split_digraphs(carry)[0] if mode == 1 else prepare_ciphertext(carry)
+        yield prepared_key.crypt(pairs, mode)
+
+
+def buffered_stream(chunks: Iterable[str], transform: Callable[[str], str]) -> Iterator[str]:
+    """
+    Collects the whole input and yields the transform of it as one chunk.
+    Used for ciphers whose output depends on the total message length.
+    """
+    yield transform("".join(chunks))
@@ -0,0 +1,211 @@
+"""
+One ciphertext decrypted under many keys at once.
+
+Trying keys by calling caesar_decrypt, affine_decrypt or vigenere_decrypt in
+a loop re-scans and re-classifies the same text for every key. SweepText
+analyzes it once: which positions hold letters, their case and their
+indices 0-25. Every key of the three ciphers then decrypts letter x at text
+position p to (m * x + c[p % period]) mod 26:
+
+- Caesar shift s: m = 1, c = -s, period 1 (case kept).
+- Affine (a, b): m = a^-1, c = -a^-1 * b, period 1 (upper-cased).
+- Vigenère: m = 1, c = the key's decryption shifts, period len(key) (case
+  kept; the key advances on every character, letter or not).
+
+With NumPy a block of keys becomes a 2-D array of keys x letters, computed
+with one broadcast, and is either written back into copies of the text or
+scored with quadgram fitness without building any string. Without NumPy
+each key goes through cached translation tables. top() scores every key
+and builds only the best plaintexts.
+
+Results match the cipher functions exactly. Text with non-ASCII characters
+is decrypted by those functions one key at a time, as pipeline.py does,
+since their handling of non-ASCII letters does not fit the A-Z arrays.
+"""
+
+import heapq
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from AffineCipher import affine_decrypt, modinv
+from analysis import VALID_AFFINE_A
+from CeaserCipher import caesar_decrypt
+from fitness import QUADGRAM_FLOOR, fitness, letter_indices, quadgram_table, score_indices
+from optional_deps import HAVE_NUMPY
+from optional_deps import numpy as np
+from vigenere_analysis import position_codes
+from VigenereCipher import key_shifts, vigenere_decrypt
+
+SWEEP_CIPHERS = ("caesar", "affine", "vigenere")
+
+# Most keys x letters cells held at once; keys are processed in blocks
+BLOCK_CELLS = 1 << 20
+
+SweepKey = Union[int, Tuple[int, int], str]
+
+# Letter index -> index shifted by s, for each shift s; 255 (a non-letter
+# position code) is kept
+_SHIFT = [bytes((x + s) % 26 if x < 26 else x for x in range(256)) for s in range(26)]
+
+
+class SweepResult(NamedTuple):
+    score: float
+    key: SweepKey
+    plaintext: str
+
+
+def all_keys(cipher: str) -> List[SweepKey]:
+    """
+    Lists the whole key space of Caesar (26 shifts) or Affine (312 keys).
+    """
+    if cipher == "caesar":
+        return list(range(26))
+    if cipher == "affine":
+        return [(a, b) for a in VALID_AFFINE_A for b in range(26)]
+    raise ValueError(f"Only Caesar and Affine have an enumerable key space, not {cipher}")
+
+
+def letter_map(cipher: str, key: Any) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Returns (m, c) such that the key decrypts letter x at text position p
+    to (m * x + c[p % len(c)]) mod 26. Raises AffineKeyError for an Affine
+    key without an inverse and ValueError for an empty Vigenère key.
+    """
+    if cipher == "caesar":
+        return 1, (-key % 26,)
+    if cipher == "affine":
+        a, b = key
+        inverse = modinv(a)
+        return inverse, (-inverse * b % 26,)
+    if cipher == "vigenere":
+        if not key:
+            raise ValueError("Keyword must not be empty.")
+        return 1, key_shifts(key, decrypt=True)
+    raise ValueError(f"Unknown cipher '{cipher}'. Choose from: {', '.join(SWEEP_CIPHERS)}")
+
+
+def _decrypt(text: str, cipher: str, key: Any) -> str:
+    if cipher == "caesar":
+        return caesar_decrypt(text, key)
+    if cipher == "affine":
+        return affine_decrypt(text, *key)
+    return vigenere_decrypt(text, key)
+
+
+class SweepText:
+    """
+    A ciphertext analyzed once for decrypting under many keys.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.is_ascii = text.isascii()
+        # Letter index 0-25 of every A-Z letter, in order
+        self.indices = letter_indices(text)
+        # Letter index or 255 at every position, for Vigenère columns
+        self.codes = position_codes(text) if self.is_ascii else b""
+        if HAVE_NUMPY and self.is_ascii:
+            chars = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+            # As in backends.numpy_shift: bit 5 is the case bit
+            base = (chars & 32) | 64
+            letters = chars - base
+            self.chars = chars
+            self.positions = np.flatnonzero((letters >= 1) & (letters <= 26))
+            self.case_base = base[self.positions] + 1
+            self.letter_array = np.frombuffer(self.indices, dtype=np.uint8).astype(np.int32)
+
+    def _fast(self) -> bool:
+        return HAVE_NUMPY and self.is_ascii
+
+    def _blocks(self, cipher: str, keys: Sequence[Any]) -> Iterator[Tuple[int, Any]]:
+        """
+        Yields (first key number, keys x letters array of plaintext letter
+        indices) for the keys in blocks of at most BLOCK_CELLS cells.
+        """
+        size = max(1, BLOCK_CELLS // max(len(self.indices), 1))
+        for start in range(0, len(keys), size):
+            maps = [letter_map(cipher, key) for key in keys[start:start + size]]
+            multipliers = np.array([m for m, _ in maps], dtype=np.int32)
+            periods = np.array([len(c) for _, c in maps], dtype=np.int64)
+            offsets = np.zeros((len(maps), int(periods.max())), dtype=np.int32)
+            for row, (_, c) in enumerate(maps):
+                offsets[row, :len(c)] = c
+            if offsets.shape[1] == 1:
+                shift = offsets
+            else:
+                columns = self.positions[None, :] % periods[:, None]
+                shift = offsets[np.arange(len(maps))[:, None], columns]
+            plain = multipliers[:, None] * self.letter_array[None, :] + shift
+            plain %= 26
+            yield start, plain
+
+    def decryptions(self, cipher: str, keys: Iterable[Any]) -> Iterator[str]:
+        """
+        Yields the decryption under each key in turn, equal to what
+        caesar_decrypt, affine_decrypt or vigenere_decrypt would return.
+        """
+        keys = list(keys)
+        if not self._fast():
+            for key in keys:
+                letter_map(cipher, key)
+                yield _decrypt(self.text, cipher, key)
+            return
+        for _, plain in self._blocks(cipher, keys):
+            rows = np.empty((len(plain), len(self.chars)), dtype=np.uint8)
+            rows[:] = self.chars
+            if cipher == "affine":
+                rows[:, self.positions] = plain + ord('A')
+            else:
+                rows[:, self.positions] = plain + self.case_base
+            for row in rows:
+                yield row.tobytes().decode('ascii')
+
+    def scores(self, cipher: str, keys: Iterable[Any]) -> List[float]:
+        """
+        Returns the fitness (see fitness.fitness) of the decryption under
+        each key, without building the decrypted strings.
+        """
+        keys = list(keys)
+        if not self.is_ascii:
+            return [fitness(text) for text in self.decryptions(cipher, keys)]
+        if len(self.indices) < 4:
+            for key in keys:
+                letter_map(cipher, key)
+            return [QUADGRAM_FLOOR] * len(keys)
+        quads = len(self.indices) - 3
+        if not HAVE_NUMPY:
+            return [score_indices(self._python_plain(cipher, key)) / quads for key in keys]
+        table = np.frombuffer(quadgram_table(), dtype=np.float64)
+        result: List[float] = []
+        for _, plain in self._blocks(cipher, keys):
+            codes = plain[:, :-3] * 26 + plain[:, 1:-2]
+            codes *= 26
+            codes += plain[:, 2:-1]
+            codes *= 26
+            codes += plain[:, 3:]
+            result.extend((table[codes].sum(axis=1) / quads).tolist())
+        return result
+
+    def _python_plain(self, cipher: str, key: Any) -> bytes:
+        multiplier, offsets = letter_map(cipher, key)
+        if len(offsets) == 1:
+            table = bytes((multiplier * x + offsets[0]) % 26 for x in range(26))
+            return self.indices.translate(table + bytes(230))
+        plain = bytearray(self.codes)
+        period = len(offsets)
+        for j in range(min(period, len(plain))):
+            plain[j::period] = self.codes[j::period].translate(_SHIFT[offsets[j]])
+        return bytes(plain).translate(None, b"\xff")
+
+    def top(self, cipher: str, keys: Optional[Iterable[Any]] = None,
+            count: int = 5) -> List[SweepResult]:
+        """
+        Scores every key (the whole key space for Caesar and Affine when
+        keys is None) and returns the best count with their decryptions,
+        best first; equal scores keep the order of the keys.
+        """
+        keys = all_keys(cipher) if keys is None else list(keys)
+        scores = self.scores(cipher, keys)
+        best = heapq.nlargest(count, range(len(keys)), key=scores.__getitem__)
+        plaintexts = self.decryptions(cipher, [keys[i] for i in best])
+        return [SweepResult(scores[i], keys[i], plaintext)
+                for i, plaintext in zip(best, plaintexts)]
@@ -3,12 +3,82 @@ Pytest unit tests for cipher implementations.
 Run with: pytest -q
 """
 
-from CeaserCipher import caesar_encrypt, caesar_decrypt
-from AffineCipher import affine_encrypt, affine_decrypt
-from PlayfairCipher import generate_key_matrix, prepare_plaintext, playfair_crypt
-from RailFenceCipher import rail_fence_encrypt, rail_fence_decrypt
-from RowTranspositionCipher import row_transposition_encrypt, row_transposition_decrypt
-from VigenereCipher import vigenere_encrypt, vigenere_decrypt
+import asyncio
+import io
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from CeaserCipher import caesar_encrypt, caesar_decrypt, caesar_decrypt_into, caesar_encrypt_into
+from AffineCipher import (
+    AffineKeyError,
+    affine_decrypt,
+    affine_decrypt_into,
+    affine_encrypt,
+    affine_encrypt_into,
+    affine_key,
+    egcd,
+    modinv,
+)
+from PlayfairCipher import (
+    generate_key_matrix,
+    playfair_crypt,
+    playfair_decrypt,
+    playfair_encrypt,
+    playfair_key,
+    prepare_plaintext,
+)
+import RailFenceCipher
+from RailFenceCipher import (
+    rail_fence_decrypt,
+    rail_fence_decrypt_into,
+    rail_fence_encrypt,
+    rail_fence_encrypt_into,
+    zigzag_inverse_prefix,
+    zigzag_permutation,
+)
+from RowTranspositionCipher import (
+    row_transposition_decrypt,
+    row_transposition_decrypt_into,
+    row_transposition_encrypt,
+    row_transposition_encrypt_into,
+)
+from VigenereCipher import (
+    VigenereStream,
+    vigenere_decrypt,
+    vigenere_decrypt_into,
+    vigenere_encrypt,
+    vigenere_encrypt_into,
+)
+from alphabet import ALPHANUMERIC, UPPERCASE, Alphabet
+from analysis import analyze
+from backends import BACKENDS, DEFAULT_BACKEND, set_backend
+from vigenere_analysis import recover_key
+from transposition_analysis import analyze_rail_fence, analyze_row_transposition
+from fitness import fitness, letter_indices, score_indices
+from pipeline import Pipeline, parse_stage
+from playfair_solver import ALPHABET, Square, decrypt_score, random_move, solve_playfair, undo_move
+from batch import batch_transform, run_batch
+from dictionary_attack import dictionary_attack, unique_keys, vigenere_key
+import cli
+import instrumentation
+from keycache import KeyCache
+from ngram_stats import NgramCounts, count_chunks, count_file
+from mapped import MAPPED_CIPHERS, IntoFunction, mmap_transform
+import service
+import translation
+from service import CipherClient, serve
+from registry import Transform
+from streaming import playfair_stream, vigenere_stream
+from sweep import SweepText, all_keys
 
 
 def test_caesar_basic_roundtrip() -> None:
@@ -19,6 +89,11 @@ def test_caesar_basic_roundtrip() -> None:
     assert decrypted == plaintext
 
 
+def test_caesar_preserves_case_and_non_letters() -> None:
+    assert caesar_encrypt("Hello, World! xyz", 3) == "Khoor, Zruog! abc"
+    assert caesar_encrypt("abc", -1) == caesar_encrypt("abc", 25) == "zab"
+
+
 def test_affine_basic_roundtrip() -> None:
     plaintext = "HELLO WORLD"
     a, b = 5, 8
@@ -27,6 +102,25 @@ def test_affine_basic_roundtrip() -> None:
     assert decrypted.replace(" ", "") == plaintext.replace(" ", "")
 
 
+def test_affine_key_validates_once_and_inverts_any_modulus() -> None:
+    key = affine_key(5, 8)
+    assert affine_key(5, 34) is key
+    assert key.decrypt(key.encrypt("Hello")) == "HELLO"
+    assert all(a * modinv(a) % 26 == 1 for a in (1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25))
+    assert 7 * modinv(7, 256) % 256 == 1
+    assert egcd(240, 46)[0] == 2
+    for a, m in ((13, 26), (4, 26), (6, 256)):
+        with pytest.raises(AffineKeyError):
+            modinv(a, m)
+    with pytest.raises(AffineKeyError):
+        affine_decrypt("RCLLA", 2, 8)
+
+
+def test_affine_uppercases_output() -> None:
+    assert affine_encrypt("hello world", 5, 8) == "RCLLA OAPLX"
+    assert affine_decrypt("rclla oaplx", 5, 8) == "HELLO WORLD"
+
+
 def test_playfair_roundtrip_prepared_plaintext() -> None:
     # Use a plaintext that will cause padding/inserted X
     plaintext = "HELLO WORLD"
@@ -53,6 +147,14 @@ def test_playfair_roundtrip_simple_no_x_needed() -> None:
     assert decrypted == plaintext
 
 
+def test_playfair_key_is_memoized_and_matches_matrix() -> None:
+    key = playfair_key("keyword")
+    assert playfair_key("KEY WORD") is key
+    assert key.positions["K"] == (0, 0)
+    pairs = prepare_plaintext("HIDE THE GOLD")
+    assert key.crypt(pairs, 1) == playfair_crypt(pairs, generate_key_matrix("KEYWORD"), 1)
+
+
 def test_rail_fence_roundtrip() -> None:
     plaintext = "HELLO WORLD"
     rails = 3
@@ -67,6 +169,22 @@ def test_rail_fence_trivial_cases() -> None:
     assert rail_fence_encrypt("AB", 1) == "AB"
 
 
+def test_rail_fence_permutation_closed_form(monkeypatch: pytest.MonkeyPatch) -> None:
+    perm, inverse = zigzag_permutation(7, 3)
+    assert list(perm) == [0, 4, 1, 3, 5, 2, 6]
+    assert [perm[i] for i in inverse] == list(range(7))
+    assert zigzag_permutation(7, 3)[0] is perm
+    # Permutations of long messages are not kept alive by the cache
+    monkeypatch.setattr(RailFenceCipher, "CACHE_MAX_LENGTH", 6)
+    assert zigzag_permutation(7, 3)[0] is not perm
+    assert zigzag_permutation(7, 3)[0] == perm
+    for length, rails in ((7, 3), (50, 4), (51, 7)):
+        assert zigzag_inverse_prefix(length, rails, 20) == zigzag_permutation(length, rails)[1][:20]
+    assert rail_fence_encrypt("HELLO WORLD", 3) == "HOREL OLLWD"
+    # More rails than characters leaves the message unchanged
+    assert rail_fence_decrypt(rail_fence_encrypt("ABCDE", 9), 9) == "ABCDE"
+
+
 def test_row_transposition_roundtrip() -> None:
     plaintext = "HELLO WORLD"
     key = "3142"
@@ -75,9 +193,440 @@ def test_row_transposition_roundtrip() -> None:
     assert decrypted.rstrip('X') == plaintext.replace(" ", "").upper()
 
 
+def test_row_transposition_uneven_last_row() -> None:
+    assert row_transposition_encrypt("HELLO WORLD", "3142") == "EWDLRXHOLLOX"
+    # 10 characters over 4 columns: only columns 0 and 1 reach the last row
+    assert row_transposition_decrypt("ABCDEFGHIJ", "3142") == "FAIDGBJEHC"
+
+
 def test_vigenere_roundtrip() -> None:
     plaintext = "HELLO WORLD"
     keyword = "KEY"
     encrypted = vigenere_encrypt(plaintext, keyword)
     decrypted = vigenere_decrypt(encrypted, keyword)
     assert decrypted == plaintext
+
+
+def test_alphabets_match_builtin_path_and_roundtrip() -> None:
+    text = "Hello, World! zulu-9"
+    assert caesar_encrypt(text, 3, UPPERCASE) == caesar_encrypt(text, 3)
+    assert affine_encrypt(text, 5, 8, UPPERCASE) == affine_encrypt(text, 5, 8)
+    assert vigenere_encrypt(text, "Lemon", alphabet=UPPERCASE) == vigenere_encrypt(text, "Lemon")
+    record = "ID-4821-XZ"
+    assert caesar_decrypt(caesar_encrypt(record, 30, ALPHANUMERIC), 30, ALPHANUMERIC) == record
+    assert affine_decrypt(affine_encrypt(record, 5, 7, ALPHANUMERIC), 5, 7, ALPHANUMERIC) == record
+    ciphertext = vigenere_encrypt(record, "K3Y", alphabet=ALPHANUMERIC)
+    assert vigenere_decrypt(ciphertext, "K3Y", alphabet=ALPHANUMERIC) == record
+    with pytest.raises(AffineKeyError):
+        affine_key(3, 0, ALPHANUMERIC)
+    latin = Alphabet("abcdefghijklmnopqrstuvwxyzàâçéèêëîïôûùü")
+    assert caesar_decrypt(caesar_encrypt("garçon été", 5, latin), 5, latin) == "garçon été"
+    square = generate_key_matrix("Secret 2024", ALPHANUMERIC)
+    assert [len(row) for row in square] == [6] * 6
+    message = playfair_encrypt("Meet at gate 7 by 9pm", "Secret 2024", ALPHANUMERIC)
+    assert playfair_decrypt(message, "Secret 2024", ALPHANUMERIC) == "MEETATGATE7BY9PM"
+    with pytest.raises(ValueError):
+        generate_key_matrix("KEY", UPPERCASE)
+
+
+def test_vigenere_stream_checkpoint_and_restore() -> None:
+    plaintext = "Attack at dawn"
+    stream = VigenereStream("LEMON")
+    first = stream.update(plaintext[:5])
+    position = stream.checkpoint()
+    # A fresh encoder resumed at the checkpoint continues the same key schedule
+    resumed = VigenereStream("LEMON")
+    resumed.restore(position)
+    assert first + resumed.update(plaintext[5:]) == vigenere_encrypt(plaintext, "LEMON")
+
+
+def test_vigenere_stream_matches_one_shot() -> None:
+    plaintext = "Attack at dawn, hold the line!"
+    chunks = [plaintext[i:i + 4] for i in range(0, len(plaintext), 4)]
+    assert "".join(vigenere_stream(chunks, "Lemon")) == vigenere_encrypt(plaintext, "Lemon")
+    encrypted = vigenere_encrypt(plaintext, "Lemon")
+    chunks = [encrypted[i:i + 7] for i in range(0, len(encrypted), 7)]
+    assert "".join(vigenere_stream(chunks, "Lemon", decrypt=True)) == plaintext
+
+
+def test_playfair_stream_carries_digraphs_across_chunks() -> None:
+    # Chunk boundaries split both a doubled letter ("LL") and a plain pair
+    chunks = ["HEL", "LO W", "ORLD"]
+    key_matrix = generate_key_matrix("KEYWORD")
+    expected = playfair_crypt(prepare_plaintext("HELLO WORLD"), key_matrix, 1)
+    encrypted = "".join(playfair_stream(chunks, "KEYWORD", 1))
+    assert encrypted == expected
+    decrypted = "".join(playfair_stream([encrypted[:3], encrypted[3:]], "KEYWORD", -1))
+    assert decrypted == "".join(prepare_plaintext("HELLO WORLD"))
+
+
+def test_batch_transform_keeps_input_order() -> None:
+    records = [f"record number {i}" for i in range(50)]
+    transform = Transform("vigenere", "encrypt", {"key": "KEY"})
+    expected = [vigenere_encrypt(r, "KEY") for r in records]
+    assert list(batch_transform(records, transform, workers=2, chunk_size=7)) == expected
+    assert list(batch_transform(records, transform, workers=1, chunk_size=7)) == expected
+
+
+def test_run_batch_jsonl_passes_other_fields_through() -> None:
+    source = io.StringIO('{"id": 1, "text": "abc"}\n"xyz"\n')
+    sink = io.StringIO()
+    transform = Transform("caesar", "encrypt", {"shift": 1})
+    stats = run_batch(source, sink, transform, fmt="jsonl", workers=1)
+    assert sink.getvalue() == '{"id": 1, "text": "bcd"}\n"yza"\n'
+    assert stats.records == 2
+    assert stats.key_cache.hits + stats.key_cache.misses >= 2
+
+
+def test_key_cache_counts_and_allows_nested_builds() -> None:
+    cache = KeyCache(maxsize=2)
+    outer = cache.get("outer", 1, lambda: cache.get("inner", 1, lambda: "x") + "y")
+    assert outer == "xy"
+    assert cache.get("outer", 1, lambda: "rebuilt") == "xy"
+    cache.get("other", 2, lambda: "z")
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+    with pytest.raises(ZeroDivisionError):
+        cache.get("bad", 0, lambda: str(1 // 0))
+    assert cache.get("bad", 0, lambda: "ok") == "ok"
+    assert affine_decrypt(affine_encrypt("HELLO", 5, 8), 5, 8) == "HELLO"
+
+
+def test_instrumentation_records_calls_and_phases() -> None:
+    instrumentation.reset()
+    caesar_decrypt("Khoor", 3)
+    assert instrumentation.metrics() == {}
+    instrumentation.enable()
+    try:
+        assert caesar_decrypt("Khoor", 3) == "Hello"
+        playfair_encrypt("Hide the gold", "KEYWORD")
+    finally:
+        instrumentation.disable()
+    metrics = instrumentation.metrics()
+    # caesar_decrypt goes through caesar_encrypt but is one call
+    assert (metrics["caesar"]["calls"], metrics["caesar"]["bytes"]) == (1, 5)
+    assert metrics["playfair"]["calls"] == 1
+    assert all(metrics["playfair"]["seconds"][phase] > 0 for phase in instrumentation.PHASES)
+    assert 'classic_ciphers_calls_total{cipher="playfair"} 1' in (
+        instrumentation.metrics_prometheus()
+    )
+    instrumentation.reset()
+
+
+def test_cli_one_shot_loads_only_its_cipher() -> None:
+    script = (
+        "import sys, cli\n"
+        "cli.main(['caesar', 'encrypt', '--shift', '3', '--message', 'Hello'])\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    output, modules = result.stdout.splitlines()
+    assert output == "Khoor"
+    loaded = set(modules.split())
+    assert "CeaserCipher" in loaded
+    for module in ("AffineCipher", "PlayfairCipher", "VigenereCipher", "analysis",
+                   "asyncio", "concurrent.futures", "numpy._core", "numpy.core"):
+        assert module not in loaded
+
+
+def test_pipeline_fuses_stages_and_matches_sequential_calls() -> None:
+    specs = ["caesar:encrypt:shift=3", "affine:encrypt:a=5,b=8", "vigenere:encrypt:key=LEMON",
+             "rowtrans:encrypt:key=3142", "railfence:encrypt:rails=3",
+             "rowtrans:decrypt:key=52413"]
+    pipeline = Pipeline.parse(specs)
+    assert [type(step).__name__ for step in pipeline.steps] == [
+        "SubstitutionStep", "Transform", "PermutationStep"]
+    for text in ("Attack at dawn, hold the Bridge!", "Straße über alles", "ab" * 3000, ""):
+        expected = text
+        for stage in pipeline.stages:
+            expected = stage(expected)
+        assert pipeline(text) == expected
+    assert not pipeline.streamable
+    substitution = Pipeline.parse(["caesar:encrypt:shift=3", "affine:decrypt:a=5,b=8"])
+    assert substitution.streamable
+    assert "".join(substitution.stream(["Hello ", "World"])) == substitution("Hello World")
+    with pytest.raises(ValueError):
+        parse_stage("caesar:encrypt:rails=3")
+    with pytest.raises(ValueError):
+        Pipeline.parse(["affine:decrypt:a=13,b=1", "caesar:encrypt:shift=1"])
+
+
+def test_analyze_recovers_caesar_and_affine_keys() -> None:
+    plaintext = "Meet me near the old bridge at midnight and bring the documents"
+    best = analyze(caesar_encrypt(plaintext, 7), workers=1)[0]
+    assert (best.cipher, best.key, best.plaintext) == ("caesar", (7,), plaintext)
+    best = analyze(affine_encrypt(plaintext, 11, 4), workers=2, threshold=None)[0]
+    assert (best.cipher, best.key) == ("affine", (11, 4))
+    assert best.plaintext == plaintext.upper()
+
+
+def test_recover_vigenere_key_from_ciphertext() -> None:
+    plaintext = (
+        "It was the best of times, it was the worst of times, it was the age of wisdom, "
+        "it was the age of foolishness, it was the epoch of belief, it was the epoch of "
+        "incredulity, it was the season of Light, it was the season of Darkness, it was "
+        "the spring of hope, it was the winter of despair, we had everything before us, "
+        "we had nothing before us, we were all going direct to Heaven, we were all going "
+        "direct the other way."
+    )
+    ciphertext = vigenere_encrypt(plaintext, "Lemon")
+    solution = recover_key(ciphertext)
+    assert solution.key == "LEMON"
+    assert vigenere_decrypt(ciphertext, solution.key) == plaintext
+    assert recover_key("ABCDEFGHIJKLMNOPQRSTUVWXYZ").key_length >= 1
+    for bad_text, bad_length in (("", 20), ("1234 !!", 20), ("HELLO", 0)):
+        with pytest.raises(ValueError):
+            recover_key(bad_text, bad_length)
+
+
+def test_playfair_solver_square_moves_keep_index_in_sync() -> None:
+    square = Square(ALPHABET)
+    rng = random.Random(1)
+    moves = [random_move(square, rng) for _ in range(200)]
+    assert all(square.cells[square.position[letter]] == letter for letter in square.cells)
+    for move in reversed(moves):
+        undo_move(square, move)
+    assert square.key() == ALPHABET
+
+
+def test_playfair_solver_scores_known_key_and_streams_improvements() -> None:
+    plaintext = "Meet me near the old bridge at midnight and bring the documents"
+    ciphertext = playfair_encrypt(plaintext, "Monarchy")
+    key = playfair_key("Monarchy")
+    square = Square("".join(letter for row in key.matrix for letter in row))
+    cipher = letter_indices(ciphertext)
+    score = decrypt_score(square, cipher, [0] * len(cipher))
+    assert score == score_indices(letter_indices(playfair_decrypt(ciphertext, "Monarchy")))
+    solutions = list(solve_playfair(ciphertext, restarts=3, iterations=500, workers=1, seed=7))
+    assert [s.score for s in solutions] == sorted(s.score for s in solutions)
+    best = solutions[-1]
+    assert playfair_decrypt(ciphertext, best.key) == best.plaintext
+    spaced = f"{ciphertext[:4]} {ciphertext[4:9]},\n{ciphertext[9:]}\n"
+    again = list(solve_playfair(spaced, restarts=3, iterations=500, workers=1, seed=7))
+    assert again == solutions
+
+
+def test_dictionary_attack_streams_wordlist_and_dedupes_keys(tmp_path: Path) -> None:
+    plaintext = "Meet me near the old bridge at midnight and bring the documents with you"
+    wordlist = tmp_path / "words.txt"
+    words = ["apple", "Lemon", "", "lemonlemon", "Jam", "iam", "monarchy", "Monarchy", "zebra"]
+    wordlist.write_text("\n".join(words) + "\n", encoding="utf-8")
+    assert list(unique_keys(["abab", "AB", "ab ab!"], vigenere_key)) == ["AB"]
+    ciphertext = vigenere_encrypt(plaintext, "LEMON")
+    for workers in (1, 2):
+        matches = dictionary_attack(ciphertext, "vigenere", str(wordlist), workers=workers,
+                                    threshold=None)
+        assert matches[0].key == "LEMON" and matches[0].plaintext == plaintext
+        assert len({match.key for match in matches}) == len(matches)
+    ciphertext = playfair_encrypt(plaintext, "Monarchy")
+    matches = dictionary_attack(ciphertext, "playfair", str(wordlist), top=10, workers=1)
+    assert matches[0].key == "MONARCHY"
+    assert matches[0].plaintext == playfair_decrypt(ciphertext, "Monarchy")
+    assert sorted(match.key for match in matches) == ["APLE", "IAM", "LEMON", "MONARCHY", "ZEBRA"]
+    with pytest.raises(ValueError):
+        dictionary_attack(ciphertext, "caesar", words)
+
+
+def test_ngram_counts_stream_merge_and_round_trip(tmp_path: Path) -> None:
+    text = "It was the best of times, it was the worst of times; José's era of wisdom"
+    whole = NgramCounts.from_text(text)
+    indices = letter_indices(text)
+    assert list(whole.letters) == [indices.count(letter) for letter in range(26)]
+    assert sum(whole.bigrams) == len(indices) - 1 and sum(whole.quadgrams) == len(indices) - 3
+    i, t, w, a = letter_indices("ITWA")
+    assert whole.quadgrams[((i * 26 + t) * 26 + w) * 26 + a] == 2
+    assert whole.bigrams[t * 26 + letter_indices("H")[0]] == 2
+    assert whole.fitness() == pytest.approx(score_indices(indices) / (len(indices) - 3))
+    streamed = count_chunks(text[i:i + 2] for i in range(0, len(text), 2))
+    merged = NgramCounts()
+    for i in range(0, len(text), 5):
+        merged.merge(NgramCounts.from_text(text[i:i + 5]))
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding="utf-8")
+    parallel = count_file(str(path), workers=2, window_size=16)
+    whole.save(str(tmp_path / "text.counts"))
+    loaded = NgramCounts.load(str(tmp_path / "text.counts"))
+    for counts in (streamed, merged, parallel, loaded):
+        assert counts.letters == whole.letters and counts.bigrams == whole.bigrams
+        assert counts.quadgrams == whole.quadgrams
+    assert whole.index_of_coincidence() > 0.05 and whole.chi_squared() < 50
+    assert NgramCounts.from_text("AB" * 200).chi_squared() > 1000
+    with pytest.raises(ValueError):
+        NgramCounts.load(str(path))
+
+
+def test_sweep_matches_per_key_calls_and_ranks_top_keys() -> None:
+    plaintext = "Meet me near the old bridge at midnight, bring the documents!"
+    for text in (plaintext, plaintext + " café", "", "A1b"):
+        sweep = SweepText(text)
+        shifts = [0, 3, -4, 29]
+        expected = [caesar_decrypt(text, shift) for shift in shifts]
+        assert list(sweep.decryptions("caesar", shifts)) == expected
+        affine_keys = [(a, b) for a in (1, 5, 25) for b in (0, 8, 25)]
+        assert list(sweep.decryptions("affine", affine_keys)) == [
+            affine_decrypt(text, a, b) for a, b in affine_keys
+        ]
+        keys = ["LEMON", "k", "SecretKey"]
+        expected = [vigenere_decrypt(text, key) for key in keys]
+        assert list(sweep.decryptions("vigenere", keys)) == expected
+        assert sweep.scores("vigenere", keys) == pytest.approx([fitness(t) for t in expected])
+    sweep = SweepText(affine_encrypt(plaintext, 7, 3))
+    assert len(all_keys("affine")) == 312
+    best = sweep.top("affine", count=2)
+    assert best[0].key == (7, 3) and best[0].plaintext == plaintext.upper()
+    assert best[0].score > best[1].score
+    sweep = SweepText(vigenere_encrypt(plaintext, "LEMON"))
+    assert sweep.top("vigenere", ["APPLE", "LEMON", "MELON"], count=1)[0].key == "LEMON"
+    with pytest.raises(AffineKeyError):
+        sweep.scores("affine", [(13, 1)])
+
+
+def test_analyze_recovers_transposition_keys() -> None:
+    plaintext = (
+        "When in the course of human events it becomes necessary for one people to "
+        "dissolve the political bands which have connected them with another"
+    )
+    ciphertext = rail_fence_encrypt(plaintext, 7)
+    assert analyze_rail_fence(ciphertext)[0].plaintext == plaintext
+    for key in ("4160352", "3816204957"):
+        ciphertext = row_transposition_encrypt(plaintext, key)
+        best = analyze_row_transposition(ciphertext, workers=1, seed=1)[0]
+        assert best.plaintext.startswith(plaintext.replace(" ", "").upper())
+
+
+def test_substitution_backends_agree() -> None:
+    texts = ["Attack at dawn, Zulu-9! [x] `y` @z {w}\n" * 300, "Ünïcode text, still shifted"]
+    try:
+        set_backend("python")
+        expected = [
+            (caesar_encrypt(t, 7), affine_encrypt(t, 5, 8), vigenere_encrypt(t, "LemOn", 3))
+            for t in texts
+        ]
+        assert vigenere_decrypt(expected[0][2], "LemOn", 3) == texts[0]
+        for name in BACKENDS:
+            set_backend(name)
+            for text, outputs in zip(texts, expected):
+                assert caesar_encrypt(text, 7) == outputs[0]
+                assert affine_encrypt(text, 5, 8) == outputs[1]
+                assert vigenere_encrypt(text, "LemOn", 3) == outputs[2]
+    finally:
+        set_backend(DEFAULT_BACKEND)
+
+
+def test_bytes_api_matches_str_api_and_works_in_place() -> None:
+    text = "Attack at Dawn, zulu-9! [ok]"
+    cases: List[Tuple[IntoFunction, IntoFunction, Callable[..., str], Callable[..., str],
+                      Tuple[Any, ...]]] = [
+        (caesar_encrypt_into, caesar_decrypt_into, caesar_encrypt, caesar_decrypt, (3,)),
+        (affine_encrypt_into, affine_decrypt_into, affine_encrypt, affine_decrypt, (5, 8)),
+        (vigenere_encrypt_into, vigenere_decrypt_into, vigenere_encrypt, vigenere_decrypt,
+         ("Lemon", 2)),
+        (rail_fence_encrypt_into, rail_fence_decrypt_into, rail_fence_encrypt,
+         rail_fence_decrypt, (4,)),
+    ]
+    for encrypt_into, decrypt_into, encrypt, decrypt, key in cases:
+        ciphertext = encrypt(text, *key)
+        dst = bytearray(len(text) + 2)
+        assert encrypt_into(memoryview(text.encode('ascii')), dst, *key) == len(text)
+        assert dst[:len(text)].decode('ascii') == ciphertext
+        buffer = bytearray(ciphertext.encode('ascii'))
+        decrypt_into(buffer, buffer, *key)
+        assert buffer.decode('ascii') == decrypt(ciphertext, *key)
+    ciphertext = row_transposition_encrypt(text, "3142")
+    dst = bytearray(len(ciphertext))
+    assert row_transposition_encrypt_into(text.encode('ascii'), dst, "3142") == len(ciphertext)
+    assert dst.decode('ascii') == ciphertext
+    row_transposition_decrypt_into(dst, dst, "3142")
+    assert dst.decode('ascii') == row_transposition_decrypt(ciphertext, "3142")
+
+
+@pytest.mark.parametrize("have_numpy", [True, False])
+def test_bytes_api_translates_in_place_with_bounded_scratch_memory(
+    have_numpy: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(translation, "HAVE_NUMPY", have_numpy and translation.HAVE_NUMPY)
+    text = "Attack at Dawn, zulu-9! [ok] " * 40_000
+    cases: List[Tuple[IntoFunction, Callable[..., str], Tuple[Any, ...]]] = [
+        (caesar_encrypt_into, caesar_encrypt, (3,)),
+        (affine_encrypt_into, affine_encrypt, (5, 8)),
+        (vigenere_encrypt_into, vigenere_encrypt, ("Lemon",)),
+    ]
+    for encrypt_into, encrypt, key in cases:
+        buffer = bytearray(text.encode('ascii'))
+        encrypt_into(buffer, buffer, *key)
+        assert buffer.decode('ascii') == encrypt(text, *key)
+        tracemalloc.start()
+        try:
+            encrypt_into(buffer, buffer, *key)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < 4 * translation.TRANSLATE_BLOCK < len(buffer) // 4
+
+
+def test_mmap_transform_matches_text_mode_across_windows(tmp_path: Path) -> None:
+    text = "Attack at dawn, hold the Bridge!\n" * 50
+    source = tmp_path / "plain.txt"
+    source.write_bytes(text.encode('ascii'))
+    target = tmp_path / "cipher.txt"
+    params = {"key": "Lemon"}
+    assert mmap_transform(str(source), str(target), "vigenere", "encrypt", params,
+                          workers=2, window_size=97) == len(text)
+    assert target.read_bytes().decode('ascii') == vigenere_encrypt(text, "Lemon")
+    mmap_transform(str(target), str(target), "vigenere", "decrypt", params,
+                   workers=1, window_size=64)
+    assert target.read_bytes().decode('ascii') == text
+    with pytest.raises(ValueError):
+        mmap_transform(str(source), str(target), "railfence", "encrypt", {"rails": 3})
+    assert set(cli.MAPPED_CIPHER_NAMES) == set(MAPPED_CIPHERS)
+    for argv in (["caesar", "encrypt", "--shift", "3", "--message", "x", "--workers", "2"],
+                 ["railfence", "encrypt", "--rails", "3", "--input", str(source),
+                  "--output", str(target), "--mmap", "--window-size", "64"]):
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main(argv)
+        assert excinfo.value.code == 2
+
+
+def test_service_answers_pipelined_requests_in_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(service, "MAX_LINE", 1000)
+    path = str(tmp_path / "ciphers.sock")
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    server = asyncio.run_coroutine_threadsafe(serve(path, workers=1), loop)
+    try:
+        while not os.path.exists(path):
+            time.sleep(0.01)
+        with CipherClient(path) as client:
+            assert client.request("caesar", "encrypt", "Hello", shift=3) == "Khoor"
+            texts = [f"message {i}" for i in range(200)]
+            results = list(client.transform_many("vigenere", "encrypt", texts, key="KEY"))
+            assert results == [vigenere_encrypt(text, "KEY") for text in texts]
+            with pytest.raises(ValueError):
+                client.request("caesar", "encrypt", "Hello")
+            assert client.stats()["hits"] > 0
+            # An oversized line gets one error however it is split up, and the
+            # next request its own answer
+            line = b'{"cipher": "caesar", "action": "encrypt", "text": "' + b"x" * 20_000
+            for start in range(0, len(line), 5000):
+                client.sock.sendall(line[start:start + 5000])
+                time.sleep(0.02)
+            client.sock.sendall(b'"}\n')
+            with pytest.raises(ValueError, match="longer than"):
+                client._receive()
+            assert client.request("caesar", "encrypt", "Hello", shift=3) == "Khoor"
+    finally:
+        # Let the cancelled server close its connections and worker pool
+        # before the loop stops
+        async def drain() -> None:
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        server.cancel()
+        asyncio.run_coroutine_threadsafe(drain(), loop).result(timeout=30)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
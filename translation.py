@@ -0,0 +1,131 @@
+"""
+Cached translation tables for the mod-26 substitution ciphers.
+
+Caesar and Affine both map every letter through a fixed function of its
+position in the alphabet, so a whole message can be transformed with a single
+``str.translate`` (or ``bytes.translate`` for ASCII input) instead of building
+the result one character at a time.
+
+The same tables drive the bytes API: ``translate_into`` maps ASCII bytes from
+any bytes-like source into a caller-supplied buffer, in place if the two are
+the same. It works through blocks of TRANSLATE_BLOCK bytes, so the scratch
+memory stays the same whatever the buffer size: ``bytes.translate`` for
+contiguous bytes, and ``np.take(..., out=...)`` for the strided slices
+Vigenère uses when NumPy is installed.
+"""
+
+from typing import Dict, Union
+
+from instrumentation import timed
+from keycache import prepared_key
+from optional_deps import HAVE_NUMPY
+from optional_deps import numpy as np
+
+# Anything exposing the buffer protocol with one byte per item
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Bytes translated at a time by translate_into. np.take converts its indices
+# to 8-byte integers, so the NumPy path takes an eighth as many per block.
+TRANSLATE_BLOCK = 64 * 1024
+
+
+class TranslationTable(Dict[int, int]):
+    """
+    ``str.translate`` table for the letter map x -> (multiplier * x + offset) mod 26.
+
+    ASCII code points are filled in up front. Any other code point is resolved
+    on first use with the same formula the per-character implementations used,
+    so non-ASCII letters are handled exactly as before.
+    """
+
+    def __init__(self, multiplier: int, offset: int, fold_case: bool) -> None:
+        super().__init__()
+        self.multiplier = multiplier
+        self.offset = offset
+        # Affine upper-cases its input, so every letter is measured from 'A'
+        self.fold_case = fold_case
+        for code in range(128):
+            self[code] = self._map(code)
+        self.ascii_table = bytes(self[code] for code in range(128)) + bytes(range(128, 256))
+        # The bytes API has no separate upper-casing pass, so a case-folding
+        # table maps lower-case bytes the way it maps their upper-case forms
+        self.byte_table = bytes(
+            self.ascii_table[code - 32 if fold_case and 97 <= code <= 122 else code]
+            for code in range(256)
+        )
+
+    def _map(self, code: int) -> int:
+        char = chr(code)
+        if not char.isalpha():
+            return code
+        start = ord('A') if self.fold_case or not char.islower() else ord('a')
+        return (self.multiplier * (code - start) + self.offset) % 26 + start
+
+    def __missing__(self, code: int) -> int:
+        value = self._map(code)
+        self[code] = value
+        return value
+
+    def translate(self, text: str) -> str:
+        """
+        Applies the table to a whole string in one pass.
+        """
+        if text.isascii():
+            return text.encode('ascii').translate(self.ascii_table).decode('ascii')
+        return text.translate(self)
+
+
+@timed("key_setup", "caesar")
+def caesar_table(shift: int) -> TranslationTable:
+    """
+    Returns the cached, case-preserving table for a Caesar shift.
+    """
+    shift %= 26
+    return prepared_key("caesar", shift, lambda: TranslationTable(1, shift, False))
+
+
+@timed("key_setup", "affine")
+def affine_table(key_a: int, key_b: int) -> TranslationTable:
+    """
+    Returns the cached table for (a * P + b) mod 26 over upper-cased text.
+    """
+    key = (key_a % 26, key_b % 26)
+    return prepared_key("affine", key, lambda: TranslationTable(key[0], key[1], True))
+
+
+def output_length(src: Buffer, dst: Buffer, length: int = -1) -> int:
+    """
+    Checks that dst can hold `length` bytes (default len(src)) and returns it.
+    """
+    if length < 0:
+        length = memoryview(src).nbytes
+    if memoryview(dst).readonly:
+        raise TypeError("Output buffer must be writable (bytearray or writable memoryview).")
+    if memoryview(dst).nbytes < length:
+        raise ValueError(f"Output buffer too small: need {length} bytes.")
+    return length
+
+
+def translate_into(
+    table: bytes, src: Buffer, dst: Buffer, start: int = 0, step: int = 1
+) -> int:
+    """
+    Writes table[src[i]] to dst[i] for i in range(start, len(src), step) and
+    returns len(src). dst may be src itself.
+    """
+    length = output_length(src, dst)
+    if HAVE_NUMPY and step > 1:
+        # Strided memoryview copies are slow; gather the slice in NumPy
+        lookup = np.frombuffer(table, dtype=np.uint8)
+        source = np.frombuffer(src, dtype=np.uint8)[start:length:step]
+        target = np.frombuffer(dst, dtype=np.uint8)[start:length:step]
+        block = TRANSLATE_BLOCK // 8
+        for i in range(0, len(source), block):
+            np.take(lookup, source[i:i + block], out=target[i:i + block], mode='clip')
+    else:
+        source_view = memoryview(src).cast('B')[start:length:step]
+        target_view = memoryview(dst).cast('B')[start:length:step]
+        for i in range(0, len(source_view), TRANSLATE_BLOCK):
+            block_end = i + TRANSLATE_BLOCK
+            target_view[i:block_end] = source_view[i:block_end].tobytes().translate(table)
+    return length
@@ -0,0 +1,251 @@
+"""
+Ciphertext-only key search for the Rail Fence and Row Transposition ciphers.
+
+Rail Fence is solved by trying every rail count. Row Transposition is solved
+for each number of columns that divides the ciphertext: the ciphertext is
+then the columns one after another, and a key is an order to lay them side
+by side. Orders are first ranked by a cheap bigram score over the first rows
+(computed from a column adjacency matrix, so a whole order costs one add per
+column), searched exhaustively up to EXHAUSTIVE_COLUMNS columns and by
+hill-climbing (moving runs of columns) above that. The best orders are then rescored with quadgram
+fitness, each decrypting a sample with one gather through a precomputed
+index array.
+"""
+
+import heapq
+import itertools
+import random
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from analysis import Candidate
+from fitness import bigram_table, letter_indices, score_indices
+from permutation import gather, zeros
+from RailFenceCipher import rail_fence_decrypt, zigzag_inverse_prefix
+from RowTranspositionCipher import row_transposition_decrypt
+
+MAX_RAILS = 50
+
+# Keys are strings of distinct digits, so at most 10 columns
+MAX_COLUMNS = 10
+EXHAUSTIVE_COLUMNS = 9
+CLIMB_RESTARTS = 32
+
+# Characters (Rail Fence) or rows (Row Transposition) used for the bigram
+# pre-score, and for the quadgram rescoring of the candidates that survive it
+PRUNE_LETTERS = 200
+PRUNE_ROWS = 40
+SAMPLE_LETTERS = 2000
+SAMPLE_ROWS = 400
+
+# Candidates (rail counts, or orders per column count) rescored with quadgrams
+KEEP = 50
+
+# Upper-cased ASCII byte -> letter index 0-25, or 26 for anything else
+_PAIR_CODES = bytes(
+    code - ord('A') if ord('A') <= code <= ord('Z') else 26 for code in range(256)
+)
+
+Order = Tuple[int, ...]
+
+
+@lru_cache(maxsize=None)
+def _pair_scores() -> "array[float]":
+    # Bigram scores indexed by a*27 + b; pairs with a non-letter get the
+    # mean score so they neither help nor hurt an order
+    table = bigram_table()
+    neutral = sum(table) / len(table)
+    return array('d', (
+        table[a * 26 + b] if a < 26 and b < 26 else neutral
+        for a in range(27) for b in range(27)
+    ))
+
+
+def _pair_codes(text: str) -> bytes:
+    return text.encode('ascii', 'replace').upper().translate(_PAIR_CODES)
+
+
+def _quadgram_score(text: str) -> float:
+    indices = letter_indices(text)
+    return score_indices(indices) / max(len(indices) - 3, 1)
+
+
+def _bigram_score(text: str) -> float:
+    codes = _pair_codes(text)
+    scores = _pair_scores()
+    return sum(scores[a * 27 + b] for a, b in zip(codes, codes[1:])) / max(len(codes) - 1, 1)
+
+
+def analyze_rail_fence(
+    ciphertext: str, top: int = 5, max_rails: int = MAX_RAILS
+) -> List[Candidate]:
+    """
+    Ranks rail counts for a Rail Fence ciphertext and returns the best `top`
+    candidates with their decryptions, best first.
+
+    Only the first PRUNE_LETTERS plaintext characters of each rail count are
+    gathered (through indices computed in closed form, never the whole
+    permutation) and bigram scored; the best KEEP are rescored with quadgram
+    fitness over SAMPLE_LETTERS characters, and only the `top` results are
+    fully decrypted.
+    """
+    length = len(ciphertext)
+    rails = range(2, min(max_rails, length - 1) + 1)
+
+    def sample(r: int, count: int) -> str:
+        return gather(ciphertext, zigzag_inverse_prefix(length, r, count))
+
+    survivors = heapq.nlargest(KEEP, rails, key=lambda r: _bigram_score(sample(r, PRUNE_LETTERS)))
+    scored = sorted(
+        ((_quadgram_score(sample(r, SAMPLE_LETTERS)), r) for r in survivors),
+        key=lambda item: (-item[0], item[1]),
+    )
+    return [
+        Candidate(score, "railfence", (r,), rail_fence_decrypt(ciphertext, r))
+        for score, r in scored[:top]
+    ]
+
+
+def adjacency(ciphertext: str, num_cols: int) -> List[List[float]]:
+    """
+    For a ciphertext read out in num_cols equal columns, returns the summed
+    bigram score of column a followed by column b over the first PRUNE_ROWS
+    rows, for every pair (a, b).
+    """
+    rows = len(ciphertext) // num_cols
+    sample = min(rows, PRUNE_ROWS)
+    codes = [_pair_codes(ciphertext[k * rows:k * rows + sample]) for k in range(num_cols)]
+    scores = _pair_scores()
+    return [
+        [sum(scores[x * 27 + y] for x, y in zip(codes[a], codes[b])) for b in range(num_cols)]
+        for a in range(num_cols)
+    ]
+
+
+def order_score(adj: Sequence[Sequence[float]], order: Sequence[int]) -> float:
+    """
+    Bigram score of the columns laid out in this order.
+    """
+    return sum(adj[a][b] for a, b in zip(order, order[1:]))
+
+
+def rank_orders(adj: List[List[float]], first: int, keep: int = KEEP) -> List[Tuple[float, Order]]:
+    """
+    Scores every order that starts with column `first` and returns the best
+    `keep` as (score, order).
+    """
+    rest = [k for k in range(len(adj)) if k != first]
+    return heapq.nlargest(keep, (
+        (order_score(adj, order), order)
+        for order in ((first, *tail) for tail in itertools.permutations(rest))
+    ))
+
+
+def climb_orders(
+    adj: List[List[float]], seed: Optional[int], keep: int = KEEP
+) -> List[Tuple[float, Order]]:
+    """
+    Hill-climbs from a random order by moving a run of adjacent columns to
+    another place, taking the best move until none improves. Returns the
+    local optimum and its best `keep` neighbours, since with few rows the
+    bigram optimum can sit a move away from the order quadgrams prefer.
+    """
+    rng = random.Random(seed)
+    order = list(range(len(adj)))
+    rng.shuffle(order)
+    best = order_score(adj, order)
+    while True:
+        moves = []
+        for i, j in itertools.combinations(range(len(order) + 1), 2):
+            block, rest = order[i:j], order[:i] + order[j:]
+            for k in range(len(rest) + 1):
+                if k != i:
+                    candidate = rest[:k] + block + rest[k:]
+                    moves.append((order_score(adj, candidate), tuple(candidate)))
+        score, best_move = max(moves)
+        if score <= best:
+            return [(best, tuple(order))] + heapq.nlargest(keep, moves)
+        best, order = score, list(best_move)
+
+
+@lru_cache(maxsize=MAX_COLUMNS)
+def _grid_permutation(rows: int, num_cols: int) -> "array[int]":
+    # Columns of `rows` characters placed one after another -> row-major text
+    perm = zeros(rows * num_cols)
+    for c in range(num_cols):
+        perm[c::num_cols] = array('q', range(c * rows, (c + 1) * rows))
+    return perm
+
+
+def key_for_order(order: Sequence[int]) -> Tuple[int, ...]:
+    """
+    Returns the key digits that read the columns in this layout order:
+    column c is read order[c]-th. Keys of up to 9 columns count from 1.
+    """
+    base = 0 if len(order) > 9 else 1
+    return tuple(k + base for k in order)
+
+
+def analyze_row_transposition(
+    ciphertext: str,
+    top: int = 5,
+    max_columns: int = MAX_COLUMNS,
+    workers: Optional[int] = None,
+    restarts: int = CLIMB_RESTARTS,
+    seed: Optional[int] = None,
+) -> List[Candidate]:
+    """
+    Ranks Row Transposition keys for a ciphertext and returns the best `top`
+    candidates with their decryptions, best first.
+
+    Column counts from 2 to max_columns that divide the ciphertext length
+    are tried (row_transposition_encrypt always pads to a full grid). Orders
+    are ranked in worker processes, one task per leading column or climb
+    restart; workers=None uses one process per CPU and workers=1 runs inline.
+    """
+    if max_columns > MAX_COLUMNS:
+        raise ValueError(f"Row Transposition keys have at most {MAX_COLUMNS} columns.")
+    length = len(ciphertext)
+    widths = [n for n in range(2, max_columns + 1) if length % n == 0 and length // n > 1]
+    adjacencies = {n: adjacency(ciphertext, n) for n in widths}
+    tasks: List[Tuple[int, Callable[..., List[Tuple[float, Order]]], Tuple[Any, ...]]] = []
+    for n, adj in adjacencies.items():
+        if n <= EXHAUSTIVE_COLUMNS:
+            tasks += [(n, rank_orders, (adj, first)) for first in range(n)]
+        else:
+            tasks += [
+                (n, climb_orders, (adj, None if seed is None else seed + restart))
+                for restart in range(restarts)
+            ]
+    ranked: Dict[int, List[Tuple[float, Order]]] = {n: [] for n in widths}
+
+    if workers == 1:
+        for n, func, args in tasks:
+            ranked[n].extend(func(*args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(func, *args): n for n, func, args in tasks}
+            pending: Set[Future[List[Tuple[float, Order]]]] = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ranked[futures[future]].extend(future.result())
+
+    scored: List[Tuple[float, Order]] = []
+    for n, orders in ranked.items():
+        rows = length // n
+        sample = min(rows, SAMPLE_ROWS)
+        columns = [ciphertext[k * rows:k * rows + sample] for k in range(n)]
+        perm = _grid_permutation(sample, n)
+        for _, order in heapq.nlargest(KEEP, set(orders)):
+            text = gather("".join([columns[k] for k in order]), perm)
+            scored.append((_quadgram_score(text), order))
+    scored.sort(key=lambda item: (-item[0], len(item[1]), item[1]))
+    results = []
+    for score, order in scored[:top]:
+        key = key_for_order(order)
+        plaintext = row_transposition_decrypt(ciphertext, "".join(map(str, key)))
+        results.append(Candidate(score, "rowtrans", key, plaintext))
+    return results
@@ -0,0 +1,151 @@
+"""
+Ciphertext-only key recovery for the Vigenère cipher.
+
+VigenereCipher advances the key on every character, letters or not, so the
+analysis works on character positions: the letter at position i was shifted
+by key[i % key_length]. The key length is estimated from the average index
+of coincidence of each column, combined with Kasiski repeat-distance votes,
+and each column's shift is then solved by chi-squared matching against
+English letter frequencies. The recovered key can be passed straight to
+vigenere_decrypt.
+"""
+
+from typing import Dict, List, NamedTuple
+
+from fitness import ENGLISH_IOC, ENGLISH_LETTER_FREQUENCIES, RANDOM_IOC
+from optional_deps import HAVE_NUMPY
+from optional_deps import numpy as np
+
+MAX_KEY_LENGTH = 20
+
+# Characters examined when estimating the key length; the columns are then
+# solved over the whole text
+LENGTH_SAMPLE = 200_000
+KASISKI_SAMPLE = 50_000
+
+# Upper-cased ASCII byte -> letter index 0-25, or 255 for anything else
+_POSITION_CODES = bytes(
+    code - ord('A') if ord('A') <= code <= ord('Z') else 255 for code in range(256)
+)
+
+
+class VigenereSolution(NamedTuple):
+    key: str
+    key_length: int
+    ioc: float
+
+
+def position_codes(text: str) -> bytes:
+    """
+    Maps every character to one byte: its letter index 0-25, or 255.
+    """
+    return text.encode('ascii', 'replace').upper().translate(_POSITION_CODES)
+
+
+def column_counts(codes: bytes, key_length: int) -> List[List[int]]:
+    """
+    Counts each letter in each key column in one pass over the text.
+    """
+    if HAVE_NUMPY:
+        array = np.frombuffer(codes, dtype=np.uint8)
+        positions = np.flatnonzero(array < 26)
+        bins = (positions % key_length) * 26 + array[positions]
+        counts = np.bincount(bins, minlength=key_length * 26).reshape(key_length, 26)
+        return [[int(n) for n in row] for row in counts]
+    return [
+        [column.count(letter) for letter in range(26)]
+        for column in (codes[j::key_length] for j in range(key_length))
+    ]
+
+
+def index_of_coincidence(counts: List[int]) -> float:
+    """
+    Probability that two letters drawn from these counts are the same.
+    """
+    total = sum(counts)
+    if total < 2:
+        return 0.0
+    return sum(n * (n - 1) for n in counts) / (total * (total - 1))
+
+
+def kasiski_votes(codes: bytes, max_length: int = MAX_KEY_LENGTH) -> Dict[int, int]:
+    """
+    Counts, for each candidate key length, how many distances between
+    repeated letter trigrams it divides.
+    """
+    votes = {length: 0 for length in range(2, max_length + 1)}
+    last_seen: Dict[bytes, int] = {}
+    for i in range(len(codes) - 2):
+        trigram = codes[i:i + 3]
+        if 255 in trigram:
+            continue
+        previous = last_seen.get(trigram)
+        last_seen[trigram] = i
+        if previous is not None:
+            distance = i - previous
+            for length in votes:
+                if distance % length == 0:
+                    votes[length] += 1
+    return votes
+
+
+def rank_key_lengths(ciphertext: str, max_length: int = MAX_KEY_LENGTH) -> List[int]:
+    """
+    Returns candidate key lengths, most likely first.
+
+    Each length is scored by how close its average column IoC is to English
+    (0 = random, 1 = English) plus half its share of Kasiski votes. Multiples
+    of the true length score about as well as the length itself, so the
+    shortest length within the top 10% of the score range is ranked first.
+    Lengths are capped so each column has at least two letters; a text
+    without letters raises ValueError.
+    """
+    if max_length < 1:
+        raise ValueError("Maximum key length must be >= 1.")
+    codes = position_codes(ciphertext[:LENGTH_SAMPLE])
+    letters = len(codes) - codes.count(255)
+    if letters == 0:
+        raise ValueError("Ciphertext has no letters to analyze.")
+    max_length = min(max_length, max(letters // 2, 1))
+    votes = kasiski_votes(codes[:KASISKI_SAMPLE], max_length)
+    total_votes = max(votes.values(), default=0) or 1
+    scores: Dict[int, float] = {}
+    for length in range(1, max_length + 1):
+        columns = column_counts(codes, length)
+        ioc = sum(index_of_coincidence(column) for column in columns) / length
+        closeness = (ioc - RANDOM_IOC) / (ENGLISH_IOC - RANDOM_IOC)
+        scores[length] = closeness + 0.5 * votes.get(length, 0) / total_votes
+    best = max(scores.values())
+    cutoff = best - 0.1 * (best - min(scores.values()))
+    shortest = min(length for length, score in scores.items() if score >= cutoff)
+    others = sorted((length for length in scores if length != shortest), key=scores.__getitem__)
+    return [shortest] + others[::-1]
+
+
+def solve_shift(counts: List[int]) -> int:
+    """
+    Returns the shift whose decryption of a column best fits English letter
+    frequencies (lowest chi-squared).
+    """
+    total = sum(counts) or 1
+    best_shift, best_chi = 0, float("inf")
+    for shift in range(26):
+        chi = 0.0
+        for letter, frequency in enumerate(ENGLISH_LETTER_FREQUENCIES):
+            expected = frequency * total
+            observed = counts[(letter + shift) % 26]
+            chi += (observed - expected) ** 2 / expected
+        if chi < best_chi:
+            best_shift, best_chi = shift, chi
+    return best_shift
+
+
+def recover_key(ciphertext: str, max_length: int = MAX_KEY_LENGTH) -> VigenereSolution:
+    """
+    Recovers the most likely upper-case key for a Vigenère ciphertext.
+    """
+    key_length = rank_key_lengths(ciphertext, max_length)[0]
+    columns = column_counts(position_codes(ciphertext), key_length)
+    key = "".join(chr(solve_shift(column) + ord('A')) for column in columns)
+    ioc = sum(index_of_coincidence(column) for column in columns) / key_length
+    return VigenereSolution(key, key_length, ioc)